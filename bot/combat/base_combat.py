@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Protocol
+from functools import wraps
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Protocol
 
 from ares.managers.manager_mediator import ManagerMediator
 from sc2.unit import Unit
@@ -8,6 +10,27 @@ if TYPE_CHECKING:
     from ares import AresBot
 
 
+def profile_execute(execute: Callable) -> Callable:
+    """Report `execute` timings to the bot's step profiler when it is enabled.
+
+    The subsystem name is the combat class name, so every squad handled by
+    the same class in one frame is summed together.
+    """
+
+    @wraps(execute)
+    def wrapper(self, units, **kwargs) -> None:
+        profiler = self.ai.step_profiler
+        if not profiler.enabled:
+            return execute(self, units, **kwargs)
+        start: float = perf_counter()
+        try:
+            return execute(self, units, **kwargs)
+        finally:
+            profiler.add(type(self).__name__, perf_counter() - start)
+
+    return wrapper
+
+
 class BaseCombat(Protocol):
     """Basic interface that all combat classes should follow.
 
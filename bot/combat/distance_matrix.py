@@ -0,0 +1,195 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+from sc2.unit import Unit
+from sc2.units import Units
+
+from bot.combat.enemy_columns import EnemyColumns
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# own units x enemies above which rows are worked out per unit on demand
+MAX_DENSE_PAIRS: int = 250_000
+
+
+@dataclass
+class EnemyGroup:
+    """A set of enemies distances are asked against, built once per use site.
+
+    `indices` are rows of the enemy snapshot, -1 for a unit that isn't in it.
+    """
+
+    units: list[Unit]
+    indices: np.ndarray
+    positions: np.ndarray
+    radii: np.ndarray
+    all_indexed: bool
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+
+class DistanceMatrix:
+    """Squared distances between our units and every enemy, once per frame.
+
+    Rows are our units (`ai.units`), columns the enemies in
+    `ai.enemy_snapshot`. The whole matrix is one NumPy expression the first
+    time it's needed in a frame, or, past `MAX_DENSE_PAIRS`, one row per
+    unit that asks. Combat code turns the enemies it cares about into an
+    `EnemyGroup` once, then asks per unit for enemies within a range, the
+    closest enemy or a count, instead of looping over distances in Python.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self._game_loop: int = -1
+        self._own_positions: np.ndarray = np.empty((0, 2))
+        self._own_units: list[Unit] = []
+        self._own_tag_to_index: dict[int, int] = dict()
+        self._matrix: Optional[np.ndarray] = None
+        self._rows: dict[int, np.ndarray] = dict()
+
+    def group(self, enemies: Union[Units, list[Unit]]) -> EnemyGroup:
+        """Prepare `enemies` for distance queries."""
+        self._refresh()
+        tag_to_index: dict[int, int] = self.ai.enemy_snapshot.tag_to_index
+        indices: np.ndarray = np.array(
+            [tag_to_index.get(u.tag, -1) for u in enemies], dtype=np.int64
+        )
+        return self._make_group(list(enemies), indices)
+
+    def group_from_mask(self, mask: np.ndarray) -> EnemyGroup:
+        """Enemies where boolean `mask` over `enemy_snapshot.columns` is True."""
+        self._refresh()
+        columns: EnemyColumns = self.ai.enemy_snapshot.columns
+        return self._make_group(columns.select(mask), np.flatnonzero(mask))
+
+    def distances_sq(self, unit: Unit, group: EnemyGroup) -> np.ndarray:
+        """Squared distance from `unit` to every unit in `group`, in order."""
+        if len(group) == 0:
+            return np.empty(0)
+        row: Optional[np.ndarray] = self._row(unit) if group.all_indexed else None
+        if row is not None:
+            return row[group.indices]
+        return np.sum((group.positions - unit.position_tuple) ** 2, axis=1)
+
+    def within(
+        self,
+        unit: Unit,
+        group: EnemyGroup,
+        distance: float,
+        add_radii: bool = False,
+    ) -> list[Unit]:
+        """Units of `group` closer than `distance` to `unit`.
+
+        With `add_radii`, each enemy's radius is added to `distance`, pass
+        `unit.radius` in `distance` to measure edge to edge.
+        """
+        return [group.units[i] for i in self._within(unit, group, distance, add_radii)]
+
+    def count_within(
+        self,
+        unit: Unit,
+        group: EnemyGroup,
+        distance: float,
+        add_radii: bool = False,
+    ) -> int:
+        return len(self._within(unit, group, distance, add_radii))
+
+    def any_within(self, unit: Unit, group: EnemyGroup, distance: float) -> bool:
+        return bool(np.any(self.distances_sq(unit, group) < distance**2))
+
+    def closest(self, unit: Unit, group: EnemyGroup) -> Optional[Unit]:
+        if len(group) == 0:
+            return None
+        return group.units[int(np.argmin(self.distances_sq(unit, group)))]
+
+    def block(self, units: Union[Units, list[Unit]], group: EnemyGroup) -> np.ndarray:
+        """Squared distances, a row per unit in `units`, a column per enemy."""
+        positions: np.ndarray = np.array(
+            [u.position_tuple for u in units], dtype=float
+        ).reshape(-1, 2)
+        deltas: np.ndarray = (
+            positions[:, np.newaxis, :] - group.positions[np.newaxis, :, :]
+        )
+        return np.einsum("ijk,ijk->ij", deltas, deltas)
+
+    def own_within(self, unit: Unit, distance: float) -> list[Unit]:
+        """Our other units closer than `distance` to `unit`."""
+        return [
+            u for u in self.own_near(unit.position_tuple, distance) if u.tag != unit.tag
+        ]
+
+    def own_near(self, position: tuple[float, float], distance: float) -> list[Unit]:
+        """Our units closer than `distance` to `position`."""
+        self._refresh()
+        if len(self._own_units) == 0:
+            return []
+        distances: np.ndarray = np.sum((self._own_positions - position) ** 2, axis=1)
+        return [self._own_units[i] for i in np.flatnonzero(distances < distance**2)]
+
+    def _within(
+        self, unit: Unit, group: EnemyGroup, distance: float, add_radii: bool
+    ) -> np.ndarray:
+        distances: np.ndarray = self.distances_sq(unit, group)
+        limit: Union[float, np.ndarray] = (
+            (distance + group.radii) ** 2 if add_radii else distance**2
+        )
+        return np.flatnonzero(distances < limit)
+
+    def _make_group(self, units: list[Unit], indices: np.ndarray) -> EnemyGroup:
+        all_indexed: bool = bool(np.all(indices >= 0))
+        if all_indexed and len(indices) > 0:
+            positions: np.ndarray = self.ai.enemy_snapshot.columns.positions[indices]
+        else:
+            positions = np.array([u.position_tuple for u in units]).reshape(-1, 2)
+        return EnemyGroup(
+            units=units,
+            indices=indices,
+            positions=positions,
+            radii=np.array([u.radius for u in units]),
+            all_indexed=all_indexed,
+        )
+
+    def _row(self, unit: Unit) -> Optional[np.ndarray]:
+        self._refresh()
+        own_index: Optional[int] = self._own_tag_to_index.get(unit.tag, None)
+        if own_index is None:
+            return None
+
+        enemy_positions: np.ndarray = self.ai.enemy_snapshot.columns.positions
+        if len(self._own_units) * len(enemy_positions) <= MAX_DENSE_PAIRS:
+            if self._matrix is None:
+                deltas: np.ndarray = (
+                    self._own_positions[:, np.newaxis, :]
+                    - enemy_positions[np.newaxis, :, :]
+                )
+                self._matrix = np.einsum("ijk,ijk->ij", deltas, deltas)
+            return self._matrix[own_index]
+
+        if (row := self._rows.get(own_index, None)) is None:
+            row = np.sum(
+                (enemy_positions - self._own_positions[own_index]) ** 2, axis=1
+            )
+            self._rows[own_index] = row
+        return row
+
+    def _refresh(self) -> None:
+        game_loop: int = self.ai.state.game_loop
+        if game_loop == self._game_loop:
+            return
+        self._game_loop = game_loop
+        self._own_units = list(self.ai.units)
+        self._own_positions = np.array(
+            [u.position_tuple for u in self._own_units], dtype=float
+        ).reshape(-1, 2)
+        self._own_tag_to_index = {u.tag: i for i, u in enumerate(self._own_units)}
+        self._matrix = None
+        self._rows.clear()
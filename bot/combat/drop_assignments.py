@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Union
+
+from sc2.position import Point2
+from sc2.unit import Unit
+from sc2.units import Units
+
+
+@dataclass(slots=True)
+class DropAssignment:
+    """One medivac, the units it drops and where it is taking them."""
+
+    medivac_tag: int
+    cargo_tags: set[int]
+    target: Point2
+    healing: bool = False
+
+
+@dataclass
+class DropAssignments:
+    """Medivac to cargo assignments, indexed both ways.
+
+    Openings running drops own one of these and hand it to the drop
+    combat classes. Every change goes through `assign`, `remove` and
+    `on_unit_destroyed`, which keep the cargo to medivac index in step, so
+    "is this unit part of a drop" and "whose drop is it" are a dict lookup
+    instead of a scan over every assignment.
+    """
+
+    _by_medivac: dict[int, DropAssignment] = field(default_factory=dict)
+    _cargo_to_medivac: dict[int, int] = field(default_factory=dict)
+
+    def __contains__(self, medivac_tag: int) -> bool:
+        return medivac_tag in self._by_medivac
+
+    def __iter__(self) -> Iterator[DropAssignment]:
+        return iter(list(self._by_medivac.values()))
+
+    def __len__(self) -> int:
+        return len(self._by_medivac)
+
+    def assign(
+        self, medivac_tag: int, cargo_tags: set[int], target: Point2
+    ) -> DropAssignment:
+        """Start a drop, replacing whatever `medivac_tag` was doing before."""
+        self.remove(medivac_tag)
+        assignment: DropAssignment = DropAssignment(
+            medivac_tag=medivac_tag, cargo_tags=set(cargo_tags), target=target
+        )
+        self._by_medivac[medivac_tag] = assignment
+        for tag in assignment.cargo_tags:
+            self._cargo_to_medivac[tag] = medivac_tag
+        return assignment
+
+    def remove(self, medivac_tag: int) -> Optional[DropAssignment]:
+        assignment: Optional[DropAssignment] = self._by_medivac.pop(medivac_tag, None)
+        if assignment:
+            for tag in assignment.cargo_tags:
+                self._cargo_to_medivac.pop(tag, None)
+        return assignment
+
+    def get(self, medivac_tag: int) -> Optional[DropAssignment]:
+        return self._by_medivac.get(medivac_tag, None)
+
+    def medivac_of(self, cargo_tag: int) -> Optional[int]:
+        return self._cargo_to_medivac.get(cargo_tag, None)
+
+    def is_cargo(self, tag: int) -> bool:
+        """Is `tag` assigned to any drop?"""
+        return tag in self._cargo_to_medivac
+
+    def cargo_by_medivac(
+        self, units: Union[Units, list[Unit]]
+    ) -> dict[int, list[Unit]]:
+        """`units` that belong to a drop, grouped by the medivac's tag."""
+        by_medivac: dict[int, list[Unit]] = {tag: [] for tag in self._by_medivac}
+        for unit in units:
+            if (medivac_tag := self._cargo_to_medivac.get(unit.tag, None)) is not None:
+                by_medivac[medivac_tag].append(unit)
+        return by_medivac
+
+    def on_unit_destroyed(self, unit_tag: int) -> None:
+        """A medivac dying ends its drop, dead cargo is just dropped."""
+        if unit_tag in self._by_medivac:
+            self.remove(unit_tag)
+        elif (medivac_tag := self._cargo_to_medivac.pop(unit_tag, None)) is not None:
+            self._by_medivac[medivac_tag].cargo_tags.discard(unit_tag)
@@ -0,0 +1,103 @@
+from typing import Iterable, Union
+
+import numpy as np
+from ares.consts import ALL_STRUCTURES
+from sc2.ids.unit_typeid import UnitTypeId as UnitID
+from sc2.unit import Unit
+from sc2.units import Units
+
+from bot.consts import COMMON_UNIT_IGNORE_TYPES
+
+
+def type_id_array(type_ids: Iterable[UnitID]) -> np.ndarray:
+    """Type ids as an integer array, for use with `np.isin`."""
+    return np.array([type_id.value for type_id in type_ids], dtype=np.int32)
+
+
+COMMON_UNIT_IGNORE_IDS: np.ndarray = type_id_array(COMMON_UNIT_IGNORE_TYPES)
+ALL_STRUCTURE_IDS: np.ndarray = type_id_array(ALL_STRUCTURES)
+
+
+class EnemyColumns:
+    """Column-oriented view of a group of enemy units.
+
+    Every unit is read once on construction, after which filters are
+    boolean masks over the columns instead of per-unit Python checks.
+
+    Parameters
+    ----------
+    units : Union[Units, list[Unit]]
+        The enemy units, usually the result of a `get_units_in_range` query.
+
+    Attributes
+    ----------
+    positions : np.ndarray
+        (n, 2) float array of unit positions.
+    type_ids : np.ndarray
+        Integer `UnitTypeId` values.
+    is_flying : np.ndarray
+        Boolean column of `unit.is_flying`.
+    is_memory : np.ndarray
+        Boolean column of `unit.is_memory`.
+    is_structure : np.ndarray
+        True where the type is in `ALL_STRUCTURES`.
+    is_ignored : np.ndarray
+        True where the type is in `COMMON_UNIT_IGNORE_TYPES`.
+    is_valid : np.ndarray
+        True where the unit is worth targeting: not cloaked unless revealed,
+        not burrowed unless visible, not a memory or snapshot and not
+        ignored.
+    """
+
+    def __init__(self, units: Union[Units, list[Unit]]):
+        self.units: list[Unit] = list(units)
+        num_units: int = len(self.units)
+
+        self.positions: np.ndarray = np.empty((num_units, 2), dtype=np.float64)
+        self.type_ids: np.ndarray = np.empty(num_units, dtype=np.int32)
+        self.is_flying: np.ndarray = np.empty(num_units, dtype=bool)
+        self.is_memory: np.ndarray = np.empty(num_units, dtype=bool)
+        # units that fail the cloak / burrow / memory / snapshot checks
+        hidden: np.ndarray = np.empty(num_units, dtype=bool)
+        for i, unit in enumerate(self.units):
+            self.positions[i] = unit.position_tuple
+            self.type_ids[i] = unit.type_id.value
+            self.is_flying[i] = unit.is_flying
+            self.is_memory[i] = unit.is_memory
+            hidden[i] = (
+                (unit.is_cloaked and not unit.is_revealed)
+                or (unit.is_burrowed and not unit.is_visible)
+                or self.is_memory[i]
+                or unit.is_snapshot
+            )
+
+        self.is_structure: np.ndarray = np.isin(self.type_ids, ALL_STRUCTURE_IDS)
+        self.is_ignored: np.ndarray = np.isin(self.type_ids, COMMON_UNIT_IGNORE_IDS)
+        self.is_valid: np.ndarray = ~hidden & ~self.is_ignored
+
+    def take(self, indices: np.ndarray) -> "EnemyColumns":
+        """Rows `indices` as new columns, without reading the units again."""
+        columns: EnemyColumns = EnemyColumns.__new__(EnemyColumns)
+        columns.units = [self.units[i] for i in indices]
+        for name in (
+            "positions",
+            "type_ids",
+            "is_flying",
+            "is_memory",
+            "is_structure",
+            "is_ignored",
+            "is_valid",
+        ):
+            setattr(columns, name, getattr(self, name)[indices])
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def of_type(self, type_ids: np.ndarray) -> np.ndarray:
+        """Mask of units whose type is in `type_ids`, see `type_id_array`."""
+        return np.isin(self.type_ids, type_ids)
+
+    def select(self, mask: np.ndarray) -> list[Unit]:
+        """The units where `mask` is True, in their original order."""
+        return [self.units[i] for i in np.flatnonzero(mask)]
@@ -0,0 +1,114 @@
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+from sc2.unit import Unit
+from sc2.units import Units
+from scipy.spatial import KDTree
+
+from bot.combat.enemy_columns import EnemyColumns
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+
+class EnemySnapshot:
+    """Every enemy unit for the current frame, read once and shared.
+
+    Built lazily from `mediator.get_all_enemy` the first time it is used in a
+    frame, so combat classes running for several squads or openings share
+    the same filter results instead of checking each unit again.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self._game_loop: int = -1
+        self._columns: Optional[EnemyColumns] = None
+        self._tag_to_index: dict[int, int] = dict()
+        self._tree: Optional[KDTree] = None
+
+    @property
+    def columns(self) -> EnemyColumns:
+        game_loop: int = self.ai.state.game_loop
+        if self._columns is None or game_loop != self._game_loop:
+            self._columns = EnemyColumns(self.ai.mediator.get_all_enemy)
+            self._tag_to_index = {
+                unit.tag: i for i, unit in enumerate(self._columns.units)
+            }
+            self._tree = None
+            self._game_loop = game_loop
+        return self._columns
+
+    @property
+    def tree(self) -> Optional[KDTree]:
+        """KD-tree over every enemy position, None if there are no enemies."""
+        columns: EnemyColumns = self.columns
+        if self._tree is None and len(columns) > 0:
+            self._tree = KDTree(columns.positions)
+        return self._tree
+
+    @property
+    def tag_to_index(self) -> dict[int, int]:
+        """Enemy tag to row in `columns`."""
+        # make sure the tag lookup belongs to this frame
+        _ = self.columns
+        return self._tag_to_index
+
+    def indices_of(self, units: Union[Units, list[Unit]]) -> np.ndarray:
+        """Snapshot rows of `units`, skipping any that are not in the snapshot."""
+        tag_to_index: dict[int, int] = self.tag_to_index
+        return np.array(
+            [tag_to_index[u.tag] for u in units if u.tag in tag_to_index],
+            dtype=np.int64,
+        )
+
+    def columns_for(self, units: Union[Units, list[Unit]]) -> EnemyColumns:
+        """Columns for a subset of enemies, e.g. a `get_units_in_range` result."""
+        return self.columns.take(self.indices_of(units))
+
+    def valid(self, units: Union[Units, list[Unit]]) -> list[Unit]:
+        """The units in `units` that pass `EnemyColumns.is_valid`."""
+        columns: EnemyColumns = self.columns_for(units)
+        return columns.select(columns.is_valid)
+
+    def in_range(
+        self,
+        start_points: Union[Units, list[Unit]],
+        distance: float,
+        mask: Optional[np.ndarray] = None,
+    ) -> dict[int, list[Unit]]:
+        """Enemies within `distance` of each unit in `start_points`.
+
+        Parameters
+        ----------
+        start_points :
+            Our units to search around.
+        distance :
+            Search radius.
+        mask :
+            Optional boolean mask over `columns`, only rows where it is True
+            are returned. Defaults to `columns.is_valid`.
+
+        Returns
+        -------
+        dict[int, list[Unit]] :
+            Tag of each unit in `start_points` to the enemies near it.
+        """
+        columns: EnemyColumns = self.columns
+        if mask is None:
+            mask = columns.is_valid
+        tree: Optional[KDTree] = self.tree
+        if tree is None or len(start_points) == 0:
+            return {unit.tag: [] for unit in start_points}
+
+        in_range: np.ndarray = tree.query_ball_point(
+            np.array([unit.position_tuple for unit in start_points]), distance
+        )
+        return {
+            unit.tag: [columns.units[i] for i in indices if mask[i]]
+            for unit, indices in zip(start_points, in_range)
+        }
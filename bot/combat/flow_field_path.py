@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+from ares.behaviors.combat.individual import PathUnitToTarget
+from ares.behaviors.combat.individual.combat_individual_behavior import (
+    CombatIndividualBehavior,
+)
+from ares.managers.manager_mediator import ManagerMediator
+from cython_extensions import cy_distance_to_squared
+from sc2.position import Point2
+from sc2.unit import Unit
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# how many path cells ahead of the unit a cached path's waypoint is
+CACHED_PATH_STEP: int = 5
+
+
+@dataclass
+class PathUnitWithSharedPaths(CombatIndividualBehavior):
+    """`PathUnitToTarget` reading its waypoint from work shared between units.
+
+    When `grid_name` is given a flow field is tried first, see
+    `FlowFieldService`, then a cached path, see `PathCache`. Whatever isn't
+    available falls back to `PathUnitToTarget`.
+
+    Parameters
+    ----------
+    unit : Unit
+        The unit to path.
+    grid : np.ndarray
+        Pathing grid to path on.
+    target : Point2
+        Where the unit is heading.
+    success_at_distance : float
+        Nothing is done once the unit is this close to `target`.
+    sense_danger : bool
+        Passed on to `PathUnitToTarget` when falling back.
+    grid_name : Optional[str]
+        Name of `grid` for the flow fields and path cache, None skips both.
+    """
+
+    unit: Unit
+    grid: np.ndarray
+    target: Point2
+    success_at_distance: float = 0.0
+    sense_danger: bool = True
+    grid_name: Optional[str] = None
+
+    def execute(self, ai: "AresBot", config: dict, mediator: ManagerMediator) -> bool:
+        position: Point2 = self.unit.position
+        if (
+            cy_distance_to_squared(position, self.target)
+            < self.success_at_distance**2
+        ):
+            return False
+
+        waypoint: Optional[Point2] = None
+        if self.grid_name:
+            waypoint = ai.flow_fields.next_waypoint(
+                self.grid, self.grid_name, position, self.target
+            )
+        if waypoint is None and self.grid_name and ai.path_cache.enabled:
+            path: list[Point2] = ai.path_cache.find_raw_path(
+                position, self.target, self.grid, self.grid_name
+            )
+            waypoint = path[min(CACHED_PATH_STEP, len(path) - 1)] if path else None
+
+        if waypoint is None:
+            return PathUnitToTarget(
+                unit=self.unit,
+                grid=self.grid,
+                target=self.target,
+                success_at_distance=self.success_at_distance,
+                sense_danger=self.sense_danger,
+            ).execute(ai, config, mediator)
+
+        self.unit.move(waypoint)
+        return True
+
+
+def path_unit_to_target(
+    ai: "AresBot",
+    unit: Unit,
+    grid: np.ndarray,
+    target: Point2,
+    success_at_distance: float = 0.0,
+    sense_danger: bool = True,
+    grid_name: Optional[str] = None,
+) -> Union[PathUnitToTarget, PathUnitWithSharedPaths]:
+    """Drop-in for `PathUnitToTarget` that shares pathing work when enabled.
+
+    Pass `grid_name` ("ground", "climber"...) to allow flow fields and
+    cached paths.
+    """
+    if grid_name and (ai.flow_fields.enabled or ai.path_cache.enabled):
+        return PathUnitWithSharedPaths(
+            unit=unit,
+            grid=grid,
+            target=target,
+            success_at_distance=success_at_distance,
+            sense_danger=sense_danger,
+            grid_name=grid_name,
+        )
+    return PathUnitToTarget(
+        unit=unit,
+        grid=grid,
+        target=target,
+        success_at_distance=success_at_distance,
+        sense_danger=sense_danger,
+    )
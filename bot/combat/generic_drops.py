@@ -12,14 +12,14 @@ from ares.behaviors.combat.individual import (
     PickUpCargo,
     ShootTargetInRange,
 )
-from ares.consts import UnitRole, UnitTreeQueryType
+from ares.consts import UnitRole
 from sc2.ids.ability_id import AbilityId
 from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
-from bot.consts import COMMON_UNIT_IGNORE_TYPES
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.drop_assignments import DropAssignments
 
 if TYPE_CHECKING:
     from ares import AresBot
@@ -44,6 +44,7 @@ class GenericDrops(BaseCombat):
     config: dict
     mediator: ManagerMediator
 
+    @profile_execute
     def execute(self, units: Units, **kwargs) -> None:
         """Execute the mine drop.
 
@@ -56,9 +57,8 @@ class GenericDrops(BaseCombat):
 
         Keyword Arguments
         -----------------
-        medivac_tag_to_units_tracker : dict[list[int], dict]
-            Tracker detailing medivac tag to unit tags.
-            And target for the drop.
+        drop_assignments : DropAssignments
+            Which units each medivac drops, and where.
 
         """
         # no units assigned to mine drop currently.
@@ -67,41 +67,41 @@ class GenericDrops(BaseCombat):
 
         air_grid: np.ndarray = self.mediator.get_air_grid
         ground_grid: np.ndarray = self.mediator.get_ground_grid
-        medivac_tag_to_units_tracker: dict[int, dict] = kwargs[
-            "medivac_tag_to_units_tracker"
-        ]
+        drop_assignments: DropAssignments = kwargs["drop_assignments"]
 
         # we have the exact units, but we need to split them depending on precise job.
         unit_role_dict: dict[UnitRole, set[int]] = self.mediator.get_unit_role_dict
 
-        for medivac_tag, tracker_info in medivac_tag_to_units_tracker.items():
+        units_by_medivac: dict[int, list[Unit]] = drop_assignments.cargo_by_medivac(
+            units
+        )
+
+        for assignment in drop_assignments:
+            medivac_tag: int = assignment.medivac_tag
             medivac: Optional[Unit] = self.ai.unit_tag_dict.get(medivac_tag, None)
+            cargo: list[Unit] = units_by_medivac[medivac_tag]
 
             units_to_pickup: list[Unit] = [
-                u
-                for u in units
-                if u.tag in tracker_info["tags"]
-                and u.tag in unit_role_dict[UnitRole.DROP_UNITS_TO_LOAD]
+                u for u in cargo if u.tag in unit_role_dict[UnitRole.DROP_UNITS_TO_LOAD]
             ]
 
             dropped_off_units: list[Unit] = [
                 u
-                for u in units
+                for u in cargo
                 if u.tag in unit_role_dict[UnitRole.DROP_UNITS_ATTACKING]
-                and u.tag in tracker_info["tags"]
             ]
 
             if medivac and medivac_tag in unit_role_dict[UnitRole.DROP_SHIP]:
                 self._handle_medivac_dropping_units(
-                    medivac, units_to_pickup, air_grid, tracker_info["target"]
+                    medivac, units_to_pickup, air_grid, assignment.target
                 )
             self._handle_units_to_pickup(units_to_pickup, medivac, ground_grid)
             self._handle_dropped_units(
                 ground_grid,
                 dropped_off_units,
                 medivac,
-                tracker_info["target"],
-                tracker_info["healing"],
+                assignment.target,
+                assignment.healing,
             )
 
     def _handle_medivac_dropping_units(
@@ -201,22 +201,11 @@ class GenericDrops(BaseCombat):
         """
         if len(units) == 0:
             return
-        near_enemy: dict[int, Units] = self.mediator.get_units_in_range(
-            start_points=units,
-            distances=13,
-            query_tree=UnitTreeQueryType.AllEnemy,
-            return_as_dict=True,
+        near_enemy: dict[int, list[Unit]] = self.ai.enemy_snapshot.in_range(
+            start_points=units, distance=13
         )
         for unit in units:
-            close_enemy: list[Unit] = [
-                u
-                for u in near_enemy[unit.tag]
-                if (not u.is_cloaked or u.is_cloaked and u.is_revealed)
-                and (not u.is_burrowed or u.is_burrowed and u.is_visible)
-                and not u.is_memory
-                and not u.is_snapshot
-                and u.type_id not in COMMON_UNIT_IGNORE_TYPES
-            ]
+            close_enemy: list[Unit] = near_enemy[unit.tag]
             maneuver: CombatManeuver = CombatManeuver()
             if healing:
                 maneuver.add(KeepUnitSafe(unit=unit, grid=grid))
@@ -11,7 +11,7 @@ from ares.behaviors.combat.individual import (
     StutterUnitBack,
     StutterUnitForward,
 )
-from ares.consts import ALL_STRUCTURES, UnitTreeQueryType
+from ares.consts import UnitTreeQueryType
 from ares.managers.manager_mediator import ManagerMediator
 from cython_extensions import cy_closest_to, cy_is_facing
 from sc2.ids.ability_id import AbilityId
@@ -20,8 +20,9 @@ from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
-from bot.consts import COMMON_UNIT_IGNORE_TYPES
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.enemy_columns import EnemyColumns, type_id_array
+from bot.combat.flow_field_path import path_unit_to_target
 
 if TYPE_CHECKING:
     from ares import AresBot
@@ -48,6 +49,7 @@ STRUCTURE_TARGETS: set[UnitID] = {
     UnitID.OVERSEERSIEGEMODE,
     UnitID.OVERLORDCOCOON,
 }
+STRUCTURE_TARGET_IDS: np.ndarray = type_id_array(STRUCTURE_TARGETS)
 
 
 @dataclass
@@ -68,25 +70,22 @@ class GroundRangeCombat(BaseCombat):
     config: dict
     mediator: ManagerMediator
 
+    @profile_execute
     def execute(self, units: Union[list[Unit], Units], **kwargs) -> None:
         everything_near_squad: Units = kwargs["everything_near_squad"]
         target: Point2 = (
             kwargs["target"] if "target" in kwargs else self.ai.enemy_start_locations[0]
         )
-        close_enemy: list[Unit] = [
-            u
-            for u in everything_near_squad
-            if (not u.is_cloaked or u.is_cloaked and u.is_revealed)
-            and (not u.is_burrowed or u.is_burrowed and u.is_visible)
-            and not u.is_memory
-            and not u.is_snapshot
-            and u.type_id not in COMMON_UNIT_IGNORE_TYPES
-        ]
-        priority_units: list[Unit] = [
-            u
-            for u in close_enemy
-            if u.type_id not in ALL_STRUCTURES or u.type_id in STRUCTURE_TARGETS
-        ]
+        enemy: EnemyColumns = self.ai.enemy_snapshot.columns_for(everything_near_squad)
+        close_mask: np.ndarray = enemy.is_valid
+        priority_mask: np.ndarray = close_mask & (
+            ~enemy.is_structure | enemy.of_type(STRUCTURE_TARGET_IDS)
+        )
+        close_enemy: list[Unit] = enemy.select(close_mask)
+        priority_units: list[Unit] = enemy.select(priority_mask)
+        # subsets for units that can't shoot up, only built if needed
+        close_ground: list[Unit] | None = None
+        priority_ground: list[Unit] | None = None
         avoid_grid: np.ndarray = self.mediator.get_ground_avoidance_grid
         grid: np.ndarray = self.mediator.get_ground_grid
         can_engage: Point2 = kwargs["can_engage"]
@@ -96,24 +95,27 @@ class GroundRangeCombat(BaseCombat):
             if unit.type_id == UnitID.MEDIVAC:
                 self._handle_medivac(unit, target, squad_position, units)
                 continue
+            unit_close_enemy: list[Unit] = close_enemy
+            unit_priority_units: list[Unit] = priority_units
             if not unit.can_attack_air:
-                priority_units: list[Unit] = [
-                    u for u in priority_units if not u.is_flying
-                ]
-                close_enemy: list[Unit] = [u for u in close_enemy if not u.is_flying]
+                if close_ground is None:
+                    close_ground = enemy.select(close_mask & ~enemy.is_flying)
+                    priority_ground = enemy.select(priority_mask & ~enemy.is_flying)
+                unit_close_enemy = close_ground
+                unit_priority_units = priority_ground
             attacking_maneuver: CombatManeuver = CombatManeuver()
             attacking_maneuver.add(KeepUnitSafe(unit=unit, grid=avoid_grid))
 
-            attacking_maneuver.add(ShootTargetInRange(unit, priority_units))
-            attacking_maneuver.add(ShootTargetInRange(unit, close_enemy))
+            attacking_maneuver.add(ShootTargetInRange(unit, unit_priority_units))
+            attacking_maneuver.add(ShootTargetInRange(unit, unit_close_enemy))
 
             if can_engage:
-                if close_enemy:
+                if unit_close_enemy:
                     target_unit: Unit | None
-                    if priority_units:
-                        target_unit = cy_closest_to(unit.position, priority_units)
+                    if unit_priority_units:
+                        target_unit = cy_closest_to(unit.position, unit_priority_units)
                     else:
-                        target_unit = cy_closest_to(unit.position, close_enemy)
+                        target_unit = cy_closest_to(unit.position, unit_close_enemy)
 
                     if (
                         not target_unit.is_flying
@@ -129,15 +131,25 @@ class GroundRangeCombat(BaseCombat):
 
                 else:
                     attacking_maneuver.add(
-                        PathUnitToTarget(
-                            unit=unit, target=target, grid=grid, success_at_distance=5.0
+                        path_unit_to_target(
+                            self.ai,
+                            unit,
+                            grid,
+                            target,
+                            success_at_distance=5.0,
+                            grid_name="ground",
                         )
                     )
             else:
                 attacking_maneuver.add(KeepUnitSafe(unit=unit, grid=grid))
                 attacking_maneuver.add(
-                    PathUnitToTarget(
-                        unit=unit, target=target, grid=grid, success_at_distance=5.0
+                    path_unit_to_target(
+                        self.ai,
+                        unit,
+                        grid,
+                        target,
+                        success_at_distance=5.0,
+                        grid_name="ground",
                     )
                 )
             self.ai.register_behavior(attacking_maneuver)
@@ -19,7 +19,9 @@ from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.drop_assignments import DropAssignments
+from bot.combat.mine_cooldowns import MineCooldowns
 
 if TYPE_CHECKING:
     from ares import AresBot
@@ -49,6 +51,7 @@ class MedivacMineDrops(BaseCombat):
     mediator: ManagerMediator
     drilling_claws_available: bool = False
 
+    @profile_execute
     def execute(self, units: Units, **kwargs) -> None:
         """Execute the mine drop.
 
@@ -61,14 +64,13 @@ class MedivacMineDrops(BaseCombat):
 
         Keyword Arguments
         -----------------
-        medivac_tag_to_mine_tracker : dict[int, dict]
-            Tracker detailing medivac tag to mine tags.
-            And target for the mine drop.
+        drop_assignments : DropAssignments
+            Which mines each medivac drops, and where.
 
         """
         assert (
-            "medivac_tag_to_mine_tracker" in kwargs
-        ), "No value for medivac_tag_to_mine_tracker was passed into kwargs."
+            "drop_assignments" in kwargs
+        ), "No value for drop_assignments was passed into kwargs."
         # no units assigned to mine drop currently.
         if not units:
             return
@@ -81,57 +83,53 @@ class MedivacMineDrops(BaseCombat):
 
         air_grid: np.ndarray = self.mediator.get_air_grid
         ground_grid: np.ndarray = self.mediator.get_ground_grid
-        medivac_tag_to_mine_tracker: dict[int, dict] = kwargs[
-            "medivac_tag_to_mine_tracker"
-        ]
+        drop_assignments: DropAssignments = kwargs["drop_assignments"]
 
         unit_role_dict: dict[UnitRole, set[int]] = self.mediator.get_unit_role_dict
 
+        mines_by_medivac: dict[int, list[Unit]] = drop_assignments.cargo_by_medivac(
+            units
+        )
+
         # Process each active drop
-        for medivac_tag, tracker_info in medivac_tag_to_mine_tracker.items():
+        for assignment in drop_assignments:
+            medivac_tag: int = assignment.medivac_tag
             medivac: Optional[Unit] = self.ai.unit_tag_dict.get(medivac_tag, None)
+            mines: list[Unit] = mines_by_medivac[medivac_tag]
 
             # Separate mines by their current role
             mines_to_pickup: list[Unit] = [
-                u
-                for u in units
-                if u.tag in tracker_info["mine_tags"]
-                and u.tag in unit_role_dict[UnitRole.DROP_UNITS_TO_LOAD]
+                u for u in mines if u.tag in unit_role_dict[UnitRole.DROP_UNITS_TO_LOAD]
             ]
             dropped_off_mines: list[Unit] = [
                 u
-                for u in units
-                if u.tag in tracker_info["mine_tags"]
-                and u.tag in unit_role_dict[UnitRole.DROP_UNITS_ATTACKING]
+                for u in mines
+                if u.tag in unit_role_dict[UnitRole.DROP_UNITS_ATTACKING]
             ]
 
             # Handle medivac and mines
             if medivac and medivac_tag in unit_role_dict[UnitRole.DROP_SHIP]:
                 self._handle_medivac_dropping_mines(
-                    medivac, mines_to_pickup, air_grid, tracker_info["target"]
+                    medivac, mines_to_pickup, air_grid, assignment.target
                 )
             self._handle_mines_to_pickup(
-                mines_to_pickup, medivac, ground_grid, medivac_tag_to_mine_tracker
+                mines_to_pickup, medivac, ground_grid, drop_assignments
             )
             self._handle_dropped_mines(
-                ground_grid, dropped_off_mines, medivac, medivac_tag_to_mine_tracker
+                ground_grid, dropped_off_mines, medivac, drop_assignments
             )
 
-        # Handle orphaned DROP_UNITS_ATTACKING mines not in any tracker
-        all_tracked_mine_tags: set[int] = set()
-        for tracker_info in medivac_tag_to_mine_tracker.values():
-            all_tracked_mine_tags.update(tracker_info["mine_tags"])
-
+        # Handle orphaned DROP_UNITS_ATTACKING mines not in any drop
         orphaned_mines: list[Unit] = [
             u
             for u in units
             if (u.tag in unit_role_dict[UnitRole.DROP_UNITS_ATTACKING])
-            and u.tag not in all_tracked_mine_tags
+            and not drop_assignments.is_cargo(u.tag)
         ]
 
         if orphaned_mines:
             self._handle_dropped_mines(
-                ground_grid, orphaned_mines, None, medivac_tag_to_mine_tracker
+                ground_grid, orphaned_mines, None, drop_assignments
             )
 
     def _handle_medivac_dropping_mines(
@@ -202,9 +200,11 @@ class MedivacMineDrops(BaseCombat):
         # not ready to drop anything, add staying safe and path to dead-space
         else:
             mine_drop.add(KeepUnitSafe(unit=medivac, grid=air_grid))
-            safe_spot: Point2 = self.mediator.find_closest_safe_spot(
+            safe_spot: Point2 = self.ai.safe_spots.find_closest_safe_spot(
                 from_pos=self.ai.game_info.map_center,
                 grid=air_grid,
+                grid_name="air",
+                radius=15.0,
             )
             mine_drop.add(
                 PathUnitToTarget(unit=medivac, grid=air_grid, target=safe_spot)
@@ -218,7 +218,7 @@ class MedivacMineDrops(BaseCombat):
         mines: list[Unit],
         medivac: Optional[Unit],
         ground_grid: np.ndarray,
-        medivac_tag_to_mine_tracker: dict[int, dict],
+        drop_assignments: DropAssignments,
     ) -> None:
         """Control mines waiting rescue.
 
@@ -230,8 +230,8 @@ class MedivacMineDrops(BaseCombat):
             Medivac that could possibly pick these mines up.
         ground_grid :
             Pathing grid these mines can path on.
-        medivac_tag_to_mine_tracker :
-            Tracker to verify if mine is still actively tracked.
+        drop_assignments :
+            To verify if mine is still part of a drop.
         """
         for mine in mines:
             if mine.is_burrowed:
@@ -241,11 +241,8 @@ class MedivacMineDrops(BaseCombat):
                     PathUnitToTarget(mine, ground_grid, medivac.position)
                 )
             else:
-                # Check if mine is still in an active tracker
-                is_tracked = any(
-                    mine.tag in tracker["mine_tags"]
-                    for tracker in medivac_tag_to_mine_tracker.values()
-                )
+                # Check if mine is still part of a drop
+                is_tracked: bool = drop_assignments.is_cargo(mine.tag)
                 # If not tracked, reassign to ATTACKING instead of DROP_UNITS_ATTACKING
                 if is_tracked:
                     self.mediator.assign_role(
@@ -259,7 +256,7 @@ class MedivacMineDrops(BaseCombat):
         grid: np.ndarray,
         mines: list[Unit],
         medivac: Unit,
-        medivac_tag_to_mine_tracker: dict[int, dict],
+        drop_assignments: DropAssignments,
     ) -> None:
         """Control mines that've recently been dropped off.
 
@@ -269,39 +266,32 @@ class MedivacMineDrops(BaseCombat):
             Mines this method should control.
         medivac :
             The medivac associated with these mines (can be None for orphaned mines).
-        medivac_tag_to_mine_tracker :
-            Tracker to verify if mine is still actively tracked.
+        drop_assignments :
+            To verify if mine is still part of a drop.
         """
         if len(mines) == 0:
             return
-        # Use the ability tracker manager in Ares to check if weapon is ready.
+        # Use the shared mine cooldown table to check if weapon is ready.
         ability: AbilityId = AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK
-        current_frame: int = self.ai.state.game_loop
-        unit_to_ability_dict: dict[
-            int, dict[AbilityId, int]
-        ] = self.mediator.get_unit_to_ability_dict
+        mine_cooldowns: MineCooldowns = self.ai.mine_cooldowns
+        attacks_available: np.ndarray = mine_cooldowns.ready(mines)
 
-        for mine in mines:
+        for i, mine in enumerate(mines):
             if (
                 mine.is_burrowed
                 and UpgradeId.DRILLCLAWS in self.ai.state.upgrades
                 and not self.mediator.get_is_detected(unit=mine)
             ):
                 continue
-            attack_available: bool = (
-                current_frame >= unit_to_ability_dict[mine.tag][ability]
-            )
+            attack_available: bool = bool(attacks_available[i])
             if mine.is_burrowed and ability not in mine.abilities:
                 attack_available = False
             if (attack_available or not medivac) and not mine.is_burrowed:
                 mine(AbilityId.BURROWDOWN_WIDOWMINE)
             # if no medivac, just leave the mines alone
             elif ability not in mine.abilities and mine.is_burrowed and medivac:
-                # Check if mine is still in an active tracker
-                is_tracked = any(
-                    mine.tag in tracker["mine_tags"]
-                    for tracker in medivac_tag_to_mine_tracker.values()
-                )
+                # Check if mine is still part of a drop
+                is_tracked: bool = drop_assignments.is_cargo(mine.tag)
                 # Only reassign to DROP_UNITS_TO_LOAD if still actively tracked
                 if is_tracked:
                     mine(AbilityId.BURROWUP_WIDOWMINE)
@@ -311,10 +301,7 @@ class MedivacMineDrops(BaseCombat):
                     self.mediator.assign_role(
                         tag=mine.tag, role=UnitRole.DROP_UNITS_TO_LOAD
                     )
-                    self.mediator.update_unit_to_ability_dict(
-                        ability=ability,
-                        unit_tag=mine.tag,
-                    )
+                    mine_cooldowns.on_shot(mine.tag)
                 else:
                     # Mine not tracked anymore, reassign to ATTACKING
                     self.mediator.assign_role(tag=mine.tag, role=UnitRole.ATTACKING)
@@ -324,8 +311,8 @@ class MedivacMineDrops(BaseCombat):
     def _can_drop_mines(self, medivac: Unit) -> bool:
         """Can this medivac drop off mines?
 
-        Use the AbilityTrackerManager in ares to detect widowmines
-        attack ability becoming available.
+        Use the shared `MineCooldowns` table to check all cargo mines
+        will have their attack available shortly.
 
         Parameters
         ----------
@@ -341,22 +328,9 @@ class MedivacMineDrops(BaseCombat):
         if not medivac.has_cargo:
             return False
 
-        cargo_tags: set[int] = medivac.passengers_tags
-        current_frame: int = self.ai.state.game_loop
-        unit_to_ability_dict: dict[
-            int, dict[AbilityId, int]
-        ] = self.mediator.get_unit_to_ability_dict
-
-        for tag in cargo_tags:
-            if tag in unit_to_ability_dict:
-                attack_available: bool = current_frame >= (
-                    unit_to_ability_dict[tag][AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK]
-                    - SEVEN_SECONDS
-                )
-                if not attack_available:
-                    return False
-
-        return True
+        return self.ai.mine_cooldowns.all_ready(
+            medivac.passengers_tags, within=SEVEN_SECONDS
+        )
 
     def _calculate_precise_target(
         self, air_grid: np.ndarray, medivac: Unit, target: Point2
@@ -410,8 +384,8 @@ class MedivacMineDrops(BaseCombat):
 
         # current position is not safe for medivac, find a nearby safe spot
         if not self.mediator.is_position_safe(grid=air_grid, position=med_pos):
-            target = self.mediator.find_closest_safe_spot(
-                from_pos=target, grid=air_grid
+            target = self.ai.safe_spots.find_closest_safe_spot(
+                from_pos=target, grid=air_grid, grid_name="air", radius=15.0
             )
 
         return target
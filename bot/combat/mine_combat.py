@@ -1,11 +1,11 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from math import sqrt
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import numpy as np
 from ares.behaviors.combat import CombatManeuver
-from ares.behaviors.combat.individual import KeepUnitSafe, PathUnitToTarget, UseAbility
-from ares.consts import ALL_STRUCTURES, UnitTreeQueryType
+from ares.behaviors.combat.individual import KeepUnitSafe, UseAbility
 from ares.managers.manager_mediator import ManagerMediator
 from cython_extensions import cy_closest_to, cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
@@ -14,13 +14,23 @@ from sc2.ids.upgrade_id import UpgradeId
 from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
+from scipy.spatial import KDTree
 
-from bot.combat.base_combat import BaseCombat
-from bot.consts import COMMON_UNIT_IGNORE_TYPES
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.enemy_columns import EnemyColumns
+from bot.combat.flow_field_path import path_unit_to_target
+from bot.combat.mine_cooldowns import MineCooldowns
 
 if TYPE_CHECKING:
     from ares import AresBot
 
+# enemies a mine reacts to
+MINE_SEARCH_RANGE: float = 11.0
+# unburrowed mines closer than this to a visible enemy burrow down
+MINE_BURROW_RANGE: float = sqrt(49.5)
+# mines in the same cell of this size share one enemy query
+MINE_CLUSTER_SIZE: float = 8.0
+
 DANGER_TO_AIR: set[UnitID] = {
     UnitID.VOIDRAY,
     UnitID.PHOTONCANNON,
@@ -30,6 +40,15 @@ DANGER_TO_AIR: set[UnitID] = {
 }
 
 
+@dataclass
+class MineTargets:
+    """Enemies near one mine, see `MineCombat._mine_targets`."""
+
+    inc_memory: list[Unit]
+    visible: list[Unit]
+    in_burrow_range: bool
+
+
 @dataclass
 class MineCombat(BaseCombat):
     """Execute behavior for Tempest Combat.
@@ -48,6 +67,7 @@ class MineCombat(BaseCombat):
     config: dict
     mediator: ManagerMediator
 
+    @profile_execute
     def execute(self, units: Union[list[Unit], Units], **kwargs) -> None:
         target: Point2 = (
             kwargs["target"] if "target" in kwargs else self.ai.enemy_start_locations[0]
@@ -60,48 +80,30 @@ class MineCombat(BaseCombat):
             if "burrow_at_distance_sq" in kwargs
             else 100.0
         )
-        near_enemy: dict[int, Units] = self.mediator.get_units_in_range(
-            start_points=units,
-            distances=11,
-            query_tree=UnitTreeQueryType.AllEnemy,
-            return_as_dict=True,
+        enemy: EnemyColumns = self.ai.enemy_snapshot.columns
+        # mines also go after memory units, and never target structures
+        enemy_units_mask: np.ndarray = ~enemy.is_ignored & ~enemy.is_structure
+        mine_targets: dict[int, MineTargets] = self._mine_targets(
+            units, enemy, enemy_units_mask
         )
         avoid_grid: np.ndarray = self.mediator.get_ground_avoidance_grid
         grid: np.ndarray = self.mediator.get_ground_grid
 
         drilling_claws_available: bool = UpgradeId.DRILLCLAWS in self.ai.state.upgrades
         ability: AbilityId = AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK
-        current_frame: int = self.ai.state.game_loop
-        unit_to_ability_dict: dict[
-            int, dict[AbilityId, int]
-        ] = self.ai.mediator.get_unit_to_ability_dict
+        mine_cooldowns: MineCooldowns = self.ai.mine_cooldowns
+        attacks_available: np.ndarray = mine_cooldowns.ready(units)
 
-        for unit in units:
-            attack_available: bool = (
-                current_frame >= unit_to_ability_dict[unit.tag][ability]
-            )
-            close_enemy: list[Unit] = [
-                u
-                for u in near_enemy[unit.tag]
-                if u.type_id not in COMMON_UNIT_IGNORE_TYPES
-            ]
-
-            only_enemy_units_inc_memory: list[Unit] = [
-                u for u in close_enemy if u.type_id not in ALL_STRUCTURES
-            ]
-            only_enemy_units: list[Unit] = [
-                u
-                for u in close_enemy
-                if u.type_id not in ALL_STRUCTURES and not u.is_memory
-            ]
+        for i, unit in enumerate(units):
+            attack_available: bool = bool(attacks_available[i])
+            targets: MineTargets = mine_targets[unit.tag]
+            only_enemy_units_inc_memory: list[Unit] = targets.inc_memory
+            only_enemy_units: list[Unit] = targets.visible
 
             attacking_maneuver: CombatManeuver = CombatManeuver()
             if unit.is_burrowed:
                 if attack_available and ability not in unit.abilities:
-                    self.mediator.update_unit_to_ability_dict(
-                        ability=ability,
-                        unit_tag=unit.tag,
-                    )
+                    mine_cooldowns.on_shot(unit.tag)
                     attack_available = False
 
                 attacking_maneuver.add(
@@ -129,10 +131,79 @@ class MineCombat(BaseCombat):
                         drilling_claws_available,
                         target,
                         burrow_at_distance_sq,
+                        targets.in_burrow_range,
                     )
                 )
             self.ai.register_behavior(attacking_maneuver)
 
+    def _mine_targets(
+        self,
+        units: Union[list[Unit], Units],
+        enemy: EnemyColumns,
+        mask: np.ndarray,
+    ) -> dict[int, MineTargets]:
+        """Enemies near every mine, with one range query per group of mines.
+
+        Mines are grouped by `MINE_CLUSTER_SIZE` cells. Each group asks the
+        enemy KD-tree once for everything that could be in range of any of
+        its mines, then works out every mine's enemies, and whether a
+        visible one is close enough to burrow, from a single distance block.
+
+        Parameters
+        ----------
+        units :
+            The mines.
+        enemy :
+            This frame's enemy columns.
+        mask :
+            Boolean mask over `enemy`, enemies the mines care about.
+        """
+        tree: Optional[KDTree] = self.ai.enemy_snapshot.tree
+        if tree is None:
+            return {unit.tag: MineTargets([], [], False) for unit in units}
+
+        clusters: dict[tuple[int, int], list[Unit]] = defaultdict(list)
+        for unit in units:
+            clusters[
+                (
+                    int(unit.position_tuple[0] // MINE_CLUSTER_SIZE),
+                    int(unit.position_tuple[1] // MINE_CLUSTER_SIZE),
+                )
+            ].append(unit)
+
+        mine_targets: dict[int, MineTargets] = dict()
+        for mines in clusters.values():
+            positions: np.ndarray = np.array([m.position_tuple for m in mines])
+            center: np.ndarray = positions.mean(axis=0)
+            spread: float = float(
+                np.sqrt(np.max(np.sum((positions - center) ** 2, axis=1)))
+            )
+            candidates: np.ndarray = np.array(
+                tree.query_ball_point(center, MINE_SEARCH_RANGE + spread),
+                dtype=np.int64,
+            )
+            candidates = candidates[mask[candidates]]
+            visible: np.ndarray = ~enemy.is_memory[candidates]
+
+            deltas: np.ndarray = (
+                positions[:, np.newaxis, :]
+                - enemy.positions[candidates][np.newaxis, :, :]
+            )
+            distances_sq: np.ndarray = np.einsum("ijk,ijk->ij", deltas, deltas)
+            in_search_range: np.ndarray = distances_sq < MINE_SEARCH_RANGE**2
+            in_burrow_range: np.ndarray = np.any(
+                (distances_sq < MINE_BURROW_RANGE**2) & visible, axis=1
+            )
+            for i, mine in enumerate(mines):
+                near: np.ndarray = candidates[in_search_range[i]]
+                near_visible: np.ndarray = candidates[in_search_range[i] & visible]
+                mine_targets[mine.tag] = MineTargets(
+                    inc_memory=[enemy.units[j] for j in near],
+                    visible=[enemy.units[j] for j in near_visible],
+                    in_burrow_range=bool(in_burrow_range[i]),
+                )
+        return mine_targets
+
     def _burrowed_mine_behavior(
         self,
         unit: Unit,
@@ -178,22 +249,13 @@ class MineCombat(BaseCombat):
         drilling_claws_available: bool,
         target: Point2,
         burrow_at_distance_sq: float,
+        in_burrow_range: bool,
     ) -> CombatManeuver:
         aggressive: bool = drilling_claws_available
         unburrowed_mine_maneuver: CombatManeuver = CombatManeuver()
         if only_enemy_units:
             if aggressive and attack_available:
-                in_range: bool = (
-                    len(
-                        [
-                            u
-                            for u in only_enemy_units
-                            if cy_distance_to_squared(unit.position, u.position) < 49.5
-                        ]
-                    )
-                    > 0
-                )
-                if in_range:
+                if in_burrow_range:
                     unburrowed_mine_maneuver.add(
                         UseAbility(AbilityId.BURROWDOWN_WIDOWMINE, unit)
                     )
@@ -219,8 +281,13 @@ class MineCombat(BaseCombat):
         else:
             success_at_distance = sqrt(burrow_at_distance_sq)
             unburrowed_mine_maneuver.add(
-                PathUnitToTarget(
-                    unit, grid, target, success_at_distance=success_at_distance
+                path_unit_to_target(
+                    self.ai,
+                    unit,
+                    grid,
+                    target,
+                    success_at_distance=success_at_distance,
+                    grid_name="ground",
                 )
             )
             unburrowed_mine_maneuver.add(
@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Iterable, Union
+
+import numpy as np
+from sc2.ids.ability_id import AbilityId
+from sc2.unit import Unit
+from sc2.units import Units
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+MINE_ATTACK: AbilityId = AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK
+
+
+class MineCooldowns:
+    """Frame each widow mine's attack is ready again, in a NumPy array.
+
+    Every mine gets a slot the first time it shoots, the slot is freed in
+    `on_unit_destroyed` and handed to the next mine. Mines without a slot
+    have never shot and are ready. Ares' ability tracker is still told
+    about every shot, see `on_shot`, and remains the source of the
+    cooldown length, it is just no longer read per mine per frame.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game
+    capacity : int
+        Initial number of slots, grows when needed.
+    """
+
+    def __init__(self, ai: "AresBot", capacity: int = 64):
+        self.ai: "AresBot" = ai
+        self._tag_to_slot: dict[int, int] = dict()
+        self._free_slots: list[int] = list(range(capacity - 1, -1, -1))
+        self._ready_at: np.ndarray = np.zeros(capacity, dtype=np.int64)
+
+    def on_shot(self, unit_tag: int) -> None:
+        """Mine `unit_tag` just fired, start its cooldown."""
+        self.ai.mediator.update_unit_to_ability_dict(
+            ability=MINE_ATTACK, unit_tag=unit_tag
+        )
+        ready_at: int = self.ai.mediator.get_unit_to_ability_dict[unit_tag][MINE_ATTACK]
+        slot: int = self._slot(unit_tag)
+        self._ready_at[slot] = ready_at
+
+    def on_unit_destroyed(self, unit_tag: int) -> None:
+        if (slot := self._tag_to_slot.pop(unit_tag, None)) is not None:
+            self._ready_at[slot] = 0
+            self._free_slots.append(slot)
+
+    def ready_at(self, tags: Iterable[int]) -> np.ndarray:
+        """Frame the attack of each mine in `tags` is ready, 0 if it is."""
+        tag_to_slot: dict[int, int] = self._tag_to_slot
+        slots: np.ndarray = np.fromiter(
+            (tag_to_slot.get(tag, -1) for tag in tags), dtype=np.int64
+        )
+        return np.where(slots >= 0, self._ready_at[slots], 0)
+
+    def ready(
+        self, units: Union[Units, list[Unit], Iterable[int]], within: int = 0
+    ) -> np.ndarray:
+        """Mask of mines whose attack is ready, or will be in `within` frames.
+
+        Parameters
+        ----------
+        units :
+            Mines, or their tags.
+        within :
+            Also count mines that are ready this many frames from now.
+        """
+        tags: list[int] = [u if isinstance(u, int) else u.tag for u in units]
+        return self.ready_at(tags) <= self.ai.state.game_loop + within
+
+    def all_ready(
+        self, units: Union[Units, list[Unit], Iterable[int]], within: int = 0
+    ) -> bool:
+        """Are all of `units` ready to fire within `within` frames?"""
+        return bool(np.all(self.ready(units, within)))
+
+    def _slot(self, unit_tag: int) -> int:
+        if (slot := self._tag_to_slot.get(unit_tag, None)) is not None:
+            return slot
+        if not self._free_slots:
+            capacity: int = len(self._ready_at)
+            self._ready_at = np.concatenate(
+                [self._ready_at, np.zeros(capacity, dtype=np.int64)]
+            )
+            self._free_slots = list(range(2 * capacity - 1, capacity - 1, -1))
+        slot = self._free_slots.pop()
+        self._tag_to_slot[unit_tag] = slot
+        return slot
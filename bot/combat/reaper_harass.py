@@ -2,6 +2,7 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ares.behaviors.combat import CombatManeuver
 from ares.behaviors.combat.individual import (
     AMove,
@@ -21,20 +22,17 @@ from ares.consts import (
     EngagementResult,
 )
 from ares.managers.manager_mediator import ManagerMediator
-from cython_extensions import (
-    cy_center,
-    cy_closest_to,
-    cy_distance_to,
-    cy_distance_to_squared,
-)
+from cython_extensions import cy_center, cy_closest_to
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId as UnitID
 from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
-from bot.consts import COMMON_UNIT_IGNORE_TYPES
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.distance_matrix import EnemyGroup
+from bot.combat.enemy_columns import EnemyColumns, type_id_array
+from bot.combat.flow_field_path import path_unit_to_target
 
 if TYPE_CHECKING:
     from ares import AresBot
@@ -45,6 +43,27 @@ STATIC_DEFENCE: set[UnitID] = {
     UnitID.SPINECRAWLER,
     UnitID.PHOTONCANNON,
 }
+CREEP_TUMOR_IDS: np.ndarray = type_id_array(CREEP_TUMOR_TYPES)
+WORKER_IDS: np.ndarray = type_id_array(WORKER_TYPES)
+
+
+@dataclass
+class ReaperThreats:
+    """What `ReaperHarass._classify_threats` found near a reaper squad.
+
+    `grenade_targets` and `melee_close` have an entry per reaper, in the
+    order the reapers were passed in.
+    """
+
+    only_threats: list[Unit]
+    visible: list[Unit]
+    near_melee: list[Unit]
+    near_workers: list[Unit]
+    not_workers: list[Unit]
+    num_marines: int
+    only_queens: bool
+    grenade_targets: list[list[Unit]]
+    melee_close: np.ndarray
 
 
 @dataclass
@@ -68,6 +87,7 @@ class ReaperHarass(BaseCombat):
     mediator: ManagerMediator
     reaper_grenade_range: float = 5.0
 
+    @profile_execute
     def execute(self, units: Units | list[Unit], **kwargs) -> None:
         """Execute the Reaper harass.
 
@@ -99,61 +119,31 @@ class ReaperHarass(BaseCombat):
         reaper_grid = self.mediator.get_climber_grid
         squad_pos: tuple = cy_center(units)
 
-        only_threats: list[Unit] = [
-            u
-            for u in near_enemy
-            if (
-                (
-                    u.type_id not in ALL_STRUCTURES
-                    and (
-                        u.type_id not in COMMON_UNIT_IGNORE_TYPES
-                        or u.type_id == UnitID.MULE
-                    )
-                )
-                or (u.type_id in CREEP_TUMOR_TYPES and u.is_active)
-            )
-        ]
-        only_threats_without_memory: list[Unit] = [
-            u for u in only_threats if not u.is_memory
-        ]
-        near_lings: list[Unit] = [
-            t for t in only_threats_without_memory if t.type_id == UnitID.ZERGLING
-        ]
-        near_melee: list[Unit] = [
-            u
-            for u in only_threats_without_memory
-            if u.ground_range < 3.0
-            and cy_distance_to_squared(u.position, squad_pos) < 16.0
-        ]
-        near_workers: list[Unit] = [u for u in near_melee if u.type_id in WORKER_TYPES]
-        # early game and single lings, ignore them
-        if self.ai.time < 150.0 and len(near_lings) == 1 and len(only_threats) == 1:
-            only_threats = []
-
-        only_unit_threats_not_workers: list[Unit] = [
-            u for u in only_threats if u.type_id not in WORKER_TYPES
-        ]
-
-        only_queens: bool = all(u.type_id == UnitID.QUEEN for u in only_threats)
-        len_marines: int = len([u for u in only_threats if u.type_id == UnitID.MARINE])
-        take_marine_fight: bool = 0 < len_marines <= len(units)
+        threats: ReaperThreats = self._classify_threats(
+            self.ai.enemy_snapshot.columns_for(near_enemy), units, squad_pos
+        )
+        only_threats: list[Unit] = threats.only_threats
+        only_threats_without_memory: list[Unit] = threats.visible
+        near_melee: list[Unit] = threats.near_melee
+        near_workers: list[Unit] = threats.near_workers
+        only_unit_threats_not_workers: list[Unit] = threats.not_workers
+        take_marine_fight: bool = 0 < threats.num_marines <= len(units)
 
         heal_threshold: float = kwargs["heal_threshold"]
         if take_marine_fight:
-            if len_marines <= 2:
+            if threats.num_marines <= 2:
                 heal_threshold = 0.0
             else:
                 heal_threshold = 0.12
 
-        if only_queens or take_marine_fight:
+        if threats.only_queens or take_marine_fight:
             fight_result: EngagementResult = EngagementResult.VICTORY_CLOSE
         else:
             fight_result: EngagementResult = self.mediator.can_win_fight(
                 own_units=[
                     u
-                    for u in self.ai.units
-                    if cy_distance_to_squared(u.position, squad_pos) < 100
-                    and u.type_id not in WORKER_TYPES
+                    for u in self.ai.distance_matrix.own_near(squad_pos, 10.0)
+                    if u.type_id not in WORKER_TYPES
                 ],
                 enemy_units=only_unit_threats_not_workers,
             )
@@ -161,25 +151,16 @@ class ReaperHarass(BaseCombat):
         _can_engage: bool = fight_result not in LOSS_MARGINAL_OR_WORSE
         enemy_army = self.mediator.get_cached_enemy_army
 
-        for unit in units:
+        for i, unit in enumerate(units):
             target: Point2 = harass_target
             low_health: bool = unit.health_percentage <= heal_threshold
-            grenade_targets: list[Unit] = [
-                u
-                for u in only_threats_without_memory
-                if cy_distance_to(u.position, unit.position)
-                < self.reaper_grenade_range + unit.radius + u.radius
-            ]
+            grenade_targets: list[Unit] = threats.grenade_targets[i]
 
             harass_maneuver: CombatManeuver = CombatManeuver()
             # dodge biles, storms etc
             harass_maneuver.add(KeepUnitSafe(unit=unit, grid=avoidance_grid))
 
-            if not unit.is_attacking and [
-                u
-                for u in near_melee
-                if cy_distance_to_squared(u.position, unit.position) < 6.5
-            ]:
+            if not unit.is_attacking and threats.melee_close[i]:
                 harass_maneuver.add(KeepUnitSafe(unit=unit, grid=reaper_grid))
             # reaper grenade
             harass_maneuver.add(
@@ -244,11 +225,13 @@ class ReaperHarass(BaseCombat):
                         harass_maneuver.add(AMove(unit=unit, target=target))
                 else:
                     harass_maneuver.add(
-                        PathUnitToTarget(
-                            unit=unit,
-                            grid=reaper_grid,
-                            target=target,
+                        path_unit_to_target(
+                            self.ai,
+                            unit,
+                            reaper_grid,
+                            target,
                             success_at_distance=3.0,
+                            grid_name="climber",
                         )
                     )
 
@@ -290,11 +273,13 @@ class ReaperHarass(BaseCombat):
                                     KeepUnitSafe(unit=unit, grid=reaper_grid)
                                 )
                             harass_maneuver.add(
-                                PathUnitToTarget(
-                                    unit=unit,
-                                    grid=reaper_grid,
-                                    target=target,
+                                path_unit_to_target(
+                                    self.ai,
+                                    unit,
+                                    reaper_grid,
+                                    target,
                                     success_at_distance=5.0,
+                                    grid_name="climber",
                                 )
                             )
 
@@ -313,3 +298,80 @@ class ReaperHarass(BaseCombat):
             harass_maneuver.add(KeepUnitSafe(unit=unit, grid=reaper_grid))
 
             self.ai.register_behavior(harass_maneuver)
+
+    def _classify_threats(
+        self,
+        enemy: EnemyColumns,
+        units: Units | list[Unit],
+        squad_pos: tuple[float, float],
+    ) -> ReaperThreats:
+        """Sort the enemies near the squad once for every reaper in it.
+
+        Parameters
+        ----------
+        enemy :
+            Columns of everything near the reapers.
+        units :
+            The reapers.
+        squad_pos :
+            Center of the reapers.
+        """
+        threats_mask: np.ndarray = ~enemy.is_structure & (
+            ~enemy.is_ignored | (enemy.type_ids == UnitID.MULE.value)
+        )
+        # active creep tumors are worth chasing, only read those units
+        for i in np.flatnonzero(enemy.of_type(CREEP_TUMOR_IDS)):
+            threats_mask[i] = enemy.units[i].is_active
+        visible_mask: np.ndarray = threats_mask & ~enemy.is_memory
+        is_worker: np.ndarray = enemy.of_type(WORKER_IDS)
+
+        # early game and single lings, ignore them
+        num_lings: int = int(
+            np.count_nonzero(visible_mask & (enemy.type_ids == UnitID.ZERGLING.value))
+        )
+        if (
+            self.ai.time < 150.0
+            and num_lings == 1
+            and np.count_nonzero(threats_mask) == 1
+        ):
+            threats_mask = np.zeros(len(enemy), dtype=bool)
+
+        visible: list[Unit] = enemy.select(visible_mask)
+        group: EnemyGroup = self.ai.distance_matrix.group(visible)
+        ground_ranges: np.ndarray = np.array([u.ground_range for u in visible])
+        to_squad_sq: np.ndarray = np.sum((group.positions - squad_pos) ** 2, axis=1)
+        melee: np.ndarray = (ground_ranges < 3.0) & (to_squad_sq < 16.0)
+
+        # reapers x visible threats
+        distances_sq: np.ndarray = self.ai.distance_matrix.block(units, group)
+        reaper_radii: np.ndarray = np.array([u.radius for u in units])
+        in_grenade_range: np.ndarray = (
+            distances_sq
+            < (
+                self.reaper_grenade_range
+                + reaper_radii[:, np.newaxis]
+                + group.radii[np.newaxis, :]
+            )
+            ** 2
+        )
+        melee_close: np.ndarray = np.any(distances_sq[:, melee] < 6.5, axis=1)
+
+        return ReaperThreats(
+            only_threats=enemy.select(threats_mask),
+            visible=visible,
+            near_melee=[u for u, m in zip(visible, melee) if m],
+            near_workers=[
+                u for u, m in zip(visible, melee & is_worker[visible_mask]) if m
+            ],
+            not_workers=enemy.select(threats_mask & ~is_worker),
+            num_marines=int(
+                np.count_nonzero(threats_mask & (enemy.type_ids == UnitID.MARINE.value))
+            ),
+            only_queens=bool(
+                np.all(enemy.type_ids[threats_mask] == UnitID.QUEEN.value)
+            ),
+            grenade_targets=[
+                [visible[j] for j in np.flatnonzero(row)] for row in in_grenade_range
+            ],
+            melee_close=melee_close,
+        )
@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Union
 
 import numpy as np
 from ares.behaviors.combat import CombatManeuver
-from ares.behaviors.combat.individual import KeepUnitSafe, PathUnitToTarget, UseAbility
+from ares.behaviors.combat.individual import KeepUnitSafe, UseAbility
 from ares.managers.manager_mediator import ManagerMediator
 from cython_extensions.geometry import cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
@@ -13,7 +13,8 @@ from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.flow_field_path import path_unit_to_target
 
 if TYPE_CHECKING:
     from ares import AresBot
@@ -45,6 +46,7 @@ class SCVProxyBuilder(BaseCombat):
     config: dict
     mediator: ManagerMediator
 
+    @profile_execute
     def execute(self, units: Union[list[Unit], Units], **kwargs) -> None:
         target: Point2 = kwargs["target"]
         next_item_to_build: UnitTypeId | None = kwargs["next_item_to_build"]
@@ -75,7 +77,9 @@ class SCVProxyBuilder(BaseCombat):
                     )
                 else:
                     proxy_maneuver.add(
-                        PathUnitToTarget(unit=unit, target=build_location, grid=grid)
+                        path_unit_to_target(
+                            self.ai, unit, grid, build_location, grid_name="ground"
+                        )
                     )
             else:
                 if unit.tag != primary_builder_tag or (
@@ -84,8 +88,13 @@ class SCVProxyBuilder(BaseCombat):
                 ):
                     proxy_maneuver.add(KeepUnitSafe(unit=unit, grid=grid))
                 proxy_maneuver.add(
-                    PathUnitToTarget(
-                        unit=unit, target=target, grid=grid, success_at_distance=4.0
+                    path_unit_to_target(
+                        self.ai,
+                        unit,
+                        grid,
+                        target,
+                        success_at_distance=4.0,
+                        grid_name="ground",
                     )
                 )
                 if unit.tag == primary_builder_tag:
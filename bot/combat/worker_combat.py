@@ -6,7 +6,6 @@ from ares.behaviors.combat import CombatManeuver
 from ares.behaviors.combat.individual import (
     AttackTarget,
     KeepUnitSafe,
-    PathUnitToTarget,
     ShootTargetInRange,
     WorkerKiteBack,
 )
@@ -17,7 +16,8 @@ from sc2.position import Point2
 from sc2.unit import Unit
 from sc2.units import Units
 
-from bot.combat.base_combat import BaseCombat
+from bot.combat.base_combat import BaseCombat, profile_execute
+from bot.combat.flow_field_path import path_unit_to_target
 from bot.consts import SUPPLY_TYPES
 
 if TYPE_CHECKING:
@@ -42,6 +42,7 @@ class WorkerCombat(BaseCombat):
     config: dict
     mediator: ManagerMediator
 
+    @profile_execute
     def execute(self, units: Union[list[Unit], Units], **kwargs) -> None:
         close_enemy: Units = kwargs["all_close_enemy"]
         target: Point2 = (
@@ -53,14 +54,7 @@ class WorkerCombat(BaseCombat):
         avoid_grid: np.ndarray = self.mediator.get_air_avoidance_grid
         grid: np.ndarray = self.mediator.get_ground_grid
         can_attack_structures: bool = self.ai.time > 90.0 or ramp_walled_off
-        close_enemy: list[Unit] = [
-            u
-            for u in close_enemy
-            if (not u.is_cloaked or u.is_cloaked and u.is_revealed)
-            and (not u.is_burrowed or u.is_burrowed and u.is_visible)
-            and not u.is_memory
-            and not u.is_snapshot
-        ]
+        close_enemy: list[Unit] = self.ai.enemy_snapshot.valid(close_enemy)
 
         only_enemy_units: list[Unit] = [
             u for u in close_enemy if u.type_id not in ALL_STRUCTURES
@@ -98,8 +92,8 @@ class WorkerCombat(BaseCombat):
                     attacking_maneuver.add(AttackTarget(unit=unit, target=target_unit))
 
             attacking_maneuver.add(
-                PathUnitToTarget(
-                    unit=unit, target=target, grid=grid, sense_danger=False
+                path_unit_to_target(
+                    self.ai, unit, grid, target, sense_danger=False, grid_name="ground"
                 )
             )
             self.ai.register_behavior(attacking_maneuver)
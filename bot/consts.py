@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 from sc2.ids.unit_typeid import UnitTypeId as UnitID
 
@@ -11,6 +11,17 @@ class ProxySCVStatus(str, Enum):
     Repairing = "repairing"
 
 
+class SchedulePriority(IntEnum):
+    """How readily a scheduled subsystem is deferred when a step runs long."""
+
+    # never deferred
+    Critical = 0
+    # deferred once the step budget is used up
+    Normal = 1
+    # deferred once `LOW_PRIORITY_BUDGET_SHARE` of the budget is used
+    Low = 2
+
+
 ATTACK_TARGET_IGNORE: set[UnitID] = {
     UnitID.SCV,
     UnitID.DRONE,
@@ -66,8 +77,47 @@ UNIT_TYPE_TO_NUM_REPAIRERS: dict[UnitID, int] = {
     UnitID.WIDOWMINEBURROWED: 1,
 }
 
+# injured units further than this (squared) from our main are not repaired
+REPAIR_ZONE_DISTANCE_SQ: float = 2000.0
+
 SUPPLY_TYPES: set[UnitID] = {
     UnitID.SUPPLYDEPOTLOWERED,
     UnitID.SUPPLYDEPOT,
     UnitID.PYLON,
 }
+
+# cadences understood by `bot.utils.scheduler.Scheduler`, besides N game loops
+EVERY_STEP: int = 0
+ON_EVENT: int = -1
+
+# game loops between two runs of each scheduled subsystem (22.4 loops a second)
+# override any of these in the `Scheduler` block of `config.yml`
+SCHEDULE_INTERVALS: dict[str, int] = {
+    "repair_assignment": 8,
+    "mules": 16,
+    "bunker_scouting": 16,
+    "lower_depots": 32,
+    "macro_plan": 4,
+    "drop_assignment": 16,
+    "defensive_mine_assignment": 16,
+    "tank_assignment": 32,
+    "wall_off_check": 20,
+}
+
+# subsystems not listed here are `SchedulePriority.Critical`
+SCHEDULE_PRIORITIES: dict[str, SchedulePriority] = {
+    "repair_assignment": SchedulePriority.Normal,
+    "drop_assignment": SchedulePriority.Normal,
+    "mules": SchedulePriority.Low,
+    "bunker_scouting": SchedulePriority.Low,
+    "lower_depots": SchedulePriority.Low,
+    "macro_plan": SchedulePriority.Low,
+    "defensive_mine_assignment": SchedulePriority.Low,
+    "tank_assignment": SchedulePriority.Low,
+}
+
+# share of a step's wall time the bot aims to stay under, see `Scheduler`
+STEP_BUDGET_SHARE: float = 0.8
+LOW_PRIORITY_BUDGET_SHARE: float = 0.5
+# a subsystem is run regardless of the budget after being deferred this often
+MAX_CONSECUTIVE_DEFERRALS: int = 8
@@ -1,37 +1,47 @@
-import importlib
 import math
+import re
+from os import makedirs, path
+from time import strftime
 from typing import Any, Optional
 
 import numpy as np
 from ares import AresBot
 from ares.behaviors.combat.individual import KeepUnitSafe
 from ares.behaviors.macro.mining import Mining
-from ares.consts import ALL_STRUCTURES, TOWNHALL_TYPES, UnitRole
+from ares.consts import ALL_STRUCTURES, UnitRole
 from cython_extensions import cy_closest_to, cy_distance_to_squared, cy_towards
 from loguru import logger
-from sc2.data import Race
+from s2clientprotocol import sc2api_pb2 as sc_pb
+from sc2.data import Race, Result
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.position import Point2
 from sc2.unit import Unit
 
-from bot.consts import UNIT_TYPE_TO_NUM_REPAIRERS
-
-
-def _to_snake(name: str) -> str:
-    # Convert e.g. "OneBaseTempest" -> "one_base_tempest"
-    out = []
-    for i, c in enumerate(name):
-        if i > 0:
-            prev = name[i - 1]
-            nxt = name[i + 1] if i + 1 < len(name) else ""
-            if c.isupper() and (
-                (not prev.isupper())  # lower->Upper
-                or (prev.isupper() and nxt and not nxt.isupper())  # UPPER->UpperLower
-            ):
-                out.append("_")
-        out.append(c.lower())
-    return "".join(out)
+from bot.combat.distance_matrix import DistanceMatrix
+from bot.combat.enemy_snapshot import EnemySnapshot
+from bot.combat.mine_cooldowns import MineCooldowns
+from bot.consts import REPAIR_ZONE_DISTANCE_SQ, UNIT_TYPE_TO_NUM_REPAIRERS
+from bot.openings.opening_registry import (
+    SWITCH_TARGETS,
+    OpeningRegistry,
+    opening_names_from_builds_file,
+)
+from bot.utils.command_filter import CommandFilter
+from bot.utils.flow_field import FlowFieldService
+from bot.utils.grid_versions import GridVersionTracker
+from bot.utils.map_cache import MAP_CACHE_DIR, MapCache
+from bot.utils.observation_recorder import ObservationRecorder
+from bot.utils.path_cache import PathCache
+from bot.utils.safe_spots import SafeSpotCache
+from bot.utils.scheduler import Scheduler, step_budget
+from bot.utils.step_profiler import StepProfiler
+from bot.utils.structure_index import StructureIndex
+from bot.utils.worker_selector import WorkerRequest, select_workers
+
+RECORDINGS_DIR: str = path.join("data", "recordings")
+# steps faster than this (ms) leave room to warm up an opening
+IDLE_STEP_TIME_MS: float = 10.0
 
 
 class MyBot(AresBot):
@@ -49,53 +59,110 @@ class MyBot(AresBot):
         self.opening_chat_tag: bool = False
         self._switched_to_prevent_tie: bool = False
         self.injured_general_unit_to_repairing_scvs: dict[int, set[int]] = dict()
+        # injured units that might need repair, fed by `on_unit_took_damage`
+        self._repair_candidate_tags: set[int] = set()
+        # tag -> (position when checked, inside repair zone?)
+        self._repair_zone_membership: dict[int, tuple[Point2, bool]] = dict()
+        # townhall tag -> (townhall position, tags of mineral fields nearby)
+        self._townhall_to_mineral_tags: dict[int, tuple[Point2, list[int]]] = dict()
         self._terran_bunker_finder_activated: bool = False
         self._switched_due_to_worker_rush: bool = False
-
-    def load_opening(self, opening_name: str) -> None:
-        """Load opening from bot.openings.<snake_case> with class <PascalCase>"""
-        module_path = f"bot.openings.{_to_snake(opening_name)}"
-        module = importlib.import_module(module_path)
-        opening_cls = getattr(module, opening_name, None)
-        if opening_cls is None:
-            raise ImportError(
-                f"Opening class '{opening_name}' not found in '{module_path}'"
-            )
-        self.opening_handler = opening_cls()
+        # enemy units read once per frame and shared by the combat classes
+        self.enemy_snapshot: EnemySnapshot = EnemySnapshot(self)
+        self.distance_matrix: DistanceMatrix = DistanceMatrix(self)
+        self.mine_cooldowns: MineCooldowns = MineCooldowns(self)
+        # replaced in `on_start` once the config has been read
+        self.step_profiler: StepProfiler = StepProfiler()
+        self.scheduler: Scheduler = Scheduler(self)
+        self.command_filter: CommandFilter = CommandFilter(self)
+        self.grid_versions: GridVersionTracker = GridVersionTracker(self)
+        self.flow_fields: FlowFieldService = FlowFieldService(self, self.grid_versions)
+        self.path_cache: PathCache = PathCache(self, self.grid_versions)
+        self.safe_spots: SafeSpotCache = SafeSpotCache(self, self.grid_versions)
+        self.structure_index: StructureIndex = StructureIndex(self)
+        # needs the game info, created in `on_start`
+        self.map_cache: Optional[MapCache] = None
+        self.observation_recorder: Optional[ObservationRecorder] = None
+        self.opening_registry: OpeningRegistry = OpeningRegistry(self)
 
     async def on_start(self) -> None:
         await super(MyBot, self).on_start()
+        self.step_profiler = StepProfiler(self.config.get("StepProfiler", False))
+        budget_ms: Optional[float] = self.config.get("StepBudgetMs", None)
+        self.scheduler = Scheduler(
+            self,
+            self.config.get("Scheduler", None),
+            self.client.game_step,
+            budget=(
+                budget_ms / 1000.0
+                if budget_ms
+                else step_budget(self.client.game_step, self.realtime)
+            ),
+        )
+        self.flow_fields.enabled = self.config.get("FlowFieldPathing", False)
+        self.path_cache.enabled = self.config.get("PathCache", False)
+        self.safe_spots.enabled = self.config.get("SafeSpotCache", True)
+        self.map_cache = MapCache(
+            self, MAP_CACHE_DIR if self.config.get("MapCache", True) else None
+        )
+        if self.config.get("RecordObservations", False):
+            await self._start_observation_recorder()
         # Ares has initialized BuildOrderRunner at this point
         try:
-            self.load_opening(self.build_order_runner.chosen_opening)
-            if hasattr(self.opening_handler, "on_start"):
-                await self.opening_handler.on_start(self)
+            self.opening_registry.register(
+                opening_names_from_builds_file(f"{self.race.name.lower()}_builds.yml")
+            )
+            self.opening_handler = await self.opening_registry.get(
+                self.build_order_runner.chosen_opening
+            )
+            # mid-game switches should never have to load anything
+            self.opening_registry.register(list(SWITCH_TARGETS))
+            await self.opening_registry.warm_up(list(SWITCH_TARGETS))
+            if not self.opening_registry.has_pending:
+                self.opening_registry.log_load_times()
         except Exception as exc:
             print(f"Failed to load opening: {exc}")
 
     async def on_step(self, iteration: int) -> None:
-        await super(MyBot, self).on_step(iteration)
+        if self.observation_recorder:
+            self.observation_recorder.record_step(
+                self.state.response_observation, self.game_info.pathing_grid._proto
+            )
+        scheduler: Scheduler = self.scheduler
+        scheduler.start_step()
+        profiler: StepProfiler = self.step_profiler
+        profiler.start_step()
+        await profiler.measure_async(
+            "ares_on_step", super(MyBot, self).on_step(iteration)
+        )
         if self.supply_used < 1:
             await self.client.leave()
 
         num_per_gas: int = 3 if self.supply_workers >= 13 else 0
-        self.register_behavior(Mining(workers_per_gas=num_per_gas))
+        profiler.measure(
+            "mining", self.register_behavior, Mining(workers_per_gas=num_per_gas)
+        )
 
-        self._mules()
-        self._general_repair()
-        if self.build_order_runner.chosen_opening != "WorkerRush":
-            self._look_for_terran_bunker()
+        profiler.measure("_general_repair", self._general_repair)
 
         if self.opening_handler and hasattr(self.opening_handler, "on_step"):
-            await self.opening_handler.on_step()
+            await profiler.measure_async(
+                "opening_on_step", self.opening_handler.on_step()
+            )
+
+        # low priority, after the opening so a slow step can defer them
+        if scheduler.due("mules"):
+            profiler.measure("_mules", self._mules)
+        if self.build_order_runner.chosen_opening != "WorkerRush" and scheduler.due(
+            "bunker_scouting"
+        ):
+            profiler.measure("_look_for_terran_bunker", self._look_for_terran_bunker)
 
         if (
             not self._switched_due_to_worker_rush
             and self.mediator.get_enemy_worker_rushed
         ):
-            self.load_opening("WorkerRush")
-            if hasattr(self.opening_handler, "on_start"):
-                await self.opening_handler.on_start(self)
+            self.opening_handler = await self.opening_registry.get("WorkerRush")
             self.build_order_runner.set_build_completed()
             self.mediator.get_building_tracker_dict.clear()
             self._switched_due_to_worker_rush = True
@@ -110,15 +177,13 @@ class MyBot(AresBot):
 
         if not self._switched_to_prevent_tie and self.floating_enemy:
             self._switched_to_prevent_tie = True
-            self.load_opening("BattleCruiserRush")
-            if hasattr(self.opening_handler, "on_start"):
-                await self.opening_handler.on_start(self)
+            self.opening_handler = await self.opening_registry.get("BattleCruiserRush")
             for worker in self.workers:
                 self.mediator.assign_role(tag=worker.tag, role=UnitRole.GATHERING)
 
             await self.chat_send(f"Tag: {self.time_formatted}_switched_to_prevent_tie")
 
-        if iteration % 16 == 0:
+        if scheduler.due("lower_depots"):
             own_structures_dict = self.mediator.get_own_structures_dict
             depots: list[Unit] = own_structures_dict[UnitTypeId.SUPPLYDEPOT]
             for depot in depots:
@@ -127,6 +192,59 @@ class MyBot(AresBot):
                 if depot.type_id == UnitTypeId.SUPPLYDEPOT:
                     depot(AbilityId.MORPH_SUPPLYDEPOT_LOWER)
 
+        # start the remaining openings one at a time while steps are cheap
+        if (
+            self.opening_registry.has_pending
+            and self.step_time[3] < IDLE_STEP_TIME_MS
+            and not await self.opening_registry.warm_next()
+        ):
+            self.opening_registry.log_load_times()
+
+        self.actions[:] = profiler.measure(
+            "command_filter", self.command_filter.filter, self.actions
+        )
+        profiler.end_step()
+        scheduler.end_step()
+
+    async def on_end(self, game_result: Result) -> None:
+        await super(MyBot, self).on_end(game_result)
+        self.step_profiler.log_summary()
+        self.scheduler.log_summary()
+        self.command_filter.log_summary()
+        self.path_cache.log_summary()
+        self.safe_spots.log_summary()
+        if self.observation_recorder:
+            self.observation_recorder.close()
+
+    async def _start_observation_recorder(self) -> None:
+        """Record this game for `scripts/replay_observations.py`."""
+        makedirs(RECORDINGS_DIR, exist_ok=True)
+        map_name: str = re.sub(r"[^\w\-]", "_", self.game_info.map_name)
+        file_path: str = path.join(
+            RECORDINGS_DIR, f"{map_name}_{strftime('%Y%m%d_%H%M%S')}.sc2obs"
+        )
+        # `GameData` doesn't keep the raw response, so ask for it again
+        response: sc_pb.Response = await self.client._execute(
+            data=sc_pb.RequestData(
+                ability_id=True,
+                unit_type_id=True,
+                upgrade_id=True,
+                buff_id=True,
+                effect_id=True,
+            )
+        )
+        self.observation_recorder = ObservationRecorder(file_path)
+        self.observation_recorder.record_start(
+            meta={
+                "player_id": self.player_id,
+                "base_build": self.base_build,
+                "chosen_opening": self.build_order_runner.chosen_opening,
+            },
+            game_data=response.data,
+            game_info=self.game_info._proto,
+            observation=self.state.response_observation,
+        )
+
     async def on_unit_created(self, unit: Unit) -> None:
         await super(MyBot, self).on_unit_created(unit)
         if unit.type_id == UnitTypeId.REAPER:
@@ -142,56 +260,112 @@ class MyBot(AresBot):
         if unit.health < compare_health:
             self.mediator.cancel_structure(structure=unit)
 
+        if unit.type_id in UNIT_TYPE_TO_NUM_REPAIRERS:
+            self._repair_candidate_tags.add(unit.tag)
+            # a bunker under fire shouldn't wait for the next scheduled pass
+            if unit.type_id == UnitTypeId.BUNKER:
+                self.scheduler.trigger("repair_assignment")
+
+    def select_workers(self, requests: list[WorkerRequest]) -> list[list[Unit]]:
+        """Batched alternative to `mediator.select_worker`.
+
+        All requests are solved together from the gathering workers, see
+        `bot.utils.worker_selector.select_workers`. Roles are left untouched,
+        callers assign them to the returned workers.
+        """
+        return select_workers(
+            self.mediator.get_units_from_role(
+                role=UnitRole.GATHERING, unit_type=self.worker_type
+            ),
+            requests,
+        )
+
     def _general_repair(self) -> None:
         self._execute_scv_to_general_repair()
-
-        for unit in self.all_own_units:
-            type_id: UnitTypeId = unit.type_id
-            if (
-                unit.health_percentage >= 1.0
-                or not unit.is_ready
-                or (cy_distance_to_squared(unit.position, self.start_location) > 2000.0)
-                or type_id not in UNIT_TYPE_TO_NUM_REPAIRERS
-            ):
-                continue
-            if type_id in ALL_STRUCTURES and unit.health_percentage > 0.95:
+        if not self.scheduler.due("repair_assignment"):
+            return
+
+        # only units that took damage are candidates, see `on_unit_took_damage`
+        repair_requests: list[tuple[Unit, int]] = []
+        for tag in list(self._repair_candidate_tags):
+            unit: Optional[Unit] = self.unit_tag_dict.get(tag, None)
+            if not unit or unit.health_percentage >= 1.0:
+                self._repair_candidate_tags.discard(tag)
+                self._repair_zone_membership.pop(tag, None)
                 continue
 
-            if type_id == UnitTypeId.BUNKER and not unit.has_cargo:
+            if not self._requires_repair(unit):
                 continue
 
-            if type_id in UNIT_TYPE_TO_NUM_REPAIRERS:
-                if (
-                    unit.is_structure
-                    and type_id not in TOWNHALL_TYPES
-                    and cy_distance_to_squared(unit.position, self.start_location)
-                    > 6500
-                ):
-                    continue
-                if type_id == UnitTypeId.HELLION and self.enemy_race == Race.Terran:
-                    continue
-                num_scvs_required: int = UNIT_TYPE_TO_NUM_REPAIRERS[unit.type_id]
-                if unit.tag in self.injured_general_unit_to_repairing_scvs:
-                    num_scvs_required -= len(
-                        self.injured_general_unit_to_repairing_scvs[unit.tag]
-                    )
-                for _ in range(num_scvs_required):
-                    if worker := self.mediator.select_worker(
-                        target_position=unit.position,
-                        force_close=True,
-                        min_health_perc=0.45,
-                    ):
-                        if unit.tag in self.injured_general_unit_to_repairing_scvs:
-                            self.injured_general_unit_to_repairing_scvs[unit.tag].add(
-                                worker.tag
-                            )
-                        else:
-                            self.injured_general_unit_to_repairing_scvs[unit.tag] = {
-                                worker.tag
-                            }
-                        self.mediator.assign_role(
-                            tag=worker.tag, role=UnitRole.REPAIRING
-                        )
+            num_scvs_required: int = UNIT_TYPE_TO_NUM_REPAIRERS[unit.type_id]
+            if tag in self.injured_general_unit_to_repairing_scvs:
+                num_scvs_required -= len(
+                    self.injured_general_unit_to_repairing_scvs[tag]
+                )
+            if num_scvs_required > 0:
+                repair_requests.append((unit, num_scvs_required))
+
+        if repair_requests:
+            self._dispatch_repairers(repair_requests)
+
+    def _requires_repair(self, unit: Unit) -> bool:
+        type_id: UnitTypeId = unit.type_id
+        if not unit.is_ready or not self._in_repair_zone(unit):
+            return False
+        if type_id in ALL_STRUCTURES and unit.health_percentage > 0.95:
+            return False
+        if type_id == UnitTypeId.BUNKER and not unit.has_cargo:
+            return False
+        if type_id == UnitTypeId.HELLION and self.enemy_race == Race.Terran:
+            return False
+        return True
+
+    def _in_repair_zone(self, unit: Unit) -> bool:
+        """Is `unit` close enough to our main to pull workers for repair?
+
+        Membership is cached per tag and only recalculated once the unit has
+        moved, so structures are checked a single time.
+        """
+        position: Point2 = unit.position
+        if cached := self._repair_zone_membership.get(unit.tag, None):
+            cached_position, in_zone = cached
+            if cached_position == position:
+                return in_zone
+
+        in_zone: bool = (
+            cy_distance_to_squared(position, self.start_location)
+            <= REPAIR_ZONE_DISTANCE_SQ
+        )
+        self._repair_zone_membership[unit.tag] = (position, in_zone)
+        return in_zone
+
+    def _dispatch_repairers(self, repair_requests: list[tuple[Unit, int]]) -> None:
+        """Assign repairing SCVs to every injured unit collected this step.
+
+        Parameters
+        ----------
+        repair_requests :
+            Injured unit and the number of extra SCVs it needs.
+        """
+        selected: list[list[Unit]] = self.select_workers(
+            [
+                WorkerRequest(
+                    target_position=unit.position,
+                    num_workers=num_scvs_required,
+                    min_health_perc=0.45,
+                    force_close=True,
+                )
+                for unit, num_scvs_required in repair_requests
+            ]
+        )
+        for (unit, _), workers in zip(repair_requests, selected):
+            if not workers:
+                continue
+            if unit.tag not in self.injured_general_unit_to_repairing_scvs:
+                self.injured_general_unit_to_repairing_scvs[unit.tag] = set()
+            for worker in workers:
+                self.injured_general_unit_to_repairing_scvs[unit.tag].add(worker.tag)
+                self.mediator.assign_role(tag=worker.tag, role=UnitRole.REPAIRING)
 
     def _execute_scv_to_general_repair(self):
         """ """
@@ -252,16 +426,52 @@ class MyBot(AresBot):
         structures_dict: dict[
             UnitTypeId, list[Unit]
         ] = self.mediator.get_own_structures_dict
-        for oc in [s for s in structures_dict[oc_id] if s.energy >= 50]:
-            mfs: list[Unit] = [
-                mf
-                for mf in self.mineral_field
-                if cy_distance_to_squared(mf.position, oc.position) < 100.0
-            ]
+        ocs: list[Unit] = [s for s in structures_dict[oc_id] if s.energy >= 50]
+        if not ocs:
+            return
+
+        for oc in ocs:
+            mfs: list[Unit] = self._townhall_mineral_fields(oc)
             if mfs:
                 mf: Unit = max(mfs, key=lambda x: x.mineral_contents)
                 oc(AbilityId.CALLDOWNMULE_CALLDOWNMULE, mf)
 
+    def _townhall_mineral_fields(self, townhall: Unit) -> list[Unit]:
+        """Mineral fields within 10 range of `townhall`.
+
+        Field tags are calculated the first time a townhall is seen at a
+        position, and a tag is dropped once its field has depleted. Entries
+        of destroyed townhalls are removed in `on_unit_destroyed`.
+
+        Parameters
+        ----------
+        townhall :
+            The townhall to look up.
+        """
+        position: Point2 = townhall.position
+        cached: Optional[tuple[Point2, list[int]]] = self._townhall_to_mineral_tags.get(
+            townhall.tag, None
+        )
+        # townhalls may have been lifted and landed elsewhere
+        if not cached or cached[0] != position:
+            tags: list[int] = [
+                mf.tag
+                for mf in self.mineral_field
+                if cy_distance_to_squared(mf.position, position) < 100.0
+            ]
+            self._townhall_to_mineral_tags[townhall.tag] = (position, tags)
+        else:
+            tags: list[int] = cached[1]
+
+        unit_tag_dict: dict[int, Unit] = self.unit_tag_dict
+        mfs: list[Unit] = [unit_tag_dict[tag] for tag in tags if tag in unit_tag_dict]
+        if len(mfs) != len(tags):
+            self._townhall_to_mineral_tags[townhall.tag] = (
+                position,
+                [mf.tag for mf in mfs],
+            )
+        return mfs
+
     def _look_for_terran_bunker(self):
         # when core is ready have a look around for proxies
         if (
@@ -349,12 +559,23 @@ class MyBot(AresBot):
     Examples:
     """
 
-    #
-    # async def on_end(self, game_result: Result) -> None:
-    #     await super(MyBot, self).on_end(game_result)
-    #
-    #     # custom on_end logic here ...
-    #
+    async def on_building_construction_started(self, unit: Unit) -> None:
+        await super(MyBot, self).on_building_construction_started(unit)
+        self.structure_index.on_structure_added(unit)
+
+    async def on_unit_type_changed(self, unit: Unit, previous_type: UnitTypeId) -> None:
+        await super(MyBot, self).on_unit_type_changed(unit, previous_type)
+        self.structure_index.on_structure_type_changed(unit)
+
+    async def on_unit_destroyed(self, unit_tag: int) -> None:
+        await super(MyBot, self).on_unit_destroyed(unit_tag)
+        self.structure_index.on_unit_destroyed(unit_tag)
+        self.mine_cooldowns.on_unit_destroyed(unit_tag)
+        self._townhall_to_mineral_tags.pop(unit_tag, None)
+
+        if self.opening_handler and hasattr(self.opening_handler, "on_unit_destroyed"):
+            self.opening_handler.on_unit_destroyed(unit_tag)
+
     async def on_building_construction_complete(self, unit: Unit) -> None:
         await super(MyBot, self).on_building_construction_complete(unit)
 
@@ -371,11 +592,6 @@ class MyBot(AresBot):
     #
     #     # custom on_unit_created logic here ...
     #
-    # async def on_unit_destroyed(self, unit_tag: int) -> None:
-    #     await super(MyBot, self).on_unit_destroyed(unit_tag)
-    #
-    #     # custom on_unit_destroyed logic here ...
-    #
     # async def on_unit_took_damage(self, unit: Unit, amount_damage_taken: float) -> None:
     #     await super(MyBot, self).on_unit_took_damage(unit, amount_damage_taken)
     #
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from ares import AresBot
 from ares.consts import (
     ALL_STRUCTURES,
@@ -15,6 +17,7 @@ from sc2.unit import Unit
 from sc2.units import Units
 
 from bot.combat.base_combat import BaseCombat
+from bot.combat.distance_matrix import DistanceMatrix, EnemyGroup
 from bot.combat.ground_range_combat import GroundRangeCombat
 from bot.consts import BIO_FORCES, COMMON_UNIT_IGNORE_TYPES
 from bot.openings.opening_base import OpeningBase
@@ -27,16 +30,32 @@ STATIC_DEFENCE: set[UnitTypeId] = {
 }
 
 
+@dataclass
+class FightMemo:
+    """Last `can_win_fight` result for a squad and the fight it was run on."""
+
+    own_tags: set[int]
+    enemy_tags: set[int]
+    own_health: float
+    enemy_health: float
+    result: EngagementResult
+    game_loop: int
+
+
 class Bio(OpeningBase):
     _ground_range_combat: BaseCombat
 
     SQUAD_ENGAGE_THRESHOLD: set[EngagementResult] = VICTORY_CLOSE_OR_BETTER
     SQUAD_DISENGAGE_THRESHOLD: set[EngagementResult] = LOSS_MARGINAL_OR_WORSE
+    FIGHT_MEMO_COMPOSITION_DELTA: float = 0.1
+    FIGHT_MEMO_HEALTH_DELTA: float = 0.1
+    FIGHT_MEMO_MAX_AGE: int = 44
 
     def __init__(self):
         super().__init__()
 
         self._squad_id_to_engage_tracker: dict = dict()
+        self._squad_id_to_fight_memo: dict[str, FightMemo] = dict()
 
     async def on_start(self, ai: AresBot) -> None:
         await super().on_start(ai)
@@ -57,6 +76,14 @@ class Bio(OpeningBase):
         attackers: Units = self.ai.mediator.get_units_from_role(
             role=UnitRole.ATTACKING, unit_type=BIO_FORCES
         )
+        # forget fights of squads that no longer exist
+        if len(self._squad_id_to_fight_memo) > len(squads):
+            squad_ids: set[str] = {squad.squad_id for squad in squads}
+            self._squad_id_to_fight_memo = {
+                squad_id: memo
+                for squad_id, memo in self._squad_id_to_fight_memo.items()
+                if squad_id in squad_ids
+            }
         if len(squads) > 0:
             pos_of_main_squad: Point2 = self.ai.mediator.get_position_of_main_squad(
                 role=UnitRole.ATTACKING
@@ -115,11 +142,10 @@ class Bio(OpeningBase):
         ]
 
         # something near a sieged tank, engage
-        for t in tanks:
-            close_threats: list[Unit] = [
-                e for e in only_units if cy_distance_to(e.position, t.position) < 8.5
-            ]
-            if len(close_threats) > 0:
+        if tanks:
+            distances: DistanceMatrix = self.ai.distance_matrix
+            threats: EnemyGroup = distances.group(only_units)
+            if any(distances.any_within(t, threats, 8.5) for t in tanks):
                 self._squad_id_to_engage_tracker[squad_id] = True
                 return
 
@@ -129,8 +155,8 @@ class Bio(OpeningBase):
             and not a.is_flying
         )
 
-        fight_result: EngagementResult = self.ai.mediator.can_win_fight(
-            own_units=own_attackers_nearby, enemy_units=only_units
+        fight_result: EngagementResult = self._fight_result(
+            squad_id, own_attackers_nearby, only_units
         )
 
         # currently engaging, see if we should disengage
@@ -140,3 +166,50 @@ class Bio(OpeningBase):
         # not engaging, check if we can
         elif fight_result in self.SQUAD_ENGAGE_THRESHOLD:
             self._squad_id_to_engage_tracker[squad.squad_id] = True
+
+    def _fight_result(
+        self, squad_id: str, own_units: Units, enemy_units: list[Unit]
+    ) -> EngagementResult:
+        """`can_win_fight`, reusing the last result while the fight is unchanged.
+
+        The simulation is only run again when more than
+        `FIGHT_MEMO_COMPOSITION_DELTA` of the units on either side have
+        entered or left, either side's total health has shifted by more than
+        `FIGHT_MEMO_HEALTH_DELTA`, or the memo is older than
+        `FIGHT_MEMO_MAX_AGE` game loops.
+        """
+        own_tags: set[int] = {u.tag for u in own_units}
+        enemy_tags: set[int] = {u.tag for u in enemy_units}
+        own_health: float = sum(u.health + u.shield for u in own_units)
+        enemy_health: float = sum(u.health + u.shield for u in enemy_units)
+        game_loop: int = self.ai.state.game_loop
+
+        memo: FightMemo | None = self._squad_id_to_fight_memo.get(squad_id)
+        if (
+            memo
+            and game_loop - memo.game_loop <= self.FIGHT_MEMO_MAX_AGE
+            and not self._composition_changed(memo.own_tags, own_tags)
+            and not self._composition_changed(memo.enemy_tags, enemy_tags)
+            and not self._health_changed(memo.own_health, own_health)
+            and not self._health_changed(memo.enemy_health, enemy_health)
+        ):
+            self.ai.step_profiler.increment("bio_fight_memo_hits")
+            return memo.result
+
+        result: EngagementResult = self.ai.mediator.can_win_fight(
+            own_units=own_units, enemy_units=enemy_units
+        )
+        self._squad_id_to_fight_memo[squad_id] = FightMemo(
+            own_tags, enemy_tags, own_health, enemy_health, result, game_loop
+        )
+        return result
+
+    def _composition_changed(self, previous: set[int], current: set[int]) -> bool:
+        if not previous or not current:
+            return previous != current
+        return len(previous ^ current) > self.FIGHT_MEMO_COMPOSITION_DELTA * max(
+            len(previous), len(current)
+        )
+
+    def _health_changed(self, previous: float, current: float) -> bool:
+        return abs(current - previous) > previous * self.FIGHT_MEMO_HEALTH_DELTA
@@ -22,6 +22,7 @@ from sc2.units import Units
 from src.ares.consts import UnitRole
 
 from bot.combat.base_combat import BaseCombat
+from bot.combat.drop_assignments import DropAssignments
 from bot.combat.medivac_mine_drops import MedivacMineDrops
 from bot.combat.mine_combat import MineCombat
 from bot.openings.bio import Bio
@@ -54,8 +55,7 @@ class MassMine(OpeningBase):
 
     def __init__(self):
         super().__init__()
-        # {med_tag: {"mine_tags": {tag1, tag2, ...}, "target": Point2(...)}}
-        self._medivac_tag_to_mine_tracker: dict[int, dict] = dict()
+        self._mine_drops_assigned: DropAssignments = DropAssignments()
         self.MIN_HEALTH_MEDIVAC_PERC: float = 0.3
         # Track which bases have defense mines: {townhall_tag: [mine_tag1, mine_tag2]}
         self._base_defense_mines: dict[int, list[int]] = dict()
@@ -113,6 +113,22 @@ class MassMine(OpeningBase):
             cy_towards(self.ai.mediator.get_own_nat, self.ai.game_info.map_center, 7.0)
         )
         self._main_ramp_pos = Point2(
+            self.ai.map_cache.get_or_compute(
+                "mass_mine_main_ramp_pos", self._calculate_main_ramp_pos
+            )
+        )
+
+        # cache defensive mine positions so we don't have to
+        # keep iterating over mfs
+        for el_x, el_y, x, y in self.ai.map_cache.get_or_compute(
+            "mass_mine_defensive_mine_positions",
+            self._calculate_defensive_mine_positions,
+            per_spawn=False,
+        ):
+            self._defensive_mine_positions[Point2((el_x, el_y))] = Point2((x, y))
+
+    def _calculate_main_ramp_pos(self) -> tuple[float, float]:
+        return tuple(
             cy_towards(
                 self.ai.main_base_ramp.top_center,
                 self.ai.main_base_ramp.bottom_center,
@@ -120,8 +136,15 @@ class MassMine(OpeningBase):
             )
         )
 
-        # cache defensive mine positions so we don't have to
-        # keep iterating over mfs
+    def _calculate_defensive_mine_positions(self) -> list[list[float]]:
+        """Spot between each expansion's mineral line and its townhall.
+
+        Returns
+        -------
+        list[list[float]] :
+            One `[el.x, el.y, x, y]` entry per expansion with minerals.
+        """
+        positions: list[list[float]] = []
         for el in self.ai.expansion_locations_list:
             mineral_fields: list[Unit] = [
                 mf
@@ -131,7 +154,8 @@ class MassMine(OpeningBase):
             if not mineral_fields:
                 continue
             position: Point2 = Point2(cy_towards(cy_center(mineral_fields), el, 2.0))
-            self._defensive_mine_positions[el] = position
+            positions.append([el.x, el.y, position.x, position.y])
+        return positions
 
     async def on_step(self) -> None:
         if self.ai.build_order_runner.build_completed:
@@ -203,12 +227,17 @@ class MassMine(OpeningBase):
 
     def _handle_drops(self) -> None:
         self._execute_drops()
-        if not self.ai.mediator.get_main_ground_threats_near_townhall:
+        if (
+            not self.ai.mediator.get_main_ground_threats_near_townhall
+            and self.ai.scheduler.due("drop_assignment")
+        ):
             self._assign_mine_drops()
         self._unassign_mine_drops(UnitRole.ATTACKING)
 
     def _assign_base_defense_mines(self) -> None:
         """Assign 2 widow mines to defend each base mineral line, spaced apart."""
+        if not self.ai.scheduler.due("defensive_mine_assignment"):
+            return
 
         for townhall in self.ai.townhalls:
             th_tag: int = townhall.tag
@@ -262,27 +291,24 @@ class MassMine(OpeningBase):
                     mine(AbilityId.BURROWUP_WIDOWMINE)
 
     def _cleanup_orphaned_drop_mines(self) -> None:
-        """Reassign any DROP_UNITS_TO_LOAD mines not in tracker back to ATTACKING."""
-        # Get all mine tags that are currently in active drops
-        tracked_mine_tags: set[int] = set()
-        for tracker_info in self._medivac_tag_to_mine_tracker.values():
-            tracked_mine_tags.update(tracker_info["mine_tags"])
-
+        """Reassign any DROP_UNITS_TO_LOAD mines not in a drop back to ATTACKING."""
         # Get all units with DROP_UNITS_TO_LOAD role
         units_to_load: Units = self.ai.mediator.get_units_from_role(
             role=UnitRole.DROP_UNITS_TO_LOAD
         )
 
-        # Reassign any that aren't in the tracker
+        # Reassign any that aren't part of a drop
         for unit in units_to_load:
-            if unit.type_id in MINE_TYPES and unit.tag not in tracked_mine_tags:
+            if unit.type_id in MINE_TYPES and not self._mine_drops_assigned.is_cargo(
+                unit.tag
+            ):
                 self.ai.mediator.assign_role(tag=unit.tag, role=UnitRole.ATTACKING)
 
+    def on_unit_destroyed(self, unit_tag: int) -> None:
+        self._mine_drops_assigned.on_unit_destroyed(unit_tag)
+
     def on_unit_created(self, unit: Unit) -> None:
-        if (
-            unit.type_id == UnitTypeId.MEDIVAC
-            and len(self._medivac_tag_to_mine_tracker) < 4
-        ):
+        if unit.type_id == UnitTypeId.MEDIVAC and len(self._mine_drops_assigned) < 4:
             self.ai.mediator.assign_role(tag=unit.tag, role=UnitRole.CONTROL_GROUP_FIVE)
         elif unit.type_id in ARMY_TYPES:
             self.ai.mediator.assign_role(tag=unit.tag, role=UnitRole.ATTACKING)
@@ -290,7 +316,7 @@ class MassMine(OpeningBase):
     def _execute_drops(self) -> None:
         self._mine_drops.execute(
             self.ai.mediator.get_units_from_roles(roles=DROP_ROLES),
-            medivac_tag_to_mine_tracker=self._medivac_tag_to_mine_tracker,
+            drop_assignments=self._mine_drops_assigned,
         )
 
     def _macro(self):
@@ -366,21 +392,17 @@ class MassMine(OpeningBase):
             m
             for m in available_units
             if m.type_id == UnitTypeId.MEDIVAC
-            and m.tag not in self._medivac_tag_to_mine_tracker
+            and m.tag not in self._mine_drops_assigned
             and m.health_percentage >= 1.0
         ]
         if not medivacs:
             return
 
         # Find available widow mines (not already assigned to a drop)
-        already_assigned_mine_tags: set[int] = set()
-        for tracker in self._medivac_tag_to_mine_tracker.values():
-            already_assigned_mine_tags.update(tracker["mine_tags"])
-
         mines: list[Unit] = [
             m
             for m in available_units
-            if m.type_id in MINE_TYPES and m.tag not in already_assigned_mine_tags
+            if m.type_id in MINE_TYPES and not self._mine_drops_assigned.is_cargo(m.tag)
         ]
 
         # Need at least 1 medivac and 4 mines
@@ -411,29 +433,29 @@ class MassMine(OpeningBase):
             cy_towards(target_base, self.ai.game_info.map_center, -4.0)
         )
 
-        # Create tracker entry (store initial tags only - never modify)
-        self._medivac_tag_to_mine_tracker[medivac.tag] = {
-            "mine_tags": frozenset({mine.tag for mine in selected_mines}),
-            "target": drop_target,
-        }
+        self._mine_drops_assigned.assign(
+            medivac.tag, {mine.tag for mine in selected_mines}, drop_target
+        )
 
     def _unassign_mine_drops(self, switch_to: UnitRole) -> None:
-        """Clean up drop tracker entries when drops complete or fail."""
-        if not self._medivac_tag_to_mine_tracker:
+        """Clean up drop assignments when drops complete or fail."""
+        if not self._mine_drops_assigned:
             return
 
         tags_to_remove: list[int] = []
         grid = self.ai.mediator.get_air_grid
+        unit_role_dict: dict[UnitRole, set[int]] = self.ai.mediator.get_unit_role_dict
 
-        for med_tag, tracker in list(self._medivac_tag_to_mine_tracker.items()):
+        for assignment in self._mine_drops_assigned:
+            med_tag: int = assignment.medivac_tag
             medivac: Unit | None = self.ai.unit_tag_dict.get(med_tag, None)
 
-            # Medivac died - remove tracker only
+            # Medivac died - remove assignment only
             if not medivac:
                 tags_to_remove.append(med_tag)
                 continue
 
-            # Low health medivac - emergency drop and remove tracker
+            # Low health medivac - emergency drop and remove assignment
             if (
                 medivac.health_percentage <= self.MIN_HEALTH_MEDIVAC_PERC
                 and cy_in_pathing_grid_ma(grid, medivac.position)
@@ -450,12 +472,11 @@ class MassMine(OpeningBase):
                 continue
 
             # No cargo - check if any of the original mines still exist with DROP roles
-            original_mine_tags: set[int] = set(tracker["mine_tags"])
-            mines_with_drop_roles: list[Unit] = [
-                u
-                for u in self.ai.mediator.get_units_from_roles(roles=DROP_ROLES)
-                if u.tag in original_mine_tags and u.type_id in MINE_TYPES
-            ]
+            mines_with_drop_roles: bool = any(
+                tag in unit_role_dict[role]
+                for tag in assignment.cargo_tags
+                for role in DROP_ROLES
+            )
 
             # All original mines are gone or no longer have DROP roles - mission complete
             if not mines_with_drop_roles:
@@ -464,7 +485,7 @@ class MassMine(OpeningBase):
 
         # Clean up completed drops
         for tag in tags_to_remove:
-            del self._medivac_tag_to_mine_tracker[tag]
+            self._mine_drops_assigned.remove(tag)
 
     def _handle_main_ramp_mines(self):
         """Assign 2 widow mines to defend the main ramp."""
@@ -29,9 +29,10 @@ class MightBeAWorkerRush(OpeningBase):
 
     @property_cache_once_per_frame
     def healing_spot(self) -> Point2:
-        return self.ai.mediator.find_closest_safe_spot(
+        return self.ai.safe_spots.find_closest_safe_spot(
             from_pos=self.target_healing_pos,
             grid=self.ai.mediator.get_ground_grid,
+            grid_name="ground",
             radius=15.0,
         )
 
@@ -17,6 +17,7 @@ from ares.behaviors.macro import (
     UpgradeCCs,
     UpgradeController,
 )
+from ares.behaviors.macro.macro_behavior import MacroBehavior
 from ares.cache import property_cache_once_per_frame
 from cython_extensions import cy_find_units_center_mass
 from sc2.ids.unit_typeid import UnitTypeId
@@ -26,6 +27,8 @@ from sc2.units import Units
 
 from bot.openings.proxy_construction_manager import ProxyConstructionManager
 from bot.consts import ATTACK_TARGET_IGNORE
+from bot.utils.grid_distance import distance_at, distance_field
+from bot.utils.worker_selector import WorkerRequest
 
 
 class OpeningBase(metaclass=ABCMeta):
@@ -36,6 +39,9 @@ class OpeningBase(metaclass=ABCMeta):
         self.expansions_generator = None
         self.current_base_target: Point2 = Point2((0, 0))
         self.proxy_construction_manager: ProxyConstructionManager | None = None
+        # `_generic_macro_plan` controllers, reused while their inputs match
+        self._macro_controllers: dict[str, MacroBehavior] | None = None
+        self._macro_controllers_key: tuple | None = None
 
     @abstractmethod
     async def on_start(self, ai: AresBot) -> None:
@@ -48,25 +54,40 @@ class OpeningBase(metaclass=ABCMeta):
         pass
 
     def _calculate_proxy_location(self) -> Point2:
+        return Point2(
+            self.ai.map_cache.get_or_compute(
+                "proxy_location", self._search_proxy_location
+            )
+        )
+
+    def _search_proxy_location(self) -> tuple[float, float]:
+        """Expansion 3 to 6 that is the shortest walk from the enemy main.
+
+        All candidates are measured from a single distance field rather than
+        pathing to each one, the path lengths are kept in the map cache.
+        """
         potential_locations: list[
             tuple[Point2, float]
         ] = self.ai.mediator.get_enemy_expansions[2:6]
 
-        closest = potential_locations[0]
-        closest_dist: float = 998000.0
-        grid: np.ndarray = self.ai.mediator.get_ground_grid
-        target: Point2 = self.ai.enemy_start_locations[0]
-
-        for loc in potential_locations:
-            if path := self.ai.mediator.find_raw_path(
-                start=target, target=loc[0], grid=grid, sensitivity=2
-            ):
-                dist: int = len(path)
-                if dist < closest_dist:
-                    closest_dist = dist
-                    closest = loc[0]
+        field: np.ndarray = distance_field(
+            self.ai.mediator.get_ground_grid, self.ai.enemy_start_locations[0]
+        )
+        path_lengths: list[float] = [
+            distance_at(field, loc[0]) for loc in potential_locations
+        ]
+        self.ai.map_cache.set(
+            "proxy_path_lengths",
+            [
+                [loc[0].x, loc[0].y, length if np.isfinite(length) else None]
+                for loc, length in zip(potential_locations, path_lengths)
+            ],
+        )
 
-        return closest
+        closest: Point2 = potential_locations[0][0]
+        if np.isfinite(min(path_lengths)):
+            closest = potential_locations[int(np.argmin(path_lengths))][0]
+        return closest.x, closest.y
 
     def _generic_macro_plan(
         self,
@@ -86,6 +107,9 @@ class OpeningBase(metaclass=ABCMeta):
         can_add_orbital: bool = True,
         add_production_at_bank: tuple[int, int] = (700, 700),
     ) -> None:
+        if not self.ai.scheduler.due("macro_plan"):
+            return
+
         if (
             upgrade_to_pfs
             and not self.ai.structure_present_or_pending(UnitTypeId.ENGINEERINGBAY)
@@ -95,33 +119,117 @@ class OpeningBase(metaclass=ABCMeta):
                 BuildStructure(build_location, UnitTypeId.ENGINEERINGBAY)
             )
 
-        macro_plan: MacroPlan = MacroPlan()
-
-        if production_controller_enabled:
-            macro_plan.add(
-                ProductionController(
-                    army_comp,
-                    build_location,
-                    add_production_at_bank=add_production_at_bank,
-                )
-            )
-
-        macro_plan.add(AutoSupply(self.ai.start_location))
-        macro_plan.add(
-            GasBuildingController(
-                num_gas_buildings, max_pending=max_pending_gas_buildings
-            )
+        num_workers: int = (
+            num_one_base_workers
+            if len(self.ai.townhalls) <= 1
+            else (min(max_workers, len(self.ai.townhalls) * 22))
         )
+        upgrade_cc_to: UnitTypeId | None = None
         if (
             upgrade_to_pfs
             and self.ai.mediator.get_own_structures_dict[UnitTypeId.ENGINEERINGBAY]
         ):
-            macro_plan.add(UpgradeCCs(UnitTypeId.PLANETARYFORTRESS, prioritize=True))
+            upgrade_cc_to = UnitTypeId.PLANETARYFORTRESS
         elif can_add_orbital:
-            macro_plan.add(UpgradeCCs(UnitTypeId.ORBITALCOMMAND, prioritize=True))
+            upgrade_cc_to = UnitTypeId.ORBITALCOMMAND
+
+        # controllers without state of their own are reused while nothing
+        # they were built from changed, army comps can be edited in place so
+        # their contents count
+        inputs: dict = dict(
+            army_comp=army_comp,
+            build_location=build_location,
+            upgrades=upgrades,
+            add_upgrades=add_upgrades,
+            can_expand=can_expand,
+            production_controller_enabled=production_controller_enabled,
+            num_gas_buildings=num_gas_buildings,
+            max_pending_gas_buildings=max_pending_gas_buildings,
+            add_production_at_bank=add_production_at_bank,
+            upgrade_cc_to=upgrade_cc_to,
+            num_workers=num_workers,
+        )
+        key: tuple = _freeze(inputs)
+        if self._macro_controllers is None or key != self._macro_controllers_key:
+            self._macro_controllers = self.ai.step_profiler.measure(
+                "macro_controllers_build", self._build_macro_controllers, **inputs
+            )
+            self._macro_controllers_key = key
+            self.ai.step_profiler.increment(
+                "macro_controllers_built", len(self._macro_controllers)
+            )
+        else:
+            self.ai.step_profiler.increment(
+                "macro_controllers_reused", len(self._macro_controllers)
+            )
+
+        macro_plan: MacroPlan = self.ai.step_profiler.measure(
+            "macro_plan_build",
+            self._build_macro_plan,
+            self._macro_controllers,
+            army_comp=army_comp,
+            add_hellions=add_hellions,
+            freeflow_mode=freeflow_mode,
+        )
+        self.ai.register_behavior(macro_plan)
+
+    def _build_macro_controllers(
+        self,
+        army_comp: dict,
+        build_location: Point2,
+        upgrades: list[UpgradeId],
+        add_upgrades: bool,
+        can_expand: bool,
+        production_controller_enabled: bool,
+        num_gas_buildings: int,
+        max_pending_gas_buildings: int,
+        add_production_at_bank: tuple[int, int],
+        upgrade_cc_to: UnitTypeId | None,
+        num_workers: int,
+    ) -> dict[str, MacroBehavior]:
+        """The macro plan's controllers that hold no state between frames."""
+        controllers: dict[str, MacroBehavior] = dict()
+
+        if production_controller_enabled:
+            controllers["production"] = ProductionController(
+                army_comp,
+                build_location,
+                add_production_at_bank=add_production_at_bank,
+            )
+
+        controllers["supply"] = AutoSupply(self.ai.start_location)
+        controllers["gas"] = GasBuildingController(
+            num_gas_buildings, max_pending=max_pending_gas_buildings
+        )
+        if upgrade_cc_to:
+            controllers["upgrade_ccs"] = UpgradeCCs(upgrade_cc_to, prioritize=True)
 
         if add_upgrades:
-            macro_plan.add(UpgradeController(upgrades, build_location))
+            controllers["upgrades"] = UpgradeController(upgrades, build_location)
+
+        controllers["workers"] = BuildWorkers(num_workers)
+
+        if can_expand:
+            controllers["expansion"] = ExpansionController(100)
+        return controllers
+
+    def _build_macro_plan(
+        self,
+        controllers: dict[str, MacroBehavior],
+        army_comp: dict,
+        add_hellions: bool,
+        freeflow_mode: bool,
+    ) -> MacroPlan:
+        """This frame's plan from `controllers` and new spawn controllers.
+
+        `SpawnController` remembers which structures it already queued from
+        while it runs, so it is never carried over to another frame.
+        """
+        macro_plan: MacroPlan = MacroPlan()
+
+        for name in ("production", "supply", "gas", "upgrade_ccs", "upgrades"):
+            if name in controllers:
+                macro_plan.add(controllers[name])
 
         macro_plan.add(
             SpawnController(
@@ -139,17 +247,10 @@ class OpeningBase(metaclass=ABCMeta):
                 )
             )
 
-        num_workers: int = (
-            num_one_base_workers
-            if len(self.ai.townhalls) <= 1
-            else (min(max_workers, len(self.ai.townhalls) * 22))
-        )
-
-        macro_plan.add(BuildWorkers(num_workers))
-
-        if can_expand:
-            macro_plan.add(ExpansionController(100))
-        self.ai.register_behavior(macro_plan)
+        for name in ("workers", "expansion"):
+            if name in controllers:
+                macro_plan.add(controllers[name])
+        return macro_plan
 
     def _handle_proxy_scv_assignment(
         self, max_proxy_workers: int, proxy_location: Point2
@@ -162,7 +263,11 @@ class OpeningBase(metaclass=ABCMeta):
                 self.ai.mediator.assign_role(tag=worker.tag, role=UnitRole.GATHERING)
 
         if len(proxy_workers) < max_proxy_workers:
-            if worker := self.ai.mediator.select_worker(target_position=proxy_location):
+            request: WorkerRequest = WorkerRequest(
+                target_position=proxy_location,
+                num_workers=max_proxy_workers - len(proxy_workers),
+            )
+            for worker in self.ai.select_workers([request])[0]:
                 self.ai.mediator.assign_role(tag=worker.tag, role=UnitRole.PROXY_WORKER)
 
         return proxy_workers
@@ -201,3 +306,12 @@ class OpeningBase(metaclass=ABCMeta):
                 self.current_base_target = next(self.expansions_generator)
 
             return self.current_base_target
+
+
+def _freeze(value):
+    """Hashable copy of nested dicts, lists and tuples, to compare inputs."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -0,0 +1,155 @@
+import importlib
+from dataclasses import dataclass
+from os import path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+import yaml
+from loguru import logger
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# openings `MyBot` may switch to mid-game, warmed up before the first step
+SWITCH_TARGETS: tuple[str, ...] = ("WorkerRush", "BattleCruiserRush")
+
+
+def _to_snake(name: str) -> str:
+    # Convert e.g. "OneBaseTempest" -> "one_base_tempest"
+    out = []
+    for i, c in enumerate(name):
+        if i > 0:
+            prev = name[i - 1]
+            nxt = name[i + 1] if i + 1 < len(name) else ""
+            if c.isupper() and (
+                (not prev.isupper())  # lower->Upper
+                or (prev.isupper() and nxt and not nxt.isupper())  # UPPER->UpperLower
+            ):
+                out.append("_")
+        out.append(c.lower())
+    return "".join(out)
+
+
+def opening_names_from_builds_file(file_path: str) -> list[str]:
+    """Every opening named in a `<race>_builds.yml` file, in file order."""
+    if not path.isfile(file_path):
+        return []
+    with open(file_path) as f:
+        builds: dict = yaml.safe_load(f) or {}
+
+    names: list[str] = []
+    for choice in (builds.get("BuildChoices") or {}).values():
+        names.extend(choice.get("Cycle") or [])
+    names.extend(builds.get("Builds") or {})
+    return list(dict.fromkeys(names))
+
+
+@dataclass
+class OpeningLoadTime:
+    """Seconds spent importing, constructing and starting an opening."""
+
+    import_time: float = 0.0
+    construct_time: float = 0.0
+    start_time: float = 0.0
+
+
+class OpeningRegistry:
+    """Imports, constructs and starts openings ahead of time.
+
+    Switching opening mid-game then only swaps which instance `MyBot` calls,
+    instead of importing a module and running `on_start` in a live frame.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self.load_times: dict[str, OpeningLoadTime] = dict()
+        self._openings: dict[str, Any] = dict()
+        self._started: set[str] = set()
+        # constructed but not started yet, see `warm_next`
+        self._pending: list[str] = []
+
+    def register(self, names: list[str]) -> None:
+        """Import and construct `names`, their `on_start` runs in `warm_next`."""
+        for name in names:
+            try:
+                self._construct(name)
+            except Exception as exc:
+                logger.warning(f"Unable to load opening {name}: {exc}")
+                continue
+            if name not in self._started and name not in self._pending:
+                self._pending.append(name)
+
+    async def get(self, name: str) -> Any:
+        """The started opening `name`, loading it now if it wasn't warmed up."""
+        if name not in self._openings:
+            logger.warning(f"Opening {name} was not pre-loaded")
+            self._construct(name)
+        await self._start(name)
+        return self._openings[name]
+
+    async def warm_up(self, names: list[str]) -> None:
+        """Start `names` now, for openings that must be ready on the first step."""
+        for name in names:
+            if name in self._openings:
+                await self._start(name)
+
+    async def warm_next(self) -> bool:
+        """Start one pending opening, returns False once none are left."""
+        if not self._pending:
+            return False
+        name: str = self._pending[0]
+        try:
+            await self._start(name)
+        except Exception as exc:
+            # `_start` takes it off the list before running `on_start`
+            if name in self._pending:
+                self._pending.remove(name)
+            logger.warning(f"Unable to start opening {name}: {exc}")
+        return len(self._pending) > 0
+
+    @property
+    def has_pending(self) -> bool:
+        return len(self._pending) > 0
+
+    def log_load_times(self) -> None:
+        logger.info(f"{'opening':<24}{'import':>9}{'create':>9}{'on_start':>9}  (ms)")
+        for name, load_time in self.load_times.items():
+            logger.info(
+                f"{name:<24}{load_time.import_time * 1000:>9.2f}"
+                f"{load_time.construct_time * 1000:>9.2f}"
+                f"{load_time.start_time * 1000:>9.2f}"
+            )
+
+    def _construct(self, name: str) -> None:
+        if name in self._openings:
+            return
+        load_time: OpeningLoadTime = self.load_times.setdefault(name, OpeningLoadTime())
+
+        start: float = perf_counter()
+        module_path = f"bot.openings.{_to_snake(name)}"
+        module = importlib.import_module(module_path)
+        opening_cls = getattr(module, name, None)
+        if opening_cls is None:
+            raise ImportError(f"Opening class '{name}' not found in '{module_path}'")
+        load_time.import_time = perf_counter() - start
+
+        start = perf_counter()
+        self._openings[name] = opening_cls()
+        load_time.construct_time = perf_counter() - start
+
+    async def _start(self, name: str) -> None:
+        if name in self._pending:
+            self._pending.remove(name)
+        if name in self._started:
+            return
+        opening = self._openings[name]
+        start: float = perf_counter()
+        if hasattr(opening, "on_start"):
+            await opening.on_start(self.ai)
+        self.load_times[name].start_time = perf_counter() - start
+        self._started.add(name)
@@ -3,7 +3,6 @@ from typing import Optional
 
 from ares import AresBot
 from ares.consts import UnitRole, UnitTreeQueryType, WORKER_TYPES, DEBUG
-from cython_extensions import cy_distance_to_squared
 from sc2.ids.ability_id import AbilityId
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.position import Point2
@@ -49,16 +48,9 @@ class ProxyConstructionManager:
         search_radius: float = 20.0,
     ) -> int:
         """Count all structures of the given type near the proxy location."""
-        count = 0
-        for structure in self.ai.structures.filter(
-            lambda s: s.type_id == structure_type
-        ):
-            if (
-                cy_distance_to_squared(structure.position, proxy_location)
-                < search_radius**2
-            ):
-                count += 1
-        return count
+        return self.ai.structure_index.count_near(
+            structure_type, proxy_location, search_radius
+        )
 
     async def handle_construction(
         self,
@@ -118,11 +110,7 @@ class ProxyConstructionManager:
                 continue  # Task has an assigned SCV
 
             # Check if there's an incomplete structure at this position
-            structures_at_pos = [
-                s
-                for s in self.ai.structures
-                if cy_distance_to_squared(s.position, task.position) < 9.0
-            ]
+            structures_at_pos = self.ai.structure_index.near(task.position, 3.0)
 
             if structures_at_pos:
                 structure = structures_at_pos[0]
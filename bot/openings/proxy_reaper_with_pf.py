@@ -20,6 +20,7 @@ from bot.combat.base_combat import BaseCombat
 from bot.openings.opening_base import OpeningBase
 from bot.openings.reapers import Reapers
 from bot.combat.cyclone_combat import CycloneCombat
+from bot.utils.worker_selector import WorkerRequest
 
 PATH_THRESHOLD: int = 100
 
@@ -151,9 +152,9 @@ class ProxyReaperWithPf(OpeningBase):
     def _handle_proxy_cc_construction(self) -> None:
         scv: Unit | None = self.ai.unit_tag_dict.get(self._pf_builder_tag)
         if not scv:
-            if _scv := self.ai.mediator.select_worker(
-                target_position=self._proxy_location
-            ):
+            request: WorkerRequest = WorkerRequest(self._proxy_location)
+            if selected := self.ai.select_workers([request])[0]:
+                _scv: Unit = selected[0]
                 self._pf_builder_tag = _scv.tag
                 self.ai.mediator.assign_role(
                     tag=_scv.tag, role=UnitRole.CONTROL_GROUP_NINE
@@ -176,11 +177,18 @@ class ProxyReaperWithPf(OpeningBase):
             scv.move(self._proxy_cc_location)
 
     def _calculate_proxy_cc_location(self) -> Point2:
+        return Point2(
+            self.ai.map_cache.get_or_compute(
+                "proxy_cc_location", self._search_proxy_cc_location
+            )
+        )
+
+    def _search_proxy_cc_location(self) -> tuple[float, float]:
         potential_locations: list[
             tuple[Point2, float]
         ] = self.ai.mediator.get_enemy_expansions[1:6]
 
-        closest = potential_locations[0]
+        closest = potential_locations[0][0]
         closest_dist: float = 998000.0
         target: Point2 = self.ai.enemy_start_locations[0]
 
@@ -190,7 +198,7 @@ class ProxyReaperWithPf(OpeningBase):
                 closest_dist = dist
                 closest = loc[0]
 
-        return closest
+        return closest.x, closest.y
 
     async def _control_flying_cc(self):
         if self.ai.time < 150.0:
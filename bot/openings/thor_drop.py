@@ -20,6 +20,7 @@ from sc2.units import Units
 
 from bot.combat.base_combat import BaseCombat
 from bot.combat.battle_cruiser_combat import BattleCruiserCombat
+from bot.combat.drop_assignments import DropAssignments
 from bot.combat.generic_drops import GenericDrops
 from bot.combat.ground_range_combat import GroundRangeCombat
 from bot.consts import COMMON_UNIT_IGNORE_TYPES
@@ -48,7 +49,7 @@ class ThorDrop(OpeningBase):
         super().__init__()
         self._attack_started: bool = False
         self._assign_repairers: bool = False
-        self._medivac_to_thor: dict[int, dict] = dict()
+        self._thor_drops_assigned: DropAssignments = DropAssignments()
 
     @property
     def army_comp(self) -> dict:
@@ -59,9 +60,10 @@ class ThorDrop(OpeningBase):
 
     @property_cache_once_per_frame
     def healing_spot(self) -> Point2:
-        return self.ai.mediator.find_closest_safe_spot(
+        return self.ai.safe_spots.find_closest_safe_spot(
             from_pos=self.target_healing_pos,
             grid=self.ai.mediator.get_ground_grid,
+            grid_name="ground",
             radius=15.0,
         )
 
@@ -85,18 +87,27 @@ class ThorDrop(OpeningBase):
         self._ground_range_combat = GroundRangeCombat(ai, ai.config, ai.mediator)
         self._thor_drops: BaseCombat = GenericDrops(ai, ai.config, ai.mediator)
 
-        self.target_healing_pos = self.ai.game_info.map_center
-        if path := self.ai.mediator.find_raw_path(
+        self.target_healing_pos = Point2(
+            self.ai.map_cache.get_or_compute(
+                "thor_drop_target_healing_pos", self._calculate_target_healing_pos
+            )
+        )
+
+    def _calculate_target_healing_pos(self) -> tuple[float, float]:
+        target_healing_pos: Point2 = self.ai.game_info.map_center
+        if path := self.ai.path_cache.find_raw_path(
             start=self.ai.mediator.get_enemy_nat,
             target=self.ai.game_info.map_center,
             grid=self.ai.mediator.get_ground_grid,
+            grid_name="ground",
             sensitivity=2,
         ):
             # make sure the path has some kind of length
             # the actual length is likely a lot longer
             if len(path) > 5:
                 # take the second from the end point
-                self.target_healing_pos = path[-2]
+                target_healing_pos = path[-2]
+        return target_healing_pos.x, target_healing_pos.y
 
     async def on_step(self) -> None:
         await self._reapers.on_step()
@@ -111,6 +122,8 @@ class ThorDrop(OpeningBase):
         await self._handle_repair_crew()
 
     def _assign_drops(self) -> None:
+        if not self.ai.scheduler.due("drop_assignment"):
+            return
         available_units: Units = self.ai.mediator.get_units_from_role(
             role=UnitRole.ATTACKING
         )
@@ -126,11 +139,9 @@ class ThorDrop(OpeningBase):
                 tag=thor_tag,
                 role=UnitRole.DROP_UNITS_TO_LOAD,
             )
-            self._medivac_to_thor[medivac.tag] = {
-                "tags": {thor_tag},
-                "target": self.attack_target,
-                "healing": False,
-            }
+            self._thor_drops_assigned.assign(
+                medivac.tag, {thor_tag}, self.attack_target
+            )
 
     def _macro(self):
         self.ai.register_behavior(
@@ -155,7 +166,7 @@ class ThorDrop(OpeningBase):
     async def _micro(self) -> None:
         self._thor_drops.execute(
             self.ai.mediator.get_units_from_roles(roles=DROP_ROLES),
-            medivac_tag_to_units_tracker=self._medivac_to_thor,
+            drop_assignments=self._thor_drops_assigned,
         )
 
         # handle left over units
@@ -174,11 +185,14 @@ class ThorDrop(OpeningBase):
     def _update_drop_info(self):
         keys_to_remove: list[int] = []
         ground_grid: np.ndarray = self.ai.mediator.get_ground_grid
-        for medivac_tag, tracker_info in self._medivac_to_thor.items():
+        for assignment in self._thor_drops_assigned:
+            medivac_tag: int = assignment.medivac_tag
             medivac: Unit | None = self.ai.unit_tag_dict.get(medivac_tag)
-            thor: Unit | None = self.ai.unit_tag_dict.get(list(tracker_info["tags"])[0])
-            if tracker_info["healing"]:
-                self._medivac_to_thor[medivac_tag]["target"] = self.healing_spot
+            thor: Unit | None = self.ai.unit_tag_dict.get(
+                next(iter(assignment.cargo_tags), None)
+            )
+            if assignment.healing:
+                assignment.target = self.healing_spot
                 if (
                     thor
                     and thor.health_percentage >= 1.0
@@ -188,16 +202,14 @@ class ThorDrop(OpeningBase):
                     self.ai.mediator.assign_role(
                         tag=thor.tag, role=UnitRole.DROP_UNITS_TO_LOAD
                     )
-                    self._medivac_to_thor[medivac_tag][
-                        "target"
-                    ] = self.ai.enemy_start_locations[0]
-                    self._medivac_to_thor[medivac_tag]["healing"] = False
+                    assignment.target = self.ai.enemy_start_locations[0]
+                    assignment.healing = False
                 continue
 
             if medivac and medivac.has_cargo:
                 if medivac.health_percentage < 0.25:
-                    self._medivac_to_thor[medivac_tag]["healing"] = True
-                    self._medivac_to_thor[medivac_tag]["target"] = self.healing_spot
+                    assignment.healing = True
+                    assignment.target = self.healing_spot
                     self._assign_repairers = True
                     continue
                 close_enemy_air: Units = self.ai.mediator.get_units_in_range(
@@ -211,7 +223,7 @@ class ThorDrop(OpeningBase):
                 if close_enemy_air and cy_in_pathing_grid_ma(
                     ground_grid, medivac.position
                 ):
-                    self._medivac_to_thor[medivac_tag]["target"] = medivac.position
+                    assignment.target = medivac.position
                     continue
 
                 close_enemy_ground: Units = self.ai.mediator.get_units_in_range(
@@ -225,13 +237,13 @@ class ThorDrop(OpeningBase):
                 if close_enemy_ground and cy_in_pathing_grid_ma(
                     ground_grid, medivac.position
                 ):
-                    self._medivac_to_thor[medivac_tag]["target"] = medivac.position
+                    assignment.target = medivac.position
                     continue
 
             if thor:
                 if thor.health_percentage < 0.4:
-                    self._medivac_to_thor[medivac_tag]["healing"] = True
-                    self._medivac_to_thor[medivac_tag]["target"] = self.healing_spot
+                    assignment.healing = True
+                    assignment.target = self.healing_spot
                     self.ai.mediator.assign_role(
                         tag=thor.tag, role=UnitRole.DROP_UNITS_TO_LOAD
                     )
@@ -264,9 +276,7 @@ class ThorDrop(OpeningBase):
                         self.ai.mediator.assign_role(
                             tag=thor.tag, role=UnitRole.DROP_UNITS_TO_LOAD
                         )
-                        self._medivac_to_thor[medivac_tag][
-                            "target"
-                        ] = self.attack_target
+                        assignment.target = self.attack_target
                     else:
                         close_structures: Units = self.ai.mediator.get_units_in_range(
                             start_points=[thor.position],
@@ -277,9 +287,7 @@ class ThorDrop(OpeningBase):
                             self.ai.mediator.assign_role(
                                 tag=thor.tag, role=UnitRole.DROP_UNITS_TO_LOAD
                             )
-                            self._medivac_to_thor[medivac_tag][
-                                "target"
-                            ] = self.attack_target
+                            assignment.target = self.attack_target
 
             if medivac and not medivac.has_cargo and not thor:
                 keys_to_remove.append(medivac_tag)
@@ -289,7 +297,10 @@ class ThorDrop(OpeningBase):
                 keys_to_remove.append(medivac_tag)
 
         for key in keys_to_remove:
-            self._medivac_to_thor.pop(key)
+            self._thor_drops_assigned.remove(key)
+
+    def on_unit_destroyed(self, unit_tag: int) -> None:
+        self._thor_drops_assigned.on_unit_destroyed(unit_tag)
 
     async def _handle_repair_crew(self):
         if not self._attack_started:
@@ -3,7 +3,7 @@ from sc2.ids.ability_id import AbilityId
 
 from ares import AresBot
 from ares.behaviors.macro import BuildStructure, SpawnController
-from cython_extensions import cy_distance_to_squared, cy_unit_pending
+from cython_extensions import cy_unit_pending
 from sc2.ids.unit_typeid import UnitTypeId
 from sc2.ids.upgrade_id import UpgradeId
 from sc2.position import Point2
@@ -18,6 +18,9 @@ from bot.openings.bio import Bio
 from bot.openings.opening_base import OpeningBase
 
 DEFEND_TYPES: set[UnitTypeId] = {UnitTypeId.MARINE, UnitTypeId.SIEGETANK}
+# how close to a townhall its bunkers and turrets are counted
+BUNKER_DISTANCE: float = 295.0**0.5
+TURRET_DISTANCE: float = 200.0**0.5
 
 
 class Turtle(OpeningBase):
@@ -81,7 +84,7 @@ class Turtle(OpeningBase):
         self._add_bunkers()
         self._add_turrets()
 
-        if self.ai.actual_iteration % 16 == 0:
+        if self.ai.scheduler.due("tank_assignment"):
             self._assign_tanks_to_bases()
 
     def _macro(self):
@@ -113,13 +116,10 @@ class Turtle(OpeningBase):
 
         for th in self.ai.townhalls:
             location: Point2 = th.position
-            existing_bunkers: list[Unit] = [
-                s
-                for s in self.ai.structures
-                if s.type_id == UnitTypeId.BUNKER
-                and cy_distance_to_squared(location, s.position) < 295.0
-            ]
-            if len(existing_bunkers) < 2:
+            num_bunkers: int = self.ai.structure_index.count_near(
+                UnitTypeId.BUNKER, location, BUNKER_DISTANCE
+            )
+            if num_bunkers < 2:
                 self.ai.register_behavior(BuildStructure(location, UnitTypeId.BUNKER))
 
     def _add_turrets(self):
@@ -149,13 +149,10 @@ class Turtle(OpeningBase):
                     break
 
                 location: Point2 = townhall.position
-                existing_turrets: list[Unit] = [
-                    s
-                    for s in self.ai.structures
-                    if s.type_id == UnitTypeId.MISSILETURRET
-                    and cy_distance_to_squared(location, s.position) < 200.0
-                ]
-                if len(existing_turrets) < 7:
+                num_turrets: int = self.ai.structure_index.count_near(
+                    UnitTypeId.MISSILETURRET, location, TURRET_DISTANCE
+                )
+                if num_turrets < 7:
                     self.ai.register_behavior(
                         BuildStructure(
                             location, UnitTypeId.MISSILETURRET, closest_to=location
@@ -14,13 +14,17 @@ from sc2.units import Units
 
 from ares.behaviors.combat.individual import WorkerKiteBack, KeepUnitSafe
 from ares.managers.squad_manager import UnitSquad
-from bot.consts import COMMON_UNIT_IGNORE_TYPES
 from src.ares.consts import UnitRole, UnitTreeQueryType
 
 from bot.combat.base_combat import BaseCombat
+from bot.combat.distance_matrix import DistanceMatrix, EnemyGroup
 from bot.combat.worker_combat import WorkerCombat
 from bot.openings.bio import Bio
 from bot.openings.opening_base import OpeningBase
+from bot.utils.worker_selector import WorkerRequest
+
+# units closer than this to a hurt worker count as crowding it
+NEARBY_DISTANCE: float = 7.5**0.5
 
 
 class WorkerRush(OpeningBase):
@@ -62,7 +66,7 @@ class WorkerRush(OpeningBase):
                 self._attack_started = True
             return
 
-        if not self._enemy_walled_off and self.ai.state.game_loop % 20 == 0:
+        if not self._enemy_walled_off and self.ai.scheduler.due("wall_off_check"):
             self._enemy_walled_off = self.ai.main_ramp_walled_off(
                 self.ai.mediator.get_enemy_ramp
             )
@@ -98,7 +102,7 @@ class WorkerRush(OpeningBase):
                 start_points=[squad.squad_position],
                 distances=12.5,
                 query_tree=UnitTreeQueryType.EnemyGround,
-            )[0].filter(lambda u: u.type_id not in COMMON_UNIT_IGNORE_TYPES)
+            )[0]
             self._worker_combat.execute(
                 units=squad.squad_units,
                 all_close_enemy=close_ground_enemy,
@@ -112,14 +116,16 @@ class WorkerRush(OpeningBase):
 
     async def _assign_workers(self):
         if not self._initial_assignment:
-            num_assigned: int = 0
-            for worker in self.ai.mediator.get_units_from_role(role=UnitRole.GATHERING):
-                if num_assigned >= self._max_scvs_in_attack:
-                    break
-
+            request: WorkerRequest = WorkerRequest(
+                target_position=self.ai.enemy_start_locations[0],
+                num_workers=self._max_scvs_in_attack,
+                force_close=True,
+            )
+            workers: list[Unit] = self.ai.select_workers([request])[0]
+            for i, worker in enumerate(workers):
                 role: UnitRole = (
                     UnitRole.PROXY_WORKER
-                    if num_assigned == 0
+                    if i == 0
                     and self.ai.build_order_runner.chosen_opening
                     == "MightBeAWorkerRush"
                     else UnitRole.CONTROL_GROUP_EIGHT
@@ -127,10 +133,10 @@ class WorkerRush(OpeningBase):
 
                 self.ai.mediator.assign_role(tag=worker.tag, role=role)
                 self.ai.mediator.remove_worker_from_mineral(worker_tag=worker.tag)
+            if workers:
                 await self.ai.client.toggle_autocast(
-                    [worker], AbilityId.EFFECT_REPAIR_SCV
+                    workers, AbilityId.EFFECT_REPAIR_SCV
                 )
-                num_assigned += 1
             self._initial_assignment = True
 
     def _handle_worker_repair(self):
@@ -141,6 +147,10 @@ class WorkerRush(OpeningBase):
             role=UnitRole.CONTROL_GROUP_ONE
         )
         grid: np.ndarray = self.ai.mediator.get_ground_grid
+        distances: DistanceMatrix = self.ai.distance_matrix
+        visible_enemy: EnemyGroup = distances.group_from_mask(
+            ~self.ai.enemy_snapshot.columns.is_memory
+        )
         for worker in all_workers:
             health_perc: float = worker.health_percentage
             if health_perc < 0.4 and len(all_workers) >= 3 and self.ai.minerals > 0:
@@ -162,10 +172,9 @@ class WorkerRush(OpeningBase):
             if worker.tag in self._low_health_tags:
                 nearby_units: list[Unit] = [
                     w
-                    for w in self.ai.all_units
-                    if cy_distance_to_squared(w.position, worker.position) < 7.5
-                    and w.tag != worker.tag
-                    and w.tag not in self._low_health_tags
+                    for w in distances.own_within(worker, NEARBY_DISTANCE)
+                    + distances.within(worker, visible_enemy, NEARBY_DISTANCE)
+                    if w.tag not in self._low_health_tags
                 ]
                 if len(nearby_units) >= 4:
                     self.ai.register_behavior(
@@ -0,0 +1,114 @@
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sc2.ids.ability_id import AbilityId
+from sc2.unit_command import UnitCommand
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# position targets closer than this (squared) to the current order's are equal
+COMMAND_TARGET_TOLERANCE_SQ: float = 0.25
+
+
+class CommandFilter:
+    """Drop commands that would not change what a unit is doing.
+
+    Run over `self.actions` at the end of `on_step`, before python-sc2 sends
+    them. Two kinds of commands are removed:
+
+    - Commands overridden later in the same step: of several targeted
+      commands with the same ability for one unit, only the last one that
+      isn't queued has any effect.
+    - Commands matching the unit's only current order: same ability and the
+      same target unit, or a target position within
+      `COMMAND_TARGET_TOLERANCE_SQ` of the current one. python-sc2 already
+      drops exact repeats, the tolerance also catches targets recalculated
+      every step, such as the centre of a group of units. Only done when it
+      is the unit's only command this step that isn't queued, otherwise
+      another command would replace the order it repeats.
+
+    Queued and untargeted commands are always kept, as are commands for units
+    with several orders, where re-issuing the first order also clears the
+    queue.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self.sent: int = 0
+        self.suppressed_overridden: int = 0
+        self.suppressed_repeats: int = 0
+
+    def filter(self, actions: list[UnitCommand]) -> list[UnitCommand]:
+        """Commands in `actions` that are worth sending, in the same order."""
+        if not actions:
+            return actions
+
+        # a repeat is only safe to drop if nothing else replaces the order
+        num_replacing: Counter[int] = Counter(
+            action.unit.tag for action in actions if not action.queue
+        )
+        # walk backwards so the last command per unit and ability is seen first
+        final_commands: set[tuple[int, AbilityId]] = set()
+        keep: list[UnitCommand] = []
+        for action in reversed(actions):
+            if action.queue or action.target is None:
+                keep.append(action)
+                continue
+            key: tuple[int, AbilityId] = (action.unit.tag, action.ability)
+            if key in final_commands:
+                self.suppressed_overridden += 1
+                continue
+            final_commands.add(key)
+            if num_replacing[action.unit.tag] == 1 and self._repeats_current_order(
+                action
+            ):
+                self.suppressed_repeats += 1
+                continue
+            keep.append(action)
+
+        keep.reverse()
+        self.sent += len(keep)
+        return keep
+
+    def log_summary(self) -> None:
+        suppressed: int = self.suppressed_overridden + self.suppressed_repeats
+        if suppressed + self.sent == 0:
+            return
+        logger.info(
+            f"Command filter: sent {self.sent}, suppressed {suppressed} "
+            f"({self.suppressed_repeats} repeated orders, "
+            f"{self.suppressed_overridden} overridden in the same step)"
+        )
+
+    def _repeats_current_order(self, action: UnitCommand) -> bool:
+        # read the proto directly, `Unit.orders` builds new objects every call
+        orders = action.unit._proto.orders
+        if len(orders) != 1:
+            return False
+        order = orders[0]
+
+        ability_data = self.ai.game_data.abilities.get(order.ability_id, None)
+        if not ability_data or action.ability not in {
+            ability_data.id,
+            ability_data.exact_id,
+        }:
+            return False
+
+        target = action.target
+        if hasattr(target, "tag"):
+            return order.HasField("target_unit_tag") and (
+                order.target_unit_tag == target.tag
+            )
+        if not order.HasField("target_world_space_pos"):
+            return False
+        pos = order.target_world_space_pos
+        return (pos.x - target[0]) ** 2 + (
+            pos.y - target[1]
+        ) ** 2 < COMMAND_TARGET_TOLERANCE_SQ
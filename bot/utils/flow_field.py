@@ -0,0 +1,249 @@
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from sc2.position import Point2
+
+from bot.utils.grid_distance import distance_field
+from bot.utils.grid_versions import GridVersionTracker
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# (dx, dy) of the 8 neighbouring cells
+_OFFSETS: np.ndarray = np.array(
+    [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+)
+
+
+class FlowField:
+    """Distance to one target from every cell, and the next cell towards it.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        Pathing grid indexed `grid[x, y]`, `np.inf` where unpathable.
+    target : Point2
+        Where every unit using this field is heading.
+    grid_version : int
+        Version of `grid` the field is built from, see `GridVersionTracker`.
+    game_loop : int
+        Frame the field is built on.
+    """
+
+    def __init__(
+        self, grid: np.ndarray, target: Point2, grid_version: int, game_loop: int
+    ):
+        self.distances: np.ndarray = distance_field(grid, target, start_radius=2.0)
+        self.next_cell: np.ndarray = _next_cells(self.distances)
+        self.grid_version: int = grid_version
+        self.game_loop: int = game_loop
+        # cells whose path to the target was still unchanged at `checked_version`
+        self.checked_version: int = grid_version
+        self.checked_cells: set[int] = set()
+        # list indexing is much faster than NumPy's for walking one path
+        self._next_cell_list: list[int] = self.next_cell.tolist()
+
+    def cell_of(self, start: Point2) -> Optional[int]:
+        """Flat index of the cell at `start`, None if it can't reach the target."""
+        width, height = self.distances.shape
+        x: int = int(start[0])
+        y: int = int(start[1])
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        if not np.isfinite(self.distances[x, y]):
+            return None
+        return x * height + y
+
+    def path_cells(self, cell: int) -> list[int]:
+        """Cells from `cell` to the target, up to the first checked cell."""
+        next_cell: list[int] = self._next_cell_list
+        cells: list[int] = [cell]
+        while cell not in self.checked_cells and next_cell[cell] != cell:
+            cell = next_cell[cell]
+            cells.append(cell)
+        return cells
+
+    def waypoint(self, cell: int, lookahead: int) -> Point2:
+        """Point `lookahead` cells along the shortest path from `cell`."""
+        next_cell: list[int] = self._next_cell_list
+        for _ in range(lookahead):
+            cell = next_cell[cell]
+        x, y = divmod(cell, self.distances.shape[1])
+        return Point2((x + 0.5, y + 0.5))
+
+
+class FlowFieldService:
+    """One flow field per (grid, target) shared by every unit heading there.
+
+    A* costs one search per unit per frame, a flow field costs one Dijkstra
+    over the whole grid after which every unit's next waypoint is a few array
+    lookups. Fields are only worth it for targets many units share, so one is
+    built once at least `min_units` waypoint requests were made for the same
+    target in the previous frame, and at most one is built per frame. Until
+    then `next_waypoint` returns None and callers path as before.
+
+    Fields are keyed by grid name and target cell. Like `PathCache`, a field
+    keeps serving a unit until a cell on the unit's path to the target
+    changed cost since the field was built, see
+    `GridVersionTracker.unchanged_since`, so enemy influence elsewhere on the
+    map doesn't cost a Dijkstra every frame. A field with a changed path is
+    rebuilt, but not within `min_rebuild_frames` of its last build, units
+    path the usual way until then. The least recently used field is evicted
+    once there are `max_fields`.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    grid_versions : GridVersionTracker
+        Shared grid versions.
+    enabled : bool
+        Set via the `FlowFieldPathing` key in `config.yml`.
+    min_units : int
+        See above.
+    max_fields : int
+        See above.
+    lookahead : int
+        How many cells ahead of a unit its waypoint is.
+    min_rebuild_frames : int
+        See above.
+    """
+
+    def __init__(
+        self,
+        ai: "AresBot",
+        grid_versions: GridVersionTracker,
+        enabled: bool = False,
+        min_units: int = 12,
+        max_fields: int = 16,
+        lookahead: int = 5,
+        min_rebuild_frames: int = 22,
+    ):
+        self.ai: "AresBot" = ai
+        self.grid_versions: GridVersionTracker = grid_versions
+        self.enabled: bool = enabled
+        self.min_units: int = min_units
+        self.max_fields: int = max_fields
+        self.lookahead: int = lookahead
+        self.min_rebuild_frames: int = min_rebuild_frames
+        self.fields_built: int = 0
+        self._fields: OrderedDict[tuple[str, int, int], FlowField] = OrderedDict()
+        self._game_loop: int = -1
+        self._built_this_frame: bool = False
+        # target cell -> waypoint requests, this frame and the one before
+        self._demand: dict[tuple[str, int, int], int] = defaultdict(int)
+        self._last_demand: dict[tuple[str, int, int], int] = dict()
+
+    def next_waypoint(
+        self, grid: np.ndarray, grid_name: str, start: Point2, target: Point2
+    ) -> Optional[Point2]:
+        """Where a unit at `start` should move to next on its way to `target`.
+
+        Parameters
+        ----------
+        grid :
+            Pathing grid the unit moves on.
+        grid_name :
+            Name of `grid`, e.g. "ground". Fields on different grids must
+            use different names.
+        start :
+            Current position of the unit.
+        target :
+            Where the unit is heading.
+
+        Returns
+        -------
+        Optional[Point2] :
+            None when there is no up to date field for this target (yet), or
+            `start` can't reach it. Path the usual way in that case.
+        """
+        if not self.enabled:
+            return None
+        game_loop: int = self.ai.state.game_loop
+        if game_loop != self._game_loop:
+            self._game_loop = game_loop
+            self._last_demand = self._demand
+            self._demand = defaultdict(int)
+            self._built_this_frame = False
+
+        key: tuple[str, int, int] = (grid_name, int(target[0]), int(target[1]))
+        self._demand[key] += 1
+
+        version: int = self.grid_versions.version(grid_name, grid)
+        field: Optional[FlowField] = self._fields.get(key, None)
+        if field and self._path_unchanged(field, grid_name, version, start):
+            self._fields.move_to_end(key)
+        elif (
+            self._built_this_frame
+            or self._last_demand.get(key, 0) < self.min_units
+            or (field and game_loop - field.game_loop < self.min_rebuild_frames)
+        ):
+            return None
+        else:
+            if field:
+                self.ai.step_profiler.increment("flow_fields_invalidated")
+            self._built_this_frame = True
+            field = FlowField(
+                grid, Point2(key[1:]).offset((0.5, 0.5)), version, game_loop
+            )
+            self.fields_built += 1
+            self.ai.step_profiler.increment("flow_fields_built")
+            self._fields[key] = field
+            self._fields.move_to_end(key)
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+
+        cell: Optional[int] = field.cell_of(start)
+        return None if cell is None else field.waypoint(cell, self.lookahead)
+
+    def _path_unchanged(
+        self, field: FlowField, grid_name: str, version: int, start: Point2
+    ) -> bool:
+        """Did no cell on the way from `start` to the target change cost?
+
+        Cells found unchanged are remembered for the rest of `version`, so
+        units sharing a route only walk the part that is new to them.
+        """
+        if field.checked_version != version:
+            field.checked_version = version
+            field.checked_cells.clear()
+        cell: Optional[int] = field.cell_of(start)
+        if cell is None or cell in field.checked_cells:
+            return True
+
+        cells: list[int] = field.path_cells(cell)
+        xs, ys = np.divmod(np.array(cells), field.distances.shape[1])
+        if not self.grid_versions.unchanged_since(
+            grid_name, field.grid_version, xs, ys
+        ):
+            return False
+        field.checked_cells.update(cells)
+        return True
+
+
+def _next_cells(distances: np.ndarray) -> np.ndarray:
+    """Flat index of the neighbour closest to the target, for every cell.
+
+    Cells without a closer neighbour, the target itself and anything that
+    can't reach it, point at themselves.
+    """
+    width, height = distances.shape
+    padded: np.ndarray = np.pad(distances, 1, constant_values=np.inf)
+    neighbours: np.ndarray = np.stack(
+        [
+            padded[1 + dx : width + 1 + dx, 1 + dy : height + 1 + dy]
+            for dx, dy in _OFFSETS
+        ],
+        axis=-1,
+    )
+    best: np.ndarray = np.argmin(neighbours, axis=-1)
+    best_distance: np.ndarray = np.take_along_axis(
+        neighbours, best[..., np.newaxis], axis=-1
+    )[..., 0]
+
+    xs, ys = np.indices((width, height))
+    next_x: np.ndarray = xs + _OFFSETS[best, 0]
+    next_y: np.ndarray = ys + _OFFSETS[best, 1]
+    closer: np.ndarray = best_distance < distances
+    return np.where(closer, next_x * height + next_y, xs * height + ys).ravel()
@@ -0,0 +1,92 @@
+from math import sqrt
+
+import numpy as np
+from sc2.position import Point2
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+# (dx, dy, step length) for the 4 neighbours that cover all 8 directions once
+_NEIGHBOURS: list[tuple[int, int, float]] = [
+    (1, 0, 1.0),
+    (0, 1, 1.0),
+    (1, 1, sqrt(2)),
+    (1, -1, sqrt(2)),
+]
+
+
+def distance_field(
+    grid: np.ndarray, start: Point2, start_radius: float = 4.0
+) -> np.ndarray:
+    """Path distance from `start` to every cell of `grid` in one pass.
+
+    Replaces one `find_raw_path` call per candidate when many targets share
+    the same start. Cells are 8-connected, moving between two cells costs the
+    mean of their grid values times the step length, and unpathable cells
+    (`np.inf`) are never entered.
+
+    Parameters
+    ----------
+    grid : np.ndarray
+        Pathing grid indexed `grid[x, y]`, e.g. `mediator.get_ground_grid`.
+    start : Point2
+        Where to measure from. Every pathable cell within `start_radius` is
+        used as a source, so a start covered by a structure still works.
+    start_radius : float
+        See above.
+
+    Returns
+    -------
+    np.ndarray :
+        Array shaped like `grid`, `np.inf` where a cell can't be reached.
+    """
+    width, height = grid.shape
+    pathable: np.ndarray = np.isfinite(grid)
+    index: np.ndarray = np.arange(width * height).reshape(width, height)
+
+    rows: list[np.ndarray] = []
+    cols: list[np.ndarray] = []
+    weights: list[np.ndarray] = []
+    for dx, dy, step in _NEIGHBOURS:
+        xs: slice = slice(0, width - dx)
+        xs_to: slice = slice(dx, width)
+        ys: slice = slice(max(0, -dy), height - max(0, dy))
+        ys_to: slice = slice(max(0, dy), height + min(0, dy))
+        both: np.ndarray = pathable[xs, ys] & pathable[xs_to, ys_to]
+        rows.append(index[xs, ys][both])
+        cols.append(index[xs_to, ys_to][both])
+        weights.append((grid[xs, ys][both] + grid[xs_to, ys_to][both]) * step / 2)
+
+    num_cells: int = width * height
+    graph: csr_matrix = csr_matrix(
+        (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(num_cells, num_cells),
+    )
+
+    sources: np.ndarray = index[_cells_near(pathable, start, start_radius)]
+    if len(sources) == 0:
+        return np.full(grid.shape, np.inf)
+    distances: np.ndarray = dijkstra(
+        graph, directed=False, indices=sources, min_only=True
+    )
+    return distances.reshape(width, height)
+
+
+def distance_at(field: np.ndarray, position: Point2, radius: float = 3.0) -> float:
+    """Shortest distance in `field` within `radius` of `position`.
+
+    Townhall spots and other targets often sit on unpathable cells, looking
+    at the surrounding cells gives the distance to walk up to them.
+    """
+    near: np.ndarray = _cells_near(np.ones(field.shape, dtype=bool), position, radius)
+    if not near.any():
+        return np.inf
+    return float(field[near].min())
+
+
+def _cells_near(mask: np.ndarray, position: Point2, radius: float) -> np.ndarray:
+    """Boolean mask of cells in `mask` within `radius` of `position`."""
+    xs, ys = np.ogrid[: mask.shape[0], : mask.shape[1]]
+    close: np.ndarray = (xs + 0.5 - position[0]) ** 2 + (
+        ys + 0.5 - position[1]
+    ) ** 2 <= radius**2
+    return close & mask
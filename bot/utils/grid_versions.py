@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+
+@dataclass
+class _TrackedGrid:
+    previous: np.ndarray
+    version: int
+    # version in which each cell last changed
+    changed_at: np.ndarray
+    game_loop: int
+
+
+class GridVersionTracker:
+    """Cheap identity for the pathing grids handed out by the mediator.
+
+    Ares rebuilds most grids every frame, so the array object says nothing
+    about whether the costs changed. Instead `version` tracks a named grid
+    across frames. The version goes up on every frame the grid changed, and
+    the cells that changed are recorded, so `unchanged_since` can tell
+    whether anything derived from a few cells, a path for example, is still
+    valid.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self._tracked: dict[str, _TrackedGrid] = dict()
+
+    def version(self, name: str, grid: np.ndarray) -> int:
+        """Current version of grid `name`, compared once a frame to the last.
+
+        Parameters
+        ----------
+        name :
+            Which grid this is, e.g. "ground". Always pass the same grid
+            under the same name.
+        grid :
+            This frame's grid.
+        """
+        game_loop: int = self.ai.state.game_loop
+        tracked: _TrackedGrid | None = self._tracked.get(name, None)
+        if tracked and tracked.game_loop == game_loop:
+            return tracked.version
+
+        if not tracked or tracked.previous.shape != grid.shape:
+            self._tracked[name] = _TrackedGrid(
+                previous=grid.copy(),
+                version=0,
+                changed_at=np.zeros(grid.shape, dtype=np.int32),
+                game_loop=game_loop,
+            )
+            return 0
+
+        changed: np.ndarray = grid != tracked.previous
+        if changed.any():
+            tracked.version += 1
+            tracked.changed_at[changed] = tracked.version
+            tracked.previous[changed] = grid[changed]
+        tracked.game_loop = game_loop
+        return tracked.version
+
+    def unchanged_since(
+        self, name: str, version: int, xs: np.ndarray, ys: np.ndarray
+    ) -> bool:
+        """Have cells (`xs`, `ys`) of grid `name` kept their `version` costs?"""
+        tracked: _TrackedGrid | None = self._tracked.get(name, None)
+        if not tracked:
+            return False
+        if tracked.version == version:
+            return True
+        return len(xs) == 0 or int(tracked.changed_at[xs, ys].max()) <= version
@@ -0,0 +1,121 @@
+import json
+import re
+from os import makedirs, path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from loguru import logger
+from sc2.position import Point2
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+MAP_CACHE_DIR: str = path.join("data", "map_cache")
+# bump when the layout of the cache files changes, older files are ignored
+MAP_CACHE_VERSION: int = 2
+
+
+class MapCache:
+    """Values that only depend on the map and spawn locations, kept on disk.
+
+    There is one JSON file per map. Values that depend on where we spawned
+    live in a section per (own spawn, enemy spawn) pair, everything else in
+    a section shared by all spawns. A value worked out once is reused in
+    every later game on that map.
+
+    Each value is stored with the version its caller asked for, bumping the
+    version where a value is computed invalidates what was cached before.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    directory : Optional[str]
+        Where to keep the cache files, None keeps the cache in memory only.
+    """
+
+    def __init__(self, ai: "AresBot", directory: Optional[str] = MAP_CACHE_DIR):
+        self.ai: "AresBot" = ai
+        map_name: str = re.sub(r"[^\w\-]", "_", ai.game_info.map_name)
+        self.spawn_key: str = (
+            f"{_format(ai.start_location)}_vs_{_format(ai.enemy_start_locations[0])}"
+        )
+        self._path: Optional[str] = (
+            path.join(directory, f"{map_name}.json") if directory else None
+        )
+        self._data: dict[str, Any] = self._load()
+
+    def get(self, key: str, version: int = 1, per_spawn: bool = True) -> Optional[Any]:
+        entry: Optional[dict] = self._section(per_spawn).get(key, None)
+        if not entry or entry["version"] != version:
+            return None
+        return entry["value"]
+
+    def set(
+        self, key: str, value: Any, version: int = 1, per_spawn: bool = True
+    ) -> None:
+        self._section(per_spawn)[key] = {"version": version, "value": value}
+        self._save()
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        version: int = 1,
+        per_spawn: bool = True,
+    ) -> Any:
+        """Cached value for `key`, computing and storing it on a miss.
+
+        Parameters
+        ----------
+        key :
+            Name of the value.
+        compute :
+            Called on a miss, must return something JSON serializable.
+            `Point2` values are stored, and returned, as lists.
+        version :
+            Cached values stored under another version are recomputed.
+        per_spawn :
+            False if the value is the same whichever spawns were used.
+        """
+        if (value := self.get(key, version, per_spawn)) is not None:
+            return value
+        value = compute()
+        self.set(key, value, version, per_spawn)
+        return value
+
+    def _section(self, per_spawn: bool) -> dict[str, Any]:
+        if not per_spawn:
+            return self._data["map"]
+        return self._data["spawns"].setdefault(self.spawn_key, {})
+
+    def _load(self) -> dict[str, Any]:
+        empty: dict[str, Any] = {
+            "version": MAP_CACHE_VERSION,
+            "map": {},
+            "spawns": {},
+        }
+        if not self._path or not path.isfile(self._path):
+            return empty
+        try:
+            with open(self._path) as f:
+                data: dict[str, Any] = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable map cache {self._path}: {e}")
+            return empty
+        if data.get("version") != MAP_CACHE_VERSION:
+            return empty
+        return data
+
+    def _save(self) -> None:
+        if not self._path:
+            return
+        try:
+            makedirs(path.dirname(self._path), exist_ok=True)
+            with open(self._path, "w") as f:
+                json.dump(self._data, f)
+        except OSError as e:
+            logger.warning(f"Unable to write map cache {self._path}: {e}")
+
+
+def _format(position: Point2) -> str:
+    return f"{position[0]:.1f},{position[1]:.1f}"
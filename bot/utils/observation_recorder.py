@@ -0,0 +1,221 @@
+"""
+Record the raw protobuf responses `MyBot` sees so a game can be replayed
+without StarCraft II, see `scripts/replay_observations.py`.
+
+File layout, all integers little endian:
+
+    header:  MAGIC (8 bytes) | codec (1 byte)
+    record:  kind (1 byte) | payload length (uint32) | payload
+
+Every payload is compressed on its own with the codec from the header, so a
+memory mapped file can be walked record by record without decompressing the
+rest of it. zstd is used when the optional `zstandard` package is installed,
+otherwise zlib from the standard library.
+"""
+import json
+import mmap
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Iterator, Optional
+
+from loguru import logger
+from s2clientprotocol import common_pb2
+from s2clientprotocol import sc2api_pb2 as sc_pb
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC: bytes = b"SC2OBS\x00\x01"
+_HEADER: struct.Struct = struct.Struct("<8sB")
+_RECORD: struct.Struct = struct.Struct("<BI")
+
+CODEC_ZLIB: int = 1
+CODEC_ZSTD: int = 2
+
+# record kinds
+META: int = 1
+GAME_DATA: int = 2
+GAME_INFO: int = 3
+PATHING_GRID: int = 4
+OBSERVATION: int = 5
+
+
+def _compressor(codec: int) -> Callable[[bytes], bytes]:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=3).compress
+    return lambda data: zlib.compress(data, 6)
+
+
+def _decompressor(codec: int) -> Callable[[bytes], bytes]:
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("Recording is zstd compressed, install `zstandard`")
+        return zstandard.ZstdDecompressor().decompress
+    return zlib.decompress
+
+
+class ObservationRecorder:
+    """Append everything needed to replay a game to `file_path`.
+
+    Call `record_start` once in `on_start` and `record_step` at the start of
+    every `on_step`. The pathing grid is only written when it has changed.
+
+    Parameters
+    ----------
+    file_path : str
+        Where to write the recording.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path: str = file_path
+        codec: int = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+        self._compress: Callable[[bytes], bytes] = _compressor(codec)
+        self._file: Optional[BinaryIO] = open(file_path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, codec))
+        self._last_pathing_grid: bytes = b""
+        self._last_game_loop: int = -1
+
+    def record_start(
+        self,
+        meta: dict[str, Any],
+        game_data: sc_pb.ResponseData,
+        game_info: sc_pb.ResponseGameInfo,
+        observation: sc_pb.ResponseObservation,
+    ) -> None:
+        """Everything `_prepare_start` needs plus the first observation.
+
+        Parameters
+        ----------
+        meta :
+            JSON serializable values such as `player_id` and `base_build`.
+        game_data :
+            Raw `RequestData` response.
+        game_info :
+            Raw game info from the start of the game.
+        observation :
+            The observation `on_start` ran on.
+        """
+        self._write(META, json.dumps(meta).encode())
+        self._write(GAME_DATA, game_data.SerializeToString())
+        self._write(GAME_INFO, game_info.SerializeToString())
+        self._last_pathing_grid = game_info.start_raw.pathing_grid.SerializeToString()
+        self.record_step(observation, game_info.start_raw.pathing_grid)
+
+    def record_step(
+        self,
+        observation: sc_pb.ResponseObservation,
+        pathing_grid: common_pb2.ImageData,
+    ) -> None:
+        if not self._file:
+            return
+        game_loop: int = observation.observation.game_loop
+        if game_loop == self._last_game_loop:
+            return
+        self._last_game_loop = game_loop
+
+        grid: bytes = pathing_grid.SerializeToString()
+        if grid != self._last_pathing_grid:
+            self._write(PATHING_GRID, grid)
+            self._last_pathing_grid = grid
+        self._write(OBSERVATION, observation.SerializeToString())
+
+    def close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._file = None
+            logger.info(f"Observations recorded to {self.file_path}")
+
+    def _write(self, kind: int, payload: bytes) -> None:
+        if not self._file:
+            # an earlier write failed
+            return
+        try:
+            data: bytes = self._compress(payload)
+            self._file.write(_RECORD.pack(kind, len(data)))
+            self._file.write(data)
+        except OSError as e:
+            # never let recording take the bot down
+            logger.warning(f"Stopped recording observations: {e}")
+            self._file.close()
+            self._file = None
+
+
+@dataclass
+class RecordingStart:
+    meta: dict[str, Any]
+    game_data: sc_pb.ResponseData
+    game_info: sc_pb.ResponseGameInfo
+
+
+def read_recording(
+    file_path: str,
+) -> tuple[RecordingStart, Iterator[tuple[sc_pb.ResponseObservation, sc_pb.Response]]]:
+    """Open a recording made by `ObservationRecorder`.
+
+    Parameters
+    ----------
+    file_path :
+        The recording.
+
+    Returns
+    -------
+    tuple[RecordingStart, Iterator[tuple[sc_pb.ResponseObservation, sc_pb.Response]]] :
+        What `_prepare_start` needs, and an iterator over every step as the
+        `(observation, proto_game_info)` pair `_prepare_step` takes. The
+        first step is the one `on_start` ran on.
+    """
+    with open(file_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        magic, codec = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{file_path} is not an observation recording")
+        decompress: Callable[[bytes], bytes] = _decompressor(codec)
+
+        offset: int = _HEADER.size
+        start_records: dict[int, bytes] = {}
+        reader: Iterator[tuple[int, bytes, int]] = _records(buffer, offset, decompress)
+        for kind in (META, GAME_DATA, GAME_INFO):
+            record_kind, payload, offset = next(reader, (None, b"", offset))
+            if record_kind != kind:
+                raise ValueError(f"{file_path} is missing its start records")
+            start_records[kind] = payload
+
+    start: RecordingStart = RecordingStart(
+        meta=json.loads(start_records[META]),
+        game_data=sc_pb.ResponseData.FromString(start_records[GAME_DATA]),
+        game_info=sc_pb.ResponseGameInfo.FromString(start_records[GAME_INFO]),
+    )
+
+    def steps() -> Iterator[tuple[sc_pb.ResponseObservation, sc_pb.Response]]:
+        game_info: sc_pb.ResponseGameInfo = sc_pb.ResponseGameInfo()
+        game_info.CopyFrom(start.game_info)
+        # opened again so the file is only held while the steps are read
+        with open(file_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as buffer:
+            for kind, payload, _ in _records(buffer, offset, decompress):
+                if kind == PATHING_GRID:
+                    game_info = sc_pb.ResponseGameInfo()
+                    game_info.CopyFrom(start.game_info)
+                    game_info.start_raw.pathing_grid.ParseFromString(payload)
+                elif kind == OBSERVATION:
+                    yield sc_pb.ResponseObservation.FromString(payload), sc_pb.Response(
+                        game_info=game_info
+                    )
+
+    return start, steps()
+
+
+def _records(
+    buffer: mmap.mmap, offset: int, decompress: Callable[[bytes], bytes]
+) -> Iterator[tuple[int, bytes, int]]:
+    """(kind, payload, offset of the next record) from `offset` on."""
+    while offset + _RECORD.size <= len(buffer):
+        kind, length = _RECORD.unpack_from(buffer, offset)
+        offset += _RECORD.size
+        yield kind, decompress(buffer[offset : offset + length]), offset + length
+        offset += length
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from loguru import logger
+from sc2.position import Point2
+
+from bot.utils.grid_versions import GridVersionTracker
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+
+@dataclass
+class _CachedPath:
+    path: list[Point2]
+    grid_version: int
+    # cells the path crosses, checked against the grid's dirty cells
+    xs: np.ndarray
+    ys: np.ndarray
+
+
+class PathCache:
+    """LRU cache in front of `mediator.find_raw_path`.
+
+    Paths are keyed by grid name, start cell and target cell, and stored at
+    full resolution so every `sensitivity` is served from the same entry. A
+    cached path stays valid until one of the cells it crosses changes cost,
+    see `GridVersionTracker.unchanged_since`, so paths over the static parts
+    of the map survive enemy influence changing somewhere else.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    grid_versions : GridVersionTracker
+        Shared grid versions.
+    enabled : bool
+        Set via the `PathCache` key in `config.yml`.
+    max_paths : int
+        Least recently used paths are dropped beyond this.
+    """
+
+    def __init__(
+        self,
+        ai: "AresBot",
+        grid_versions: GridVersionTracker,
+        enabled: bool = False,
+        max_paths: int = 512,
+    ):
+        self.ai: "AresBot" = ai
+        self.grid_versions: GridVersionTracker = grid_versions
+        self.enabled: bool = enabled
+        self.max_paths: int = max_paths
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+        self._paths: OrderedDict[
+            tuple[str, int, int, int, int], _CachedPath
+        ] = OrderedDict()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def find_raw_path(
+        self,
+        start: Point2,
+        target: Point2,
+        grid: np.ndarray,
+        grid_name: str,
+        sensitivity: int = 1,
+    ) -> list[Point2]:
+        """`mediator.find_raw_path`, answered from the cache when possible.
+
+        Parameters
+        ----------
+        start :
+            Where the path starts.
+        target :
+            Where the path ends.
+        grid :
+            This frame's pathing grid.
+        grid_name :
+            Name of `grid`, e.g. "ground". Paths on different grids must
+            use different names.
+        sensitivity :
+            Keep every `sensitivity`th point, as in `find_raw_path`.
+        """
+        if not self.enabled:
+            return self.ai.mediator.find_raw_path(
+                start=start, target=target, grid=grid, sensitivity=sensitivity
+            )
+
+        version: int = self.grid_versions.version(grid_name, grid)
+        key: tuple[str, int, int, int, int] = (
+            grid_name,
+            int(start[0]),
+            int(start[1]),
+            int(target[0]),
+            int(target[1]),
+        )
+        cached: Optional[_CachedPath] = self._paths.get(key, None)
+        if cached and self.grid_versions.unchanged_since(
+            grid_name, cached.grid_version, cached.xs, cached.ys
+        ):
+            self.hits += 1
+            self.ai.step_profiler.increment("path_cache_hits")
+            self._paths.move_to_end(key)
+            return cached.path[::sensitivity]
+
+        if cached:
+            self.invalidations += 1
+        self.misses += 1
+        self.ai.step_profiler.increment("path_cache_misses")
+        path: list[Point2] = self.ai.mediator.find_raw_path(
+            start=start, target=target, grid=grid, sensitivity=1
+        )
+        cells: np.ndarray = np.array(
+            [(int(p[0]), int(p[1])) for p in path], dtype=np.int32
+        ).reshape(-1, 2)
+        self._paths[key] = _CachedPath(
+            path=path, grid_version=version, xs=cells[:, 0], ys=cells[:, 1]
+        )
+        self._paths.move_to_end(key)
+        if len(self._paths) > self.max_paths:
+            self._paths.popitem(last=False)
+        return path[::sensitivity]
+
+    def log_summary(self) -> None:
+        if not self.enabled or self.hits + self.misses == 0:
+            return
+        logger.info(
+            f"Path cache: {self.hits} hits, {self.misses} misses "
+            f"({self.invalidations} invalidated), hit rate {self.hit_rate:.1%}"
+        )
@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from loguru import logger
+from sc2.position import Point2
+
+from bot.utils.grid_versions import GridVersionTracker
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+
+@dataclass
+class _CachedSpot:
+    spot: Point2
+    grid_version: int
+    # cells `find_closest_safe_spot` looked at
+    xs: np.ndarray
+    ys: np.ndarray
+
+
+class SafeSpotCache:
+    """Cache in front of `mediator.find_closest_safe_spot`.
+
+    Spots are keyed by grid name, the cell of `from_pos` and the radius, so
+    several units asking for a safe spot near the same target share one
+    search. A spot stays valid until a cell the search could have looked at,
+    within `radius` of the target, changes cost, see
+    `GridVersionTracker.unchanged_since`.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    grid_versions : GridVersionTracker
+        Shared grid versions.
+    enabled : bool
+        Set via the `SafeSpotCache` key in `config.yml`.
+    max_spots : int
+        Least recently used spots are dropped beyond this.
+    """
+
+    def __init__(
+        self,
+        ai: "AresBot",
+        grid_versions: GridVersionTracker,
+        enabled: bool = True,
+        max_spots: int = 128,
+    ):
+        self.ai: "AresBot" = ai
+        self.grid_versions: GridVersionTracker = grid_versions
+        self.enabled: bool = enabled
+        self.max_spots: int = max_spots
+        self.hits: int = 0
+        self.misses: int = 0
+        self._spots: OrderedDict[
+            tuple[str, int, int, float], _CachedSpot
+        ] = OrderedDict()
+
+    def find_closest_safe_spot(
+        self,
+        from_pos: Point2,
+        grid: np.ndarray,
+        grid_name: str,
+        radius: float,
+    ) -> Point2:
+        """`mediator.find_closest_safe_spot`, answered from the cache when possible.
+
+        Parameters
+        ----------
+        from_pos :
+            Where to look for a safe spot around.
+        grid :
+            This frame's grid.
+        grid_name :
+            Name of `grid`, e.g. "air". Spots on different grids must use
+            different names.
+        radius :
+            Search radius, also how far around `from_pos` a grid change
+            invalidates the cached spot.
+        """
+        if not self.enabled:
+            return self.ai.mediator.find_closest_safe_spot(
+                from_pos=from_pos, grid=grid, radius=radius
+            )
+
+        version: int = self.grid_versions.version(grid_name, grid)
+        key: tuple[str, int, int, float] = (
+            grid_name,
+            int(from_pos[0]),
+            int(from_pos[1]),
+            radius,
+        )
+        cached: Optional[_CachedSpot] = self._spots.get(key, None)
+        if cached and self.grid_versions.unchanged_since(
+            grid_name, cached.grid_version, cached.xs, cached.ys
+        ):
+            self.hits += 1
+            self.ai.step_profiler.increment("safe_spot_hits")
+            self._spots.move_to_end(key)
+            return cached.spot
+
+        self.misses += 1
+        self.ai.step_profiler.increment("safe_spot_misses")
+        spot: Point2 = self.ai.mediator.find_closest_safe_spot(
+            from_pos=from_pos, grid=grid, radius=radius
+        )
+        xs, ys = _cells_around(grid.shape, from_pos, radius)
+        self._spots[key] = _CachedSpot(spot=spot, grid_version=version, xs=xs, ys=ys)
+        self._spots.move_to_end(key)
+        if len(self._spots) > self.max_spots:
+            self._spots.popitem(last=False)
+        return spot
+
+    def log_summary(self) -> None:
+        if not self.enabled or self.hits + self.misses == 0:
+            return
+        logger.info(
+            f"Safe spot cache: {self.hits} hits, {self.misses} misses, "
+            f"hit rate {self.hits / (self.hits + self.misses):.1%}"
+        )
+
+
+def _cells_around(
+    shape: tuple[int, int], from_pos: Point2, radius: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Cells of the square around `from_pos` the search could have looked at."""
+    reach: int = int(np.ceil(radius)) + 1
+    x: int = int(from_pos[0])
+    y: int = int(from_pos[1])
+    xs, ys = np.meshgrid(
+        np.arange(max(0, x - reach), min(shape[0], x + reach + 1)),
+        np.arange(max(0, y - reach), min(shape[1], y + reach + 1)),
+        indexing="ij",
+    )
+    return xs.ravel(), ys.ravel()
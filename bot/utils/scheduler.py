@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from math import inf
+from time import perf_counter
+from typing import TYPE_CHECKING, Optional
+
+from loguru import logger
+
+from bot.consts import (
+    EVERY_STEP,
+    LOW_PRIORITY_BUDGET_SHARE,
+    MAX_CONSECUTIVE_DEFERRALS,
+    ON_EVENT,
+    SCHEDULE_INTERVALS,
+    SCHEDULE_PRIORITIES,
+    STEP_BUDGET_SHARE,
+    SchedulePriority,
+)
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+
+@dataclass
+class ScheduledTask:
+    """Cadence of one subsystem, intervals and loops are in game loops."""
+
+    name: str
+    interval: int
+    phase: int
+    next_run: int
+    priority: SchedulePriority = SchedulePriority.Critical
+    triggered: bool = False
+    # `due` may be asked more than once per step, answer the same each time
+    last_checked: int = -1
+    last_result: bool = False
+    runs: int = 0
+    deferrals: int = 0
+    consecutive_deferrals: int = 0
+    max_consecutive_deferrals: int = 0
+
+
+class Scheduler:
+    """Decide which subsystems run on the current step.
+
+    Every subsystem has a cadence in game loops, looked up the first time
+    `due` is called for it: the `Scheduler` block in `config.yml` first, then
+    `SCHEDULE_INTERVALS` in `bot/consts.py`, otherwise every step.
+
+    - `EVERY_STEP` (0): runs on every step.
+    - `ON_EVENT` (-1): only runs on the step after `trigger` was called.
+    - N > 0: runs once every N game loops, or sooner when triggered.
+
+    Subsystems sharing an interval are given different phases, so that work
+    running every 16 loops doesn't all land on the same frame.
+
+    Once a step has used up its time budget, work that is due but not
+    `SchedulePriority.Critical` is deferred: `due` says no and keeps it due,
+    so it runs on the following step instead. `SCHEDULE_PRIORITIES` sets the
+    priority of each subsystem, and nothing is deferred more than
+    `MAX_CONSECUTIVE_DEFERRALS` steps in a row.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game.
+    overrides : Optional[dict[str, int]]
+        Interval per subsystem name, from the `Scheduler` config block.
+    game_step : int
+        Game loops between two steps, phases are spread in multiples of it.
+    budget : float
+        Seconds a step may take before work is deferred, see `step_budget`.
+    """
+
+    def __init__(
+        self,
+        ai: "AresBot",
+        overrides: Optional[dict[str, int]] = None,
+        game_step: int = 2,
+        budget: float = inf,
+    ):
+        self.ai: "AresBot" = ai
+        self.overrides: dict[str, int] = overrides or dict()
+        self.game_step: int = max(1, game_step)
+        self.budget: float = budget
+        self._tasks: dict[str, ScheduledTask] = dict()
+        # interval -> number of tasks already given a phase for it
+        self._phases_used: dict[int, int] = dict()
+        self._step_start: float = 0.0
+        self._steps: int = 0
+        self._steps_over_budget: int = 0
+
+        for name in self.overrides:
+            if name not in SCHEDULE_INTERVALS:
+                logger.warning(f"Scheduler override for unknown subsystem {name}")
+
+    def start_step(self) -> None:
+        self._step_start = perf_counter()
+
+    def end_step(self) -> None:
+        self._steps += 1
+        if self.elapsed > self.budget:
+            self._steps_over_budget += 1
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since `start_step`."""
+        return perf_counter() - self._step_start
+
+    def due(self, name: str) -> bool:
+        """Should subsystem `name` run on this step?"""
+        game_loop: int = self.ai.state.game_loop
+        task: ScheduledTask = self._tasks.get(name, None) or self._register(name)
+        if task.last_checked == game_loop:
+            return task.last_result
+
+        run: bool
+        if task.triggered:
+            run = True
+        elif task.interval == EVERY_STEP:
+            run = True
+        elif task.interval == ON_EVENT:
+            run = False
+        else:
+            run = game_loop >= task.next_run
+
+        if run and self._should_defer(task):
+            # stays due (and triggered), so it's first in line next step
+            task.deferrals += 1
+            task.consecutive_deferrals += 1
+            task.max_consecutive_deferrals = max(
+                task.max_consecutive_deferrals, task.consecutive_deferrals
+            )
+            run = False
+        elif run:
+            task.runs += 1
+            task.consecutive_deferrals = 0
+            task.triggered = False
+            if task.interval > 0:
+                # next loop on this task's phase, skipping any that were missed
+                task.next_run = (
+                    game_loop + task.interval - (game_loop - task.phase) % task.interval
+                )
+        task.last_checked = game_loop
+        task.last_result = run
+        return run
+
+    def trigger(self, name: str) -> None:
+        """Run subsystem `name` the next time `due` is asked, whatever its cadence."""
+        task: ScheduledTask = self._tasks.get(name, None) or self._register(name)
+        task.triggered = True
+
+    def log_summary(self) -> None:
+        if self._steps == 0:
+            return
+        logger.info(
+            f"Scheduler: {self._steps_over_budget}/{self._steps} steps over the "
+            f"{self.budget * 1000:.1f} ms budget"
+        )
+        deferred: list[ScheduledTask] = [
+            task for task in self._tasks.values() if task.deferrals > 0
+        ]
+        if not deferred:
+            return
+        logger.info(f"{'subsystem':<32}{'runs':>8}{'deferred':>10}{'max row':>9}")
+        for task in sorted(deferred, key=lambda t: -t.deferrals):
+            logger.info(
+                f"{task.name:<32}{task.runs:>8}{task.deferrals:>10}"
+                f"{task.max_consecutive_deferrals:>9}"
+            )
+
+    def _should_defer(self, task: ScheduledTask) -> bool:
+        if task.priority == SchedulePriority.Critical:
+            return False
+        if task.consecutive_deferrals >= MAX_CONSECUTIVE_DEFERRALS:
+            return False
+        share: float = (
+            LOW_PRIORITY_BUDGET_SHARE if task.priority == SchedulePriority.Low else 1.0
+        )
+        return self.elapsed > self.budget * share
+
+    def _register(self, name: str) -> ScheduledTask:
+        interval: int = int(
+            self.overrides.get(name, SCHEDULE_INTERVALS.get(name, EVERY_STEP))
+        )
+        phase: int = 0
+        if interval > 0:
+            slot: int = self._phases_used.get(interval, 0)
+            self._phases_used[interval] = slot + 1
+            phase = (slot * self.game_step) % interval
+
+        game_loop: int = self.ai.state.game_loop
+        next_run: int = game_loop
+        if interval > 0:
+            next_run = game_loop + (phase - game_loop) % interval
+
+        task: ScheduledTask = ScheduledTask(
+            name=name,
+            interval=interval,
+            phase=phase,
+            next_run=next_run,
+            priority=SCHEDULE_PRIORITIES.get(name, SchedulePriority.Critical),
+        )
+        self._tasks[name] = task
+        return task
+
+
+def step_budget(game_step: int, realtime: bool) -> float:
+    """Seconds of wall time one step should take at most.
+
+    In realtime the game keeps going while we think, so a step has one game
+    loop's worth of time. Otherwise the game waits, but keeping up with
+    `game_step` loops of game time is what a realtime opponent would get.
+    """
+    loops: int = 1 if realtime else max(1, game_step)
+    return STEP_BUDGET_SHARE * loops / 22.4
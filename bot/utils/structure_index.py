@@ -0,0 +1,144 @@
+from collections import defaultdict
+from math import floor
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from cython_extensions import cy_distance_to_squared
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+from sc2.unit import Unit
+
+if TYPE_CHECKING:
+    from ares import AresBot
+
+# side of a bucket in the spatial grid, in game units
+CELL_SIZE: float = 8.0
+
+
+class StructureIndex:
+    """Our structures bucketed by type and map area.
+
+    Kept up to date from the building events, see the `on_*` methods, so
+    "how many bunkers within 17 of this townhall" looks at a few buckets
+    instead of every structure we own. Cancelled buildings and anything
+    else that slips past the events is caught by comparing the indexed tags
+    with `ai.structures` once per frame, the whole index is rebuilt then.
+
+    Only landed structures are indexed. A building leaves the index when it
+    lifts off and is filed under its new position when it lands, both
+    change its type.
+
+    Parameters
+    ----------
+    ai : AresBot
+        Bot object that will be running the game
+    """
+
+    def __init__(self, ai: "AresBot"):
+        self.ai: "AresBot" = ai
+        self.rebuilds: int = 0
+        self._game_loop: int = -1
+        # type -> (cell x, cell y) -> tag -> position
+        self._cells: dict[
+            UnitTypeId, dict[tuple[int, int], dict[int, Point2]]
+        ] = defaultdict(lambda: defaultdict(dict))
+        # tag -> (type, cell) it's filed under
+        self._tag_to_key: dict[int, tuple[UnitTypeId, tuple[int, int]]] = dict()
+
+    def on_structure_added(self, unit: Unit) -> None:
+        self._remove(unit.tag)
+        if unit.is_flying:
+            return
+        cell: tuple[int, int] = _cell_of(unit.position)
+        self._cells[unit.type_id][cell][unit.tag] = unit.position
+        self._tag_to_key[unit.tag] = (unit.type_id, cell)
+
+    def on_structure_type_changed(self, unit: Unit) -> None:
+        if unit.is_structure:
+            self.on_structure_added(unit)
+
+    def on_unit_destroyed(self, unit_tag: int) -> None:
+        self._remove(unit_tag)
+
+    def count_near(
+        self, structure_type: UnitTypeId, position: Point2, distance: float
+    ) -> int:
+        """Structures of `structure_type` closer than `distance` to `position`."""
+        return len(self.tags_near(position, distance, {structure_type}))
+
+    def near(
+        self,
+        position: Point2,
+        distance: float,
+        structure_types: Optional[Iterable[UnitTypeId]] = None,
+    ) -> list[Unit]:
+        """Structures closer than `distance` to `position`, any type if None."""
+        unit_tag_dict: dict[int, Unit] = self.ai.unit_tag_dict
+        return [
+            unit_tag_dict[tag]
+            for tag in self.tags_near(position, distance, structure_types)
+            if tag in unit_tag_dict
+        ]
+
+    def tags_near(
+        self,
+        position: Point2,
+        distance: float,
+        structure_types: Optional[Iterable[UnitTypeId]] = None,
+    ) -> list[int]:
+        self._validate()
+        distance_sq: float = distance**2
+        min_x, min_y = _cell_of((position[0] - distance, position[1] - distance))
+        max_x, max_y = _cell_of((position[0] + distance, position[1] + distance))
+        types: Iterable[UnitTypeId] = (
+            list(self._cells.keys()) if structure_types is None else structure_types
+        )
+
+        tags: list[int] = []
+        for structure_type in types:
+            if structure_type not in self._cells:
+                continue
+            cells: dict[tuple[int, int], dict[int, Point2]] = self._cells[
+                structure_type
+            ]
+            for x in range(min_x, max_x + 1):
+                for y in range(min_y, max_y + 1):
+                    if (x, y) not in cells:
+                        continue
+                    tags.extend(
+                        tag
+                        for tag, structure_position in cells[(x, y)].items()
+                        if cy_distance_to_squared(structure_position, position)
+                        < distance_sq
+                    )
+        return tags
+
+    def _remove(self, tag: int) -> None:
+        if (key := self._tag_to_key.pop(tag, None)) is None:
+            return
+        structure_type, cell = key
+        cells: dict[tuple[int, int], dict[int, Point2]] = self._cells[structure_type]
+        cells[cell].pop(tag, None)
+        if not cells[cell]:
+            del cells[cell]
+
+    def _validate(self) -> None:
+        game_loop: int = self.ai.state.game_loop
+        if game_loop == self._game_loop:
+            return
+        self._game_loop = game_loop
+        # compared by tag, a missed addition and a missed removal in the
+        # same frame would leave the count unchanged
+        if self._tag_to_key.keys() == {
+            s.tag for s in self.ai.structures if not s.is_flying
+        }:
+            return
+
+        self.rebuilds += 1
+        self._cells.clear()
+        self._tag_to_key.clear()
+        for structure in self.ai.structures:
+            self.on_structure_added(structure)
+
+
+def _cell_of(position: tuple[float, float]) -> tuple[int, int]:
+    return floor(position[0] / CELL_SIZE), floor(position[1] / CELL_SIZE)
@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+
+import numpy as np
+from sc2.position import Point2
+from sc2.unit import Unit
+from sc2.units import Units
+from scipy.spatial import KDTree
+
+
+@dataclass(frozen=True)
+class WorkerRequest:
+    """Ask for `num_workers` gathering workers close to `target_position`.
+
+    Parameters
+    ----------
+    target_position : Point2
+        Where the workers are needed.
+    num_workers : int
+        How many workers this request wants.
+    min_health_perc : float
+        Workers below this health percentage are never selected.
+    force_close : bool
+        If False, workers carrying resources are only used once every
+        other suitable worker has been taken, mirroring `select_worker`.
+    """
+
+    target_position: Point2
+    num_workers: int = 1
+    min_health_perc: float = 0.0
+    force_close: bool = False
+
+
+def select_workers(workers: Units, requests: list[WorkerRequest]) -> list[list[Unit]]:
+    """Solve several worker requests together.
+
+    One KD-tree is built over the candidate workers and queried for all
+    request positions at once. Candidate (worker, request) pairs are then
+    handed out greedily from shortest to longest distance, so no worker is
+    given to two requests and each request gets at most `num_workers`. The
+    query starts with as many neighbours as there are workers wanted and is
+    widened while a request is short, or had to take a worker carrying
+    resources, and more candidates are left.
+
+    Parameters
+    ----------
+    workers : Units
+        Workers that may be selected, usually those with the
+        `UnitRole.GATHERING` role.
+    requests : list[WorkerRequest]
+        The requests to solve, results are returned in the same order.
+
+    Returns
+    -------
+    list[list[Unit]] :
+        Selected workers per request, may be shorter than asked for when
+        there are too few healthy candidates.
+    """
+    selected: list[list[Unit]] = [[] for _ in requests]
+    total_required: int = sum(request.num_workers for request in requests)
+    if not workers or total_required <= 0:
+        return selected
+
+    # no request can use a worker below the lowest health any request accepts
+    min_health_perc: float = min(
+        request.min_health_perc for request in requests if request.num_workers > 0
+    )
+    candidates: list[Unit] = [
+        w
+        for w in workers
+        if not w.is_constructing_scv and w.health_percentage >= min_health_perc
+    ]
+    if not candidates:
+        return selected
+
+    tree: KDTree = KDTree(np.array([w.position_tuple for w in candidates]))
+    positions: np.ndarray = np.array([request.target_position for request in requests])
+    # start with as many neighbours as are needed in total and widen the
+    # search until no request could do better further away
+    k: int = min(total_required, len(candidates))
+    while True:
+        distances, indices = tree.query(positions, k=k)
+        selected = _assign(
+            candidates,
+            requests,
+            distances.reshape(len(requests), k),
+            indices.reshape(len(requests), k),
+        )
+        if k == len(candidates) or all(
+            len(chosen) == request.num_workers
+            and (request.force_close or not any(w.is_carrying_resource for w in chosen))
+            for request, chosen in zip(requests, selected)
+            if request.num_workers > 0
+        ):
+            return selected
+        k = min(2 * k, len(candidates))
+
+
+def _assign(
+    candidates: list[Unit],
+    requests: list[WorkerRequest],
+    distances: np.ndarray,
+    indices: np.ndarray,
+) -> list[list[Unit]]:
+    """Hand out the queried neighbours greedily, closest pairs first."""
+    selected: list[list[Unit]] = [[] for _ in requests]
+    # one entry per (request, nearby worker), carrying workers sort last
+    # for requests that don't need the closest worker at any cost
+    pairs: list[tuple[bool, float, int, int]] = []
+    for request_index, request in enumerate(requests):
+        if request.num_workers <= 0:
+            continue
+        for distance, worker_index in zip(
+            distances[request_index], indices[request_index]
+        ):
+            worker: Unit = candidates[worker_index]
+            if worker.health_percentage < request.min_health_perc:
+                continue
+            deprioritise: bool = not request.force_close and worker.is_carrying_resource
+            pairs.append((deprioritise, distance, request_index, worker_index))
+    pairs.sort()
+
+    used_workers: set[int] = set()
+    for _, _, request_index, worker_index in pairs:
+        if worker_index in used_workers:
+            continue
+        if len(selected[request_index]) >= requests[request_index].num_workers:
+            continue
+        used_workers.add(worker_index)
+        selected[request_index].append(candidates[worker_index])
+
+    return selected
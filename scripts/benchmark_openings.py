@@ -0,0 +1,164 @@
+"""
+Benchmark openings and combat classes without a StarCraft II client.
+
+A synthetic game state from `scripts/headless/scenarios.py` is driven frame by
+frame through `FakeBot`, timing every call to the opening's `on_step` (or a
+single combat class's `execute`).
+
+Examples:
+    python scripts/benchmark_openings.py --list
+    python scripts/benchmark_openings.py --target MassMine --scenario mass_mine_late
+    python scripts/benchmark_openings.py --target GroundRangeCombat --frames 500
+"""
+import argparse
+import asyncio
+import importlib
+import sys
+from os import path
+from time import perf_counter
+from typing import Callable
+
+ROOT: str = path.abspath(path.join(path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(path.join(ROOT, "ares-sc2/src/ares"))
+sys.path.append(path.join(ROOT, "ares-sc2/src"))
+sys.path.append(path.join(ROOT, "ares-sc2"))
+
+import numpy as np
+from ares.consts import UnitRole, UnitTreeQueryType
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+from sc2.units import Units
+
+from bot.consts import BIO_FORCES
+from bot.openings.opening_registry import _to_snake
+from scripts.headless.fake_bot import FakeBot
+from scripts.headless.scenarios import SCENARIOS, Scenario
+
+
+def _near(bot: FakeBot, units: Units, distance: float, tree) -> Units:
+    center: Point2 = Point2(np.mean([u.position_tuple for u in units], axis=0))
+    return bot.mediator.get_units_in_range(
+        start_points=[center], distances=distance, query_tree=tree
+    )[0]
+
+
+# combat class -> (role and types of the units it controls, kwargs builder)
+COMBAT_TARGETS: dict[
+    str, tuple[UnitRole, set[UnitTypeId] | None, Callable[[FakeBot, Units], dict]]
+] = {
+    "GroundRangeCombat": (
+        UnitRole.ATTACKING,
+        BIO_FORCES,
+        lambda bot, units: {
+            "everything_near_squad": _near(
+                bot, units, 12.0, UnitTreeQueryType.AllEnemy
+            ),
+            "target": Point2(bot.scenario.advance_to),
+            "can_engage": True,
+            "squad_position": Point2(np.mean([u.position_tuple for u in units], 0)),
+        },
+    ),
+    "MineCombat": (
+        UnitRole.ATTACKING,
+        {UnitTypeId.WIDOWMINE},
+        lambda bot, units: {"target": Point2(bot.scenario.advance_to)},
+    ),
+    "BattleCruiserCombat": (
+        UnitRole.ATTACKING,
+        {UnitTypeId.BATTLECRUISER},
+        lambda bot, units: {"target": Point2(bot.scenario.advance_to)},
+    ),
+    "ReaperHarass": (
+        UnitRole.HARASSING_REAPER,
+        None,
+        lambda bot, units: {
+            "everything_near_reapers": _near(
+                bot, units, 12.0, UnitTreeQueryType.EnemyGround
+            ),
+            "harass_target": bot.enemy_start_locations[0],
+            "heal_threshold": 0.6,
+        },
+    ),
+    "WorkerCombat": (
+        UnitRole.CONTROL_GROUP_EIGHT,
+        None,
+        lambda bot, units: {
+            "all_close_enemy": _near(bot, units, 12.5, UnitTreeQueryType.EnemyGround),
+            "target": bot.enemy_start_locations[0],
+        },
+    ),
+}
+
+
+def _load_class(target: str):
+    package: str = "combat" if target in COMBAT_TARGETS else "openings"
+    module = importlib.import_module(f"bot.{package}.{_to_snake(target)}")
+    return getattr(module, target)
+
+
+async def run_benchmark(target: str, scenario: Scenario, frames: int) -> np.ndarray:
+    bot: FakeBot = FakeBot(scenario, chosen_opening=target)
+    cls = _load_class(target)
+    timings: list[float] = []
+
+    if target in COMBAT_TARGETS:
+        role, unit_types, build_kwargs = COMBAT_TARGETS[target]
+        combat = cls(bot, bot.config, bot.mediator)
+        for _ in range(frames):
+            bot.advance()
+            units: Units = bot.mediator.get_units_from_role(
+                role=role, unit_type=unit_types
+            )
+            if not units:
+                continue
+            kwargs: dict = build_kwargs(bot, units)
+            start: float = perf_counter()
+            combat.execute(units, **kwargs)
+            timings.append(perf_counter() - start)
+    else:
+        opening = cls()
+        await opening.on_start(bot)
+        for _ in range(frames):
+            bot.advance()
+            start: float = perf_counter()
+            await opening.on_step()
+            timings.append(perf_counter() - start)
+
+    print(
+        f"{target} on '{scenario.name}': {bot.behaviors_registered} behaviors, "
+        f"{bot.commands_issued} commands over {frames} frames"
+    )
+    return np.array(timings) * 1000.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="MassMine", help="Opening or combat class")
+    parser.add_argument("--scenario", default="bio_vs_200", choices=SCENARIOS)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--list", action="store_true", help="List scenarios")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<20}{scenario.description}")
+        return
+
+    timings: np.ndarray = asyncio.run(
+        run_benchmark(args.target, SCENARIOS[args.scenario], args.frames)
+    )
+    if len(timings) == 0:
+        print("Nothing was executed, does the scenario have units for this target?")
+        return
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    print(f"{'frames':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    print(
+        f"{len(timings):>8}{timings.mean():>9.3f}{p50:>9.3f}{p95:>9.3f}"
+        f"{p99:>9.3f}{timings.max():>9.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,729 @@
+"""
+A stand-in for `AresBot` that needs no StarCraft II client.
+
+`FakeBot` builds synthetic units from a `Scenario`, answers the mediator calls
+our openings and combat classes make, and records (but never executes) the
+behaviors and unit commands they issue. This lets the bot's own decision
+logic be benchmarked frame by frame on a machine without the game installed.
+
+Costs that live inside ares or the game itself (behavior execution, pathing,
+fight simulation, protobuf traffic) are not modeled; mediator answers are
+cheap approximations that keep the bot code on its normal paths.
+"""
+import random
+from collections import defaultdict
+from itertools import count
+from types import SimpleNamespace
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+from ares.consts import EngagementResult, UnitRole, UnitTreeQueryType
+from sc2.data import Race
+from sc2.ids.ability_id import AbilityId
+from sc2.ids.unit_typeid import UnitTypeId
+from sc2.position import Point2
+from sc2.units import Units
+
+from bot.combat.distance_matrix import DistanceMatrix
+from bot.combat.enemy_snapshot import EnemySnapshot
+from bot.combat.mine_cooldowns import MineCooldowns
+from bot.utils.flow_field import FlowFieldService
+from bot.utils.grid_versions import GridVersionTracker
+from bot.utils.map_cache import MapCache
+from bot.utils.path_cache import PathCache
+from bot.utils.safe_spots import SafeSpotCache
+from bot.utils.scheduler import Scheduler
+from bot.utils.step_profiler import StepProfiler
+from bot.utils.structure_index import StructureIndex
+from bot.utils.worker_selector import WorkerRequest, select_workers
+from scripts.headless.scenarios import (
+    ENEMY_START,
+    MAP_CENTER,
+    MAP_SIZE,
+    OWN_START,
+    UNIT_STATS,
+    Scenario,
+    UnitGroup,
+)
+
+GAME_STEP: int = 2
+STEP_SIZE: float = 0.35
+
+UNIT_ABILITIES: dict[UnitTypeId, set[AbilityId]] = {
+    UnitTypeId.WIDOWMINE: {AbilityId.WIDOWMINEATTACK_WIDOWMINEATTACK},
+    UnitTypeId.BATTLECRUISER: {AbilityId.EFFECT_TACTICALJUMP},
+    UnitTypeId.REAPER: {AbilityId.KD8CHARGE_KD8CHARGE},
+}
+
+
+class FakeUnit:
+    """Just enough of `sc2.unit.Unit` for the bot's combat and opening code."""
+
+    def __init__(
+        self,
+        bot: "FakeBot",
+        tag: int,
+        type_id: UnitTypeId,
+        position: tuple[float, float],
+        is_mine: bool,
+    ):
+        stats = UNIT_STATS[type_id]
+        self._bot_object: "FakeBot" = bot
+        self._proto = SimpleNamespace(
+            pos=SimpleNamespace(x=position[0], y=position[1], z=0.0)
+        )
+        self.tag: int = tag
+        self.type_id: UnitTypeId = type_id
+        self.is_mine: bool = is_mine
+        self.is_enemy: bool = not is_mine
+        self.health: float = stats.health
+        self.health_max: float = stats.health
+        self.shield: float = 0.0
+        self.radius: float = stats.radius
+        self.ground_range: float = stats.ground_range
+        self.air_range: float = stats.air_range
+        self.can_attack_air: bool = stats.air_range > 0.0
+        self.is_flying: bool = stats.is_flying
+        self.is_structure: bool = stats.is_structure
+        self.supply: float = stats.supply
+        self.abilities: set[AbilityId] = set(UNIT_ABILITIES.get(type_id, set()))
+        self.orders: list = []
+        self.passengers_tags: set[int] = set()
+        self.energy: float = 0.0
+        self.mineral_contents: int = 1800
+        self.build_progress: float = 1.0
+
+        self.is_ready: bool = True
+        self.is_active: bool = False
+        self.is_idle: bool = True
+        self.is_moving: bool = False
+        self.is_attacking: bool = False
+        self.is_repairing: bool = False
+        self.is_constructing_scv: bool = False
+        self.is_carrying_resource: bool = False
+        self.is_carrying_minerals: bool = False
+        self.is_burrowed: bool = False
+        self.is_cloaked: bool = False
+        self.is_revealed: bool = False
+        self.is_visible: bool = True
+        self.is_memory: bool = False
+        self.is_snapshot: bool = False
+        self.is_hallucination: bool = False
+
+    @property
+    def position(self) -> Point2:
+        return Point2((self._proto.pos.x, self._proto.pos.y))
+
+    @property
+    def position_tuple(self) -> tuple[float, float]:
+        return self._proto.pos.x, self._proto.pos.y
+
+    @property
+    def health_percentage(self) -> float:
+        return self.health / self.health_max
+
+    @property
+    def has_cargo(self) -> bool:
+        return bool(self.passengers_tags)
+
+    def distance_to(self, target: Union["FakeUnit", Point2]) -> float:
+        position = target.position if isinstance(target, FakeUnit) else target
+        return self.position.distance_to(position)
+
+    def is_using_ability(self, abilities) -> bool:
+        return False
+
+    def move_towards(self, target: tuple[float, float], distance: float) -> None:
+        pos = self._proto.pos
+        dx, dy = target[0] - pos.x, target[1] - pos.y
+        length: float = (dx * dx + dy * dy) ** 0.5
+        if length <= distance:
+            return
+        pos.x += dx / length * distance
+        pos.y += dy / length * distance
+
+    # unit commands are only counted, nothing is sent anywhere
+    def __call__(self, ability, target=None, queue: bool = False) -> bool:
+        self._bot_object.commands_issued += 1
+        return True
+
+    def move(self, target, queue: bool = False) -> bool:
+        return self(AbilityId.MOVE_MOVE, target, queue)
+
+    def attack(self, target, queue: bool = False) -> bool:
+        return self(AbilityId.ATTACK, target, queue)
+
+    def gather(self, target, queue: bool = False) -> bool:
+        return self(AbilityId.HARVEST_GATHER, target, queue)
+
+    def return_resource(self, queue: bool = False) -> bool:
+        return self(AbilityId.HARVEST_RETURN, None, queue)
+
+    def build(self, unit_type, position=None, queue: bool = False) -> bool:
+        return self(AbilityId.SMART, position, queue)
+
+    def __hash__(self) -> int:
+        return self.tag
+
+    def __eq__(self, other) -> bool:
+        return getattr(other, "tag", None) == self.tag
+
+    def __repr__(self) -> str:
+        return f"FakeUnit({self.type_id.name}, tag={self.tag})"
+
+
+class FakeSquad:
+    def __init__(self, squad_id: str, units: list[FakeUnit], main_squad: bool):
+        self.squad_id: str = squad_id
+        self.squad_units: list[FakeUnit] = units
+        self.squad_position: Point2 = Point2(
+            np.mean([u.position_tuple for u in units], axis=0)
+        )
+        self.main_squad: bool = main_squad
+
+
+class FakeClient:
+    """Swallows every request; async methods so callers can `await` them."""
+
+    def __getattr__(self, name: str):
+        async def _noop(*args, **kwargs) -> None:
+            return None
+
+        return _noop
+
+
+class FakeMediator:
+    def __init__(self, bot: "FakeBot"):
+        self.bot: "FakeBot" = bot
+        self.unit_roles: dict[int, UnitRole] = dict()
+        self.unit_to_ability_dict: dict[int, dict[AbilityId, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+        width, height = MAP_SIZE
+        grid: np.ndarray = np.ones((width, height), dtype=np.float32)
+        grid[:2, :] = grid[-2:, :] = grid[:, :2] = grid[:, -2:] = np.inf
+        self._ground_grid: np.ndarray = grid
+        self._air_grid: np.ndarray = np.ones((width, height), dtype=np.float32)
+
+    # grids
+    @property
+    def get_ground_grid(self) -> np.ndarray:
+        return self._ground_grid.copy()
+
+    @property
+    def get_ground_avoidance_grid(self) -> np.ndarray:
+        return self._ground_grid.copy()
+
+    @property
+    def get_climber_grid(self) -> np.ndarray:
+        return self._ground_grid.copy()
+
+    @property
+    def get_air_grid(self) -> np.ndarray:
+        return self._air_grid.copy()
+
+    @property
+    def get_air_avoidance_grid(self) -> np.ndarray:
+        return self._air_grid.copy()
+
+    def is_position_safe(self, grid: np.ndarray, position, **kwargs) -> bool:
+        return grid[int(position[0]), int(position[1])] == 1.0
+
+    def find_closest_safe_spot(self, from_pos, grid: np.ndarray, **kwargs) -> Point2:
+        return Point2(from_pos)
+
+    def find_raw_path(self, start, target, grid, sensitivity: int = 1, **kwargs):
+        num_points: int = max(2, int(Point2(start).distance_to(Point2(target))))
+        xs = np.linspace(start[0], target[0], num_points)
+        ys = np.linspace(start[1], target[1], num_points)
+        return [Point2((x, y)) for x, y in zip(xs, ys)][::sensitivity]
+
+    # unit queries
+    def get_units_in_range(
+        self,
+        start_points: Iterable,
+        distances: Union[float, list[float]],
+        query_tree: UnitTreeQueryType,
+        return_as_dict: bool = False,
+    ) -> Union[list[Units], dict[int, Units]]:
+        start_points = list(start_points)
+        if not isinstance(distances, (list, tuple)):
+            distances = [distances] * len(start_points)
+
+        candidates: list[FakeUnit] = self.bot.units_for_tree(query_tree)
+        positions: np.ndarray = np.array(
+            [u.position_tuple for u in candidates], dtype=float
+        ).reshape(-1, 2)
+        results: list[Units] = []
+        for point, distance in zip(start_points, distances):
+            pos = point.position_tuple if isinstance(point, FakeUnit) else point
+            if len(candidates) == 0:
+                results.append(Units([], self.bot))
+                continue
+            d_sq: np.ndarray = np.sum((positions - np.array(pos)) ** 2, axis=1)
+            results.append(
+                Units(
+                    [candidates[i] for i in np.flatnonzero(d_sq < distance**2)],
+                    self.bot,
+                )
+            )
+
+        if return_as_dict:
+            return {point.tag: units for point, units in zip(start_points, results)}
+        return results
+
+    def get_units_from_role(
+        self, role: UnitRole, unit_type: Optional[Any] = None
+    ) -> Units:
+        units: list[FakeUnit] = [
+            u for u in self.bot.own_units if self.unit_roles.get(u.tag) == role
+        ]
+        if unit_type is not None:
+            types = unit_type if isinstance(unit_type, set) else {unit_type}
+            units = [u for u in units if u.type_id in types]
+        return Units(units, self.bot)
+
+    def get_units_from_roles(self, roles: set[UnitRole], **kwargs) -> Units:
+        return Units(
+            [u for u in self.bot.own_units if self.unit_roles.get(u.tag) in roles],
+            self.bot,
+        )
+
+    @property
+    def get_unit_role_dict(self) -> dict[UnitRole, set[int]]:
+        role_dict: dict[UnitRole, set[int]] = defaultdict(set)
+        for tag, role in self.unit_roles.items():
+            role_dict[role].add(tag)
+        return role_dict
+
+    def assign_role(self, tag: int, role: UnitRole, **kwargs) -> None:
+        self.unit_roles[tag] = role
+
+    def batch_assign_role(self, tags: Iterable[int], role: UnitRole) -> None:
+        for tag in tags:
+            self.unit_roles[tag] = role
+
+    def switch_roles(self, from_role: UnitRole, to_role: UnitRole) -> None:
+        for tag, role in self.unit_roles.items():
+            if role == from_role:
+                self.unit_roles[tag] = to_role
+
+    def select_worker(
+        self, target_position: Point2, min_health_perc: float = 0.0, **kwargs
+    ) -> Optional[FakeUnit]:
+        workers: list[FakeUnit] = [
+            w
+            for w in self.get_units_from_role(UnitRole.GATHERING)
+            if w.health_percentage >= min_health_perc
+        ]
+        if not workers:
+            return None
+        return min(workers, key=lambda w: w.distance_to(target_position))
+
+    def remove_worker_from_mineral(self, worker_tag: int) -> None:
+        pass
+
+    def get_squads(self, role: UnitRole, squad_radius: float) -> list[FakeSquad]:
+        """Greedy radius clustering, the first (largest) cluster is the main squad."""
+        remaining: list[FakeUnit] = list(self.get_units_from_role(role))
+        clusters: list[list[FakeUnit]] = []
+        while remaining:
+            seed: FakeUnit = remaining.pop(0)
+            cluster: list[FakeUnit] = [seed]
+            rest: list[FakeUnit] = []
+            for unit in remaining:
+                if unit.distance_to(seed) < squad_radius * 2:
+                    cluster.append(unit)
+                else:
+                    rest.append(unit)
+            remaining = rest
+            clusters.append(cluster)
+        clusters.sort(key=len, reverse=True)
+        return [
+            FakeSquad(f"{role.name}_{i}", cluster, i == 0)
+            for i, cluster in enumerate(clusters)
+        ]
+
+    def get_position_of_main_squad(self, role: UnitRole) -> Point2:
+        if squads := self.get_squads(role=role, squad_radius=7.5):
+            return squads[0].squad_position
+        return self.bot.start_location
+
+    def can_win_fight(self, own_units, enemy_units, **kwargs) -> EngagementResult:
+        own_supply: float = sum(u.supply for u in own_units)
+        enemy_supply: float = sum(u.supply for u in enemy_units)
+        if own_supply >= enemy_supply * 1.2:
+            return EngagementResult.VICTORY_DECISIVE
+        if own_supply >= enemy_supply:
+            return EngagementResult.VICTORY_CLOSE
+        return EngagementResult.LOSS_CLOSE
+
+    @property
+    def get_own_structures_dict(self) -> dict[UnitTypeId, list[FakeUnit]]:
+        structures: dict[UnitTypeId, list[FakeUnit]] = defaultdict(list)
+        for s in self.bot.structures:
+            structures[s.type_id].append(s)
+        return structures
+
+    @property
+    def get_own_army_dict(self) -> dict[UnitTypeId, Units]:
+        army: dict[UnitTypeId, list[FakeUnit]] = defaultdict(list)
+        for u in self.bot.units:
+            army[u.type_id].append(u)
+        return defaultdict(
+            lambda: Units([], self.bot),
+            {k: Units(v, self.bot) for k, v in army.items()},
+        )
+
+    @property
+    def get_unit_to_ability_dict(self) -> dict[int, dict[AbilityId, int]]:
+        return self.unit_to_ability_dict
+
+    def update_unit_to_ability_dict(self, ability: AbilityId, unit_tag: int) -> None:
+        # widow mine attack cooldown is 29 seconds
+        self.unit_to_ability_dict[unit_tag][ability] = self.bot.state.game_loop + int(
+            29 * 22.4
+        )
+
+    def get_is_detected(self, unit, **kwargs) -> bool:
+        return False
+
+    @property
+    def get_cached_enemy_army(self) -> Units:
+        return self.bot.enemy_units
+
+    @property
+    def get_all_enemy(self) -> Units:
+        return self.bot.all_enemy_units
+
+    @property
+    def get_enemy_ground(self) -> Units:
+        return self.bot.enemy_units.filter(lambda u: not u.is_flying)
+
+    @property
+    def get_main_ground_threats_near_townhall(self) -> Units:
+        return Units([], self.bot)
+
+    @property
+    def get_own_nat(self) -> Point2:
+        return self.bot.expansion_locations_list[1]
+
+    @property
+    def get_enemy_nat(self) -> Point2:
+        return self.bot.expansion_locations_list[-2]
+
+    @property
+    def get_enemy_ramp(self) -> SimpleNamespace:
+        return self.bot.main_base_ramp
+
+    @property
+    def get_primary_nydus_enemy_main(self) -> Point2:
+        return Point2(ENEMY_START).towards(Point2(MAP_CENTER), 8.0)
+
+    @property
+    def get_enemy_expansions(self) -> list[tuple[Point2, float]]:
+        enemy_start: Point2 = Point2(ENEMY_START)
+        return sorted(
+            (
+                (el, el.distance_to(enemy_start))
+                for el in self.bot.expansion_locations_list
+            ),
+            key=lambda item: item[1],
+        )
+
+    @property
+    def get_building_tracker_dict(self) -> dict:
+        return dict()
+
+    @property
+    def get_map_data_object(self) -> None:
+        return None
+
+    get_enemy_worker_rushed: bool = False
+    get_enemy_ling_rushed: bool = False
+    get_enemy_roach_rushed: bool = False
+    get_did_enemy_rush: bool = False
+    get_enemy_expanded: bool = True
+
+    def cancel_structure(self, structure) -> None:
+        pass
+
+    def request_building_placement(self, base_location: Point2, **kwargs) -> Point2:
+        return base_location
+
+
+class FakeBot:
+    """Synthetic replacement for `AresBot` driven by a `Scenario`.
+
+    Call `advance` once per simulated step to move the clock forward and let
+    both armies drift towards each other.
+    """
+
+    def __init__(self, scenario: Scenario, chosen_opening: str):
+        self.scenario: Scenario = scenario
+        self._rng: random.Random = random.Random(scenario.seed)
+        self._tags = count(1)
+
+        self.config: dict = {"Debug": False}
+        self.client: FakeClient = FakeClient()
+        self.mediator: FakeMediator = FakeMediator(self)
+        self.step_profiler: StepProfiler = StepProfiler()
+        self.scheduler: Scheduler = Scheduler(self, game_step=GAME_STEP)
+        self.grid_versions: GridVersionTracker = GridVersionTracker(self)
+        self.flow_fields: FlowFieldService = FlowFieldService(self, self.grid_versions)
+        self.path_cache: PathCache = PathCache(self, self.grid_versions)
+        self.safe_spots: SafeSpotCache = SafeSpotCache(self, self.grid_versions)
+        self.structure_index: StructureIndex = StructureIndex(self)
+        self.enemy_snapshot: EnemySnapshot = EnemySnapshot(self)
+        self.distance_matrix: DistanceMatrix = DistanceMatrix(self)
+        self.mine_cooldowns: MineCooldowns = MineCooldowns(self)
+        self.build_order_runner = SimpleNamespace(
+            chosen_opening=chosen_opening,
+            build_completed=True,
+            set_build_completed=lambda: None,
+        )
+        self.state = SimpleNamespace(
+            game_loop=0,
+            upgrades=set(scenario.upgrades),
+            visibility=np.full(MAP_SIZE, 2, dtype=np.uint8),
+            dead_units=set(),
+        )
+        self.enemy_race: Race = Race[scenario.enemy_race]
+        self.start_location: Point2 = Point2(OWN_START)
+        self.enemy_start_locations: list[Point2] = [Point2(ENEMY_START)]
+        self.expansion_locations_list: list[Point2] = [
+            Point2(p)
+            for p in [
+                OWN_START,
+                (30.5, 60.5),
+                (60.5, 30.5),
+                (45.5, 100.5),
+                (100.5, 45.5),
+                (80.5, 80.5),
+                (115.5, 60.5),
+                (60.5, 115.5),
+                (129.5, 99.5),
+                ENEMY_START,
+            ]
+        ]
+        self.game_info = SimpleNamespace(
+            map_center=Point2(MAP_CENTER),
+            map_name="HeadlessBenchmark",
+            player_start_location=Point2(OWN_START),
+        )
+        self.game_data = SimpleNamespace(
+            units=defaultdict(
+                lambda: SimpleNamespace(
+                    creation_ability=SimpleNamespace(
+                        id=AbilityId.NULL_NULL, exact_id=AbilityId.NULL_NULL
+                    )
+                )
+            )
+        )
+        self.main_base_ramp = SimpleNamespace(
+            top_center=Point2((40.0, 40.0)), bottom_center=Point2((43.0, 43.0))
+        )
+        # in memory only, so benchmarks always measure a cold start
+        self.map_cache: MapCache = MapCache(self, directory=None)
+
+        self.minerals: int = 400
+        self.vespene: int = 200
+        self.supply_used: int = 100
+        self.supply_army: int = 60
+        self.supply_workers: int = 40
+        self.actual_iteration: int = 0
+
+        self.behaviors_registered: int = 0
+        self.commands_issued: int = 0
+
+        self.own_units: list[FakeUnit] = []
+        self.own_structures: list[FakeUnit] = []
+        self.enemy_unit_list: list[FakeUnit] = []
+        self.mineral_list: list[FakeUnit] = []
+        self._populate()
+
+    def _populate(self) -> None:
+        for group in self.scenario.own:
+            for unit in self._spawn(group, is_mine=True):
+                self.own_units.append(unit)
+                self.mediator.assign_role(tag=unit.tag, role=group.role)
+        for group in self.scenario.enemy:
+            self.enemy_unit_list.extend(self._spawn(group, is_mine=False))
+
+        cc: FakeUnit = FakeUnit(
+            self, next(self._tags), UnitTypeId.COMMANDCENTER, OWN_START, True
+        )
+        self.own_structures.append(cc)
+        for i in range(8):
+            mf: FakeUnit = FakeUnit(
+                self,
+                next(self._tags),
+                UnitTypeId.MINERALFIELD,
+                (OWN_START[0] - 7.0, OWN_START[1] - 4.0 + i),
+                False,
+            )
+            self.mineral_list.append(mf)
+        for i in range(12):
+            worker: FakeUnit = FakeUnit(
+                self,
+                next(self._tags),
+                UnitTypeId.SCV,
+                (OWN_START[0] - 4.0, OWN_START[1] - 4.0 + i * 0.7),
+                True,
+            )
+            self.own_units.append(worker)
+            self.mediator.assign_role(tag=worker.tag, role=UnitRole.GATHERING)
+
+        self.unit_tag_dict: dict[int, FakeUnit] = {
+            u.tag: u
+            for u in self.own_units + self.own_structures + self.enemy_unit_list
+        }
+
+    def _spawn(self, group: UnitGroup, is_mine: bool) -> list[FakeUnit]:
+        units: list[FakeUnit] = []
+        for _ in range(group.count):
+            position: tuple[float, float] = (
+                group.center[0] + self._rng.uniform(-group.spread, group.spread),
+                group.center[1] + self._rng.uniform(-group.spread, group.spread),
+            )
+            units.append(
+                FakeUnit(self, next(self._tags), group.type_id, position, is_mine)
+            )
+        return units
+
+    def advance(self) -> None:
+        """Move the clock by one step and nudge both armies towards each other."""
+        self.state.game_loop += GAME_STEP
+        self.actual_iteration += 1
+        target: tuple[float, float] = self.scenario.advance_to
+        for unit in self.own_units:
+            if unit.type_id != UnitTypeId.SCV or unit.tag not in self._gatherer_tags:
+                unit.move_towards(target, STEP_SIZE)
+        own_center: tuple[float, float] = tuple(
+            np.mean([u.position_tuple for u in self.own_units], axis=0)
+        )
+        for unit in self.enemy_unit_list:
+            unit.move_towards(own_center, self._rng.uniform(0.0, STEP_SIZE))
+
+    @property
+    def _gatherer_tags(self) -> set[int]:
+        return self.mediator.get_unit_role_dict[UnitRole.GATHERING]
+
+    # `BotAI` style collections
+    def units_for_tree(self, query_tree: UnitTreeQueryType) -> list[FakeUnit]:
+        if query_tree == UnitTreeQueryType.EnemyGround:
+            return [u for u in self.enemy_unit_list if not u.is_flying]
+        if query_tree == UnitTreeQueryType.EnemyFlying:
+            return [u for u in self.enemy_unit_list if u.is_flying]
+        if query_tree == UnitTreeQueryType.AllOwn:
+            return self.own_units + self.own_structures
+        return self.enemy_unit_list
+
+    @property
+    def time(self) -> float:
+        # start late enough that early game timing gates are open
+        return 360.0 + self.state.game_loop / 22.4
+
+    @property
+    def time_formatted(self) -> str:
+        return f"{int(self.time // 60):02}:{int(self.time % 60):02}"
+
+    @property
+    def units(self) -> Units:
+        return Units(self.own_units, self)
+
+    @property
+    def workers(self) -> Units:
+        return Units([u for u in self.own_units if u.type_id == UnitTypeId.SCV], self)
+
+    @property
+    def structures(self) -> Units:
+        return Units(self.own_structures, self)
+
+    @property
+    def townhalls(self) -> Units:
+        return Units(
+            [s for s in self.own_structures if s.type_id == UnitTypeId.COMMANDCENTER],
+            self,
+        )
+
+    @property
+    def gas_buildings(self) -> Units:
+        return Units([], self)
+
+    @property
+    def all_own_units(self) -> Units:
+        return Units(self.own_units + self.own_structures, self)
+
+    @property
+    def enemy_units(self) -> Units:
+        return Units(self.enemy_unit_list, self)
+
+    @property
+    def enemy_structures(self) -> Units:
+        return Units([], self)
+
+    @property
+    def all_enemy_units(self) -> Units:
+        return Units(self.enemy_unit_list, self)
+
+    @property
+    def all_units(self) -> Units:
+        return Units(self.own_units + self.own_structures + self.enemy_unit_list, self)
+
+    @property
+    def mineral_field(self) -> Units:
+        return Units(self.mineral_list, self)
+
+    def _distance_units_to_pos(self, units: Units, pos) -> Iterable[float]:
+        return (u.position.distance_to(Point2(pos)) for u in units)
+
+    def _distance_squared_unit_to_unit(self, unit1, unit2) -> float:
+        return unit1.position.distance_to(unit2.position) ** 2
+
+    # `MyBot` helpers
+    def select_workers(self, requests: list[WorkerRequest]) -> list[list[FakeUnit]]:
+        return select_workers(
+            self.mediator.get_units_from_role(
+                role=UnitRole.GATHERING, unit_type=UnitTypeId.SCV
+            ),
+            requests,
+        )
+
+    # `BotAI` helpers
+    def register_behavior(self, behavior) -> None:
+        self.behaviors_registered += 1
+
+    def can_afford(self, item_id, **kwargs) -> bool:
+        return self.minerals >= 150
+
+    def structure_pending(self, structure_type) -> int:
+        return 0
+
+    def structure_present_or_pending(self, structure_type) -> bool:
+        return any(s.type_id == structure_type for s in self.own_structures)
+
+    def tech_requirement_progress(self, structure_type) -> float:
+        return 1.0
+
+    def get_total_supply(self, units) -> float:
+        return sum(u.supply for u in units)
+
+    def is_visible(self, pos) -> bool:
+        return True
+
+    def in_pathing_grid(self, pos) -> bool:
+        return True
+
+    def get_enemy_proxies(self, distance: float, from_position: Point2) -> list:
+        return []
+
+    def main_ramp_walled_off(self, ramp) -> bool:
+        return False
+
+    async def find_placement(self, building, near: Point2, **kwargs) -> Point2:
+        return near
+
+    async def chat_send(self, message: str, team_only: bool = False) -> None:
+        pass
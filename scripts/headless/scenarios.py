@@ -0,0 +1,160 @@
+"""
+Synthetic game states for the headless benchmark.
+
+Each scenario describes where our units and the enemy's units start and which
+role our units are assigned to. Positions are generated from a seeded RNG so
+repeated runs see identical input.
+"""
+from dataclasses import dataclass, field
+
+from ares.consts import UnitRole
+from sc2.ids.unit_typeid import UnitTypeId
+
+MAP_SIZE: tuple[int, int] = (160, 160)
+OWN_START: tuple[float, float] = (30.5, 30.5)
+ENEMY_START: tuple[float, float] = (129.5, 129.5)
+MAP_CENTER: tuple[float, float] = (80.0, 80.0)
+
+
+@dataclass(frozen=True)
+class UnitStats:
+    health: float
+    radius: float
+    ground_range: float
+    air_range: float = 0.0
+    is_flying: bool = False
+    is_structure: bool = False
+    supply: float = 1.0
+
+
+UNIT_STATS: dict[UnitTypeId, UnitStats] = {
+    UnitTypeId.SCV: UnitStats(45.0, 0.375, 0.1),
+    UnitTypeId.PROBE: UnitStats(40.0, 0.375, 0.1),
+    UnitTypeId.DRONE: UnitStats(40.0, 0.375, 0.1),
+    UnitTypeId.MARINE: UnitStats(55.0, 0.375, 5.0, air_range=5.0),
+    UnitTypeId.MARAUDER: UnitStats(125.0, 0.5625, 6.0, supply=2.0),
+    UnitTypeId.MEDIVAC: UnitStats(150.0, 0.75, 0.0, is_flying=True, supply=2.0),
+    UnitTypeId.REAPER: UnitStats(60.0, 0.375, 5.0),
+    UnitTypeId.WIDOWMINE: UnitStats(90.0, 0.5, 5.0, air_range=5.0, supply=2.0),
+    UnitTypeId.THOR: UnitStats(400.0, 1.25, 7.0, air_range=10.0, supply=6.0),
+    UnitTypeId.BATTLECRUISER: UnitStats(
+        550.0, 1.25, 6.0, air_range=6.0, is_flying=True, supply=6.0
+    ),
+    UnitTypeId.ZERGLING: UnitStats(35.0, 0.375, 0.1, supply=0.5),
+    UnitTypeId.ROACH: UnitStats(145.0, 0.625, 4.0, supply=2.0),
+    UnitTypeId.HYDRALISK: UnitStats(90.0, 0.625, 5.0, air_range=5.0, supply=2.0),
+    UnitTypeId.QUEEN: UnitStats(175.0, 0.875, 5.0, air_range=7.0, supply=2.0),
+    UnitTypeId.MUTALISK: UnitStats(
+        120.0, 0.5, 3.0, air_range=3.0, is_flying=True, supply=2.0
+    ),
+    UnitTypeId.ZEALOT: UnitStats(150.0, 0.5, 0.1, supply=2.0),
+    UnitTypeId.STALKER: UnitStats(160.0, 0.625, 6.0, air_range=6.0, supply=2.0),
+    UnitTypeId.COMMANDCENTER: UnitStats(1500.0, 2.75, 0.0, is_structure=True),
+    UnitTypeId.HATCHERY: UnitStats(1500.0, 2.75, 0.0, is_structure=True),
+    UnitTypeId.SPINECRAWLER: UnitStats(300.0, 1.0, 7.0, is_structure=True),
+    UnitTypeId.MINERALFIELD: UnitStats(1.0, 1.125, 0.0, is_structure=True),
+}
+
+
+@dataclass(frozen=True)
+class UnitGroup:
+    """`count` units of `type_id` scattered uniformly within `spread` of `center`."""
+
+    type_id: UnitTypeId
+    count: int
+    center: tuple[float, float]
+    spread: float = 4.0
+    role: UnitRole = UnitRole.ATTACKING
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    own: list[UnitGroup]
+    enemy: list[UnitGroup]
+    enemy_race: str = "Zerg"
+    seed: int = 0
+    # our units take a step towards `advance_to` every frame
+    advance_to: tuple[float, float] = MAP_CENTER
+    upgrades: set = field(default_factory=set)
+
+
+_FIGHT: tuple[float, float] = (84.0, 84.0)
+_ENEMY_ARMY: tuple[float, float] = (94.0, 94.0)
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario(
+            name="bio_vs_200",
+            description="40 unit bio squad engaging 200 zerg units",
+            own=[
+                UnitGroup(UnitTypeId.MARINE, 30, _FIGHT),
+                UnitGroup(UnitTypeId.MARAUDER, 6, _FIGHT),
+                UnitGroup(UnitTypeId.MEDIVAC, 4, _FIGHT),
+            ],
+            enemy=[
+                UnitGroup(UnitTypeId.ZERGLING, 120, _ENEMY_ARMY, spread=8.0),
+                UnitGroup(UnitTypeId.ROACH, 50, _ENEMY_ARMY, spread=6.0),
+                UnitGroup(UnitTypeId.HYDRALISK, 26, _ENEMY_ARMY, spread=6.0),
+                UnitGroup(UnitTypeId.MUTALISK, 4, _ENEMY_ARMY, spread=6.0),
+            ],
+            advance_to=_ENEMY_ARMY,
+        ),
+        Scenario(
+            name="mass_mine_late",
+            description="30 widow mines, bio and medivacs versus a 150 unit army",
+            own=[
+                UnitGroup(UnitTypeId.WIDOWMINE, 30, _FIGHT, spread=8.0),
+                UnitGroup(UnitTypeId.MARINE, 24, _FIGHT),
+                UnitGroup(UnitTypeId.MARAUDER, 8, _FIGHT),
+                UnitGroup(
+                    UnitTypeId.MEDIVAC,
+                    4,
+                    OWN_START,
+                    role=UnitRole.CONTROL_GROUP_FIVE,
+                ),
+                UnitGroup(UnitTypeId.REAPER, 4, _FIGHT, role=UnitRole.HARASSING_REAPER),
+            ],
+            enemy=[
+                UnitGroup(UnitTypeId.ZERGLING, 80, _ENEMY_ARMY, spread=8.0),
+                UnitGroup(UnitTypeId.ROACH, 40, _ENEMY_ARMY, spread=6.0),
+                UnitGroup(UnitTypeId.QUEEN, 10, ENEMY_START, spread=6.0),
+                UnitGroup(UnitTypeId.DRONE, 20, ENEMY_START, spread=6.0),
+            ],
+            advance_to=_ENEMY_ARMY,
+        ),
+        Scenario(
+            name="thor_drop",
+            description="Thors, medivacs and marines pushing into 100 protoss units",
+            own=[
+                UnitGroup(UnitTypeId.THOR, 6, _FIGHT),
+                UnitGroup(UnitTypeId.MEDIVAC, 6, _FIGHT),
+                UnitGroup(UnitTypeId.MARINE, 24, _FIGHT),
+            ],
+            enemy=[
+                UnitGroup(UnitTypeId.ZEALOT, 50, _ENEMY_ARMY, spread=7.0),
+                UnitGroup(UnitTypeId.STALKER, 50, _ENEMY_ARMY, spread=7.0),
+            ],
+            enemy_race="Protoss",
+            advance_to=_ENEMY_ARMY,
+        ),
+        Scenario(
+            name="worker_rush",
+            description="12 SCVs attacking 16 probes in the enemy main",
+            own=[
+                UnitGroup(
+                    UnitTypeId.SCV,
+                    12,
+                    (120.0, 120.0),
+                    spread=2.0,
+                    role=UnitRole.CONTROL_GROUP_EIGHT,
+                ),
+            ],
+            enemy=[UnitGroup(UnitTypeId.PROBE, 16, ENEMY_START, spread=5.0)],
+            enemy_race="Protoss",
+            advance_to=ENEMY_START,
+        ),
+    ]
+}
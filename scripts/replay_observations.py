@@ -0,0 +1,141 @@
+"""
+Replay a game recorded with `RecordObservations: True` through `MyBot`.
+
+The recorded observations are fed into `MyBot` in order, exactly as
+`sc2.main` would during a real game, and the time spent in `on_step` is
+reported. No StarCraft II process is involved: commands and debug draws are
+dropped, and queries the bot makes to the game (placement, pathing etc.)
+get empty answers. Runs on the same recording are therefore only
+comparable with each other, not with the original game.
+
+Examples:
+    python scripts/replay_observations.py data/recordings/<recording>.sc2obs
+    python scripts/replay_observations.py <recording> --from-loop 20000
+"""
+import argparse
+import asyncio
+import random
+import sys
+from os import path
+from time import perf_counter
+
+ROOT: str = path.abspath(path.join(path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(path.join(ROOT, "ares-sc2/src/ares"))
+sys.path.append(path.join(ROOT, "ares-sc2/src"))
+sys.path.append(path.join(ROOT, "ares-sc2"))
+
+import numpy as np
+from loguru import logger
+from sc2.game_data import GameData
+from sc2.game_info import GameInfo
+from sc2.game_state import GameState
+
+from bot.main import MyBot
+from bot.utils.observation_recorder import RecordingStart, read_recording
+
+# debug draws are the only synchronous `Client` methods the bot calls
+SYNC_CLIENT_METHODS: set[str] = {
+    "debug_text_simple",
+    "debug_text_screen",
+    "debug_text_2d",
+    "debug_text_world",
+    "debug_text_3d",
+    "debug_line_out",
+    "debug_box_out",
+    "debug_box2_out",
+    "debug_sphere_out",
+}
+
+
+class ReplayClient:
+    """Stands in for `sc2.client.Client`, nothing is sent anywhere."""
+
+    def __init__(self, game_step: int):
+        self.game_step: int = game_step
+        self._game_result = None
+
+    def __getattr__(self, name: str):
+        if name in SYNC_CLIENT_METHODS:
+            return lambda *args, **kwargs: None
+
+        async def _empty(*args, **kwargs) -> list:
+            return []
+
+        return _empty
+
+
+async def replay(file_path: str, from_loop: int) -> np.ndarray:
+    # the bot makes some random choices, keep them identical between runs
+    random.seed(0)
+    np.random.seed(0)
+
+    start, steps = read_recording(file_path)
+    bot: MyBot = MyBot()
+    bot.config["RecordObservations"] = False
+    bot._initialize_variables()
+    bot._prepare_start(
+        ReplayClient(bot.config.get("GameStep", 2)),
+        start.meta["player_id"],
+        GameInfo(start.game_info),
+        GameData(start.game_data),
+        realtime=False,
+        base_build=start.meta["base_build"],
+    )
+
+    observation, proto_game_info = next(steps)
+    bot._prepare_step(GameState(observation), proto_game_info)
+    await bot.on_before_start()
+    bot._prepare_first_step()
+    await bot.on_start()
+    _check_opening(bot, start)
+
+    timings: list[float] = []
+    for iteration, (observation, proto_game_info) in enumerate(steps):
+        bot._prepare_step(GameState(observation), proto_game_info)
+        await bot.issue_events()
+        start_time: float = perf_counter()
+        await bot.on_step(iteration)
+        step_time: float = perf_counter() - start_time
+        await bot._after_step()
+        if observation.observation.game_loop >= from_loop:
+            timings.append(step_time)
+
+    return np.array(timings) * 1000.0
+
+
+def _check_opening(bot: MyBot, start: RecordingStart) -> None:
+    recorded: str = start.meta.get("chosen_opening", "")
+    if bot.build_order_runner.chosen_opening != recorded:
+        logger.warning(
+            f"Recorded game used {recorded}, replay chose "
+            f"{bot.build_order_runner.chosen_opening}, step times won't compare"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("recording", help="File written by ObservationRecorder")
+    parser.add_argument(
+        "--from-loop",
+        type=int,
+        default=0,
+        help="Only report steps from this game loop onwards",
+    )
+    args = parser.parse_args()
+
+    timings: np.ndarray = asyncio.run(replay(args.recording, args.from_loop))
+    if len(timings) == 0:
+        print("No steps were replayed")
+        return
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    print(f"{'steps':>8}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms)")
+    print(
+        f"{len(timings):>8}{timings.mean():>9.3f}{p50:>9.3f}{p95:>9.3f}"
+        f"{p99:>9.3f}{timings.max():>9.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()